@@ -1,3 +1,26 @@
-# ruff: noqa: F401
-from .core import DaterangeExpression, TimeIntervalParser
+"""
+Time interval parsing utilities for multiple languages.
+
+The parser implementations and their dependencies are imported on first use,
+to keep `import aika` fast.
+"""
+
+import typing as t
+
+from .buckets import BucketIndex
+from .columnar import IntervalArray
+from .intervalset import IntervalSet
 from .model import TimeInterval
+
+if t.TYPE_CHECKING:
+    from .core import DaterangeExpression, TimeIntervalParser
+
+__all__ = ["BucketIndex", "DaterangeExpression", "IntervalArray", "IntervalSet", "TimeInterval", "TimeIntervalParser"]
+
+
+def __getattr__(name: str):
+    if name in ("DaterangeExpression", "TimeIntervalParser"):
+        from . import core
+
+        return getattr(core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,170 @@
+# Copyright (c) 2026, The Panodata developers and contributors.
+# Distributed under the terms of the LGPL license, see LICENSE.
+"""
+Learn the order of the parser cascade from a sample of your traffic.
+
+The result of the cascade is the result of the first parser which succeeds, in
+the order of `TimeIntervalParser.parsers`. Any other order can only return the
+same result for all inputs by also running all parsers preceding the winner in
+the original order, which costs at least as much. So, instead of reordering at
+runtime, `CascadeProfile` runs each parser on each expression of a sample, and
+learns the order which minimizes the latency per shape of the expression,
+among those returning the same result for every expression of the sample.
+
+The learned order can be exported, and pinned using `parser_order`::
+
+    profile = CascadeProfile(TimeIntervalParser())
+    profile.observe(expressions)
+    ti = TimeIntervalParser(parser_order=profile.export())
+
+Inputs unlike those of the sample can still yield a different result.
+"""
+
+import dataclasses
+import datetime as dt
+import itertools
+import time
+import typing as t
+
+from .metrics import StageStatistics
+from .model import trange
+from .router import classify
+
+if t.TYPE_CHECKING:
+    from .core import TimeIntervalParser
+
+
+@dataclasses.dataclass
+class Observation:
+    """
+    The outcomes of all routed parsers for an expression, in order of the cascade.
+    """
+
+    when: str
+    shape: str
+    # Parsing result per parser name, or `None` if it raised an error.
+    results: t.Dict[str, t.Optional[trange]]
+    seconds: t.Dict[str, float]
+
+    def result(self, order: t.Sequence[str]) -> t.Tuple[t.Optional[trange], float]:
+        """
+        Return the result of running parsers in the given order, and the time it takes.
+        """
+        seconds = 0.0
+        for name in order:
+            if name not in self.results:
+                continue
+            seconds += self.seconds[name]
+            if self.results[name] is not None:
+                return self.results[name], seconds
+        return None, seconds
+
+
+class CascadeProfile:
+    """
+    Success rates and latencies of each parser, per shape of the expression.
+    """
+
+    def __init__(self, parser: "TimeIntervalParser"):
+        self.parser = parser
+        self.observations: t.Dict[str, Observation] = {}
+
+    def observe(self, expressions: t.Iterable[str], now: t.Optional[dt.datetime] = None) -> None:
+        """
+        Run all parsers which are not skipped by routing on each distinct expression, and record their outcomes.
+
+        Each parser runs once per expression, so warm up the parsers beforehand,
+        to avoid accounting for their initialization.
+        """
+        from .core import current_time
+
+        for when in expressions:
+            if when in self.observations:
+                continue
+            if now is None:
+                now = current_time()
+            results: t.Dict[str, t.Optional[trange]] = {}
+            seconds: t.Dict[str, float] = {}
+            # Observe the original order of the cascade, ignoring any pinned order.
+            for parser in self.parser.parsers:
+                if parser.accepts is not None and not parser.accepts(when):
+                    continue
+                started = time.perf_counter()
+                try:
+                    if parser.clocked:
+                        date_start, date_end = parser.fun(when, now=now)
+                    else:
+                        date_start, date_end = parser.fun(when)
+                    results[parser.name] = (date_start, date_end)
+                except Exception:
+                    results[parser.name] = None
+                seconds[parser.name] = time.perf_counter() - started
+            self.observations[when] = Observation(when=when, shape=classify(when), results=results, seconds=seconds)
+
+    @property
+    def names(self) -> t.List[str]:
+        return [parser.name for parser in self.parser.parsers]
+
+    @property
+    def shapes(self) -> t.List[str]:
+        return sorted({observation.shape for observation in self.observations.values()})
+
+    def statistics(self, shape: t.Optional[str] = None) -> t.Dict[str, StageStatistics]:
+        """
+        Return attempts, successes, failures, and cumulative latency per parser, optionally for a single shape.
+        """
+        result = {name: StageStatistics(name=name) for name in self.names}
+        for observation in self.observations.values():
+            if shape is not None and observation.shape != shape:
+                continue
+            for name, outcome in observation.results.items():
+                statistics = result[name]
+                statistics.attempts += 1
+                if outcome is None:
+                    statistics.failures += 1
+                else:
+                    statistics.successes += 1
+                statistics.total += observation.seconds[name]
+        return {name: statistics for name, statistics in result.items() if statistics.attempts}
+
+    def latency(self, shape: str, order: t.Optional[t.Sequence[str]] = None) -> float:
+        """
+        Return the mean latency of the cascade for expressions of a shape, in the given order, in seconds.
+        """
+        observations = self.select(shape)
+        if not observations:
+            return 0.0
+        order = order or self.names
+        return sum(observation.result(order)[1] for observation in observations) / len(observations)
+
+    def order(self, shape: str) -> t.List[str]:
+        """
+        Return the order of parsers with the lowest latency for a shape, which
+        returns the same results as the original order for the whole sample.
+        """
+        observations = self.select(shape)
+        names = [name for name in self.names if any(name in observation.results for observation in observations)]
+        expected = [observation.result(self.names)[0] for observation in observations]
+        best = names
+        best_seconds = sum(observation.result(names)[1] for observation in observations)
+        # The cascade is short, so all permutations can be evaluated.
+        for candidate in itertools.permutations(names):
+            seconds = 0.0
+            for observation, result in zip(observations, expected):
+                outcome, elapsed = observation.result(candidate)
+                if outcome != result:
+                    break
+                seconds += elapsed
+            else:
+                if seconds < best_seconds:
+                    best, best_seconds = list(candidate), seconds
+        return best
+
+    def export(self) -> t.Dict[str, t.List[str]]:
+        """
+        Return the learned order per shape, suitable for the `parser_order` argument of `TimeIntervalParser`.
+        """
+        return {shape: self.order(shape) for shape in self.shapes}
+
+    def select(self, shape: str) -> t.List[Observation]:
+        return [observation for observation in self.observations.values() if observation.shape == shape]
@@ -0,0 +1,122 @@
+# Copyright (c) 2026, The Panodata developers and contributors.
+# Distributed under the terms of the LGPL license, see LICENSE.
+"""
+Parse expressions from asyncio applications, without blocking the event loop.
+"""
+
+import asyncio
+import dataclasses
+import datetime as dt
+import typing as t
+import weakref
+from collections import deque
+from concurrent.futures import Executor
+from functools import partial
+
+from .model import ParseResult, TimeInterval, trange
+
+if t.TYPE_CHECKING:
+    from .core import TimeIntervalParser
+
+
+@dataclasses.dataclass
+class LoopState:
+    """
+    The in-flight parses and the concurrency limit of one event loop.
+    """
+
+    semaphore: asyncio.Semaphore
+    # In-flight parses, keyed by expression and reference time.
+    inflight: t.Dict[t.Tuple[str, t.Optional[dt.datetime]], asyncio.Future] = dataclasses.field(default_factory=dict)
+
+
+class AsyncParser:
+    """
+    Run the parser cascade of a `TimeIntervalParser` in an executor.
+
+    Concurrent requests for the same expression are merged into a single
+    parse, and at most `concurrency` parses run at the same time. `executor`
+    defaults to the default executor of the event loop.
+    """
+
+    def __init__(self, parser: "TimeIntervalParser", executor: t.Optional[Executor] = None, concurrency: int = 8):
+        if concurrency < 1:
+            raise ValueError(f"Concurrency must be positive: {concurrency}")
+        self.parser = parser
+        self.executor = executor
+        self.concurrency = concurrency
+        # Futures and semaphores are bound to an event loop, so each running loop gets its own.
+        self.loops: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, LoopState]" = weakref.WeakKeyDictionary()
+
+    def state(self) -> "LoopState":
+        """
+        Return the in-flight parses and the concurrency limit of the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        state = self.loops.get(loop)
+        if state is None:
+            state = self.loops[loop] = LoopState(semaphore=asyncio.Semaphore(self.concurrency))
+        return state
+
+    async def aparse(self, when: str, now: t.Optional[dt.datetime] = None) -> t.Union[trange, TimeInterval]:
+        """
+        Parse date range from textual expression, like `TimeIntervalParser.parse`.
+        """
+        key = (when, now)
+        inflight = self.state().inflight
+        future = inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self.run(when, now))
+            inflight[key] = future
+            future.add_done_callback(lambda _: inflight.pop(key, None))
+        # Merged requests share the outcome, which is immutable.
+        # Shielding keeps a cancelled request from cancelling the others.
+        return await asyncio.shield(future)
+
+    async def aparse_many(
+        self, expressions: t.Union[t.Iterable[str], t.AsyncIterable[str]], now: t.Optional[dt.datetime] = None
+    ) -> t.AsyncIterator[ParseResult]:
+        """
+        Parse expressions from an iterable or async iterable, yielding one `ParseResult` per expression, in input order.
+
+        Instead of raising, failed expressions yield a result carrying the error.
+        At most `concurrency` expressions are pending, so memory use is bounded.
+        All expressions are parsed relative to the same reference time `now`,
+        defaulting to the current time when the first expression arrives.
+        """
+        from .core import current_time
+
+        pending: "deque[t.Tuple[str, asyncio.Future]]" = deque()
+        try:
+            async for when in iterate(expressions):
+                if now is None:
+                    now = current_time()
+                pending.append((when, asyncio.ensure_future(self.aparse(when, now=now))))
+                if len(pending) >= self.concurrency:
+                    yield await outcome(*pending.popleft())
+            while pending:
+                yield await outcome(*pending.popleft())
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+    async def run(self, when: str, now: t.Optional[dt.datetime]) -> t.Union[trange, TimeInterval]:
+        async with self.state().semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, partial(self.parser.parse, when, now=now))
+
+
+async def iterate(items: t.Union[t.Iterable[str], t.AsyncIterable[str]]) -> t.AsyncIterator[str]:
+    if isinstance(items, t.AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def outcome(when: str, future: asyncio.Future) -> ParseResult:
+    try:
+        return ParseResult(when=when, value=await future)
+    except Exception as ex:
+        return ParseResult(when=when, error=ex)
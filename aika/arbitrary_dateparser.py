@@ -2,22 +2,278 @@
 Contains the DateParser module and relevant constants.
 """
 
-import calendar
 import re
+from collections.abc import Mapping
+from functools import lru_cache, partial
 from itertools import product
+from typing import Any, Dict, List, NamedTuple, Set, Tuple
 
 import pendulum
 from pendulum import WeekDay
+from pendulum.formatting import Formatter
+
+# Calendar names, like `calendar` provides them for the `C` locale, shipped as static
+# data, so they do not depend on the locale of the process.
+# Indexed like `calendar.month_name[1:]` and `calendar.day_name`, starting with Monday.
+MONTH_NAMES = [
+    "january",
+    "february",
+    "march",
+    "april",
+    "may",
+    "june",
+    "july",
+    "august",
+    "september",
+    "october",
+    "november",
+    "december",
+]
+MONTH_NAMES_ABBREVIATED = ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"]
+DAY_NAMES = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+DAY_NAMES_ABBREVIATED = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+
+formatter = Formatter()
+
+
+class PhraseTable(Mapping):
+    """
+    Lookup table for date or period phrases, relative to a reference date.
+
+    Values are computed on first access, so a lookup only pays for the phrase
+    which has been asked for. Values are immutable pendulum objects, and
+    computing them is idempotent, so tables can be shared across threads.
+    """
+
+    def __init__(self, factories):
+        self.factories = factories
+        self.computed = {}
+
+    def __getitem__(self, key):
+        try:
+            return self.computed[key]
+        except KeyError:
+            value = self.computed[key] = self.factories[key]()
+            return value
+
+    def __contains__(self, key):
+        return key in self.factories
+
+    def __iter__(self):
+        return iter(self.factories)
+
+    def __len__(self):
+        return len(self.factories)
+
+
+@lru_cache(maxsize=32)
+def phrase_tables(build, tz_name, today):
+    """
+    Phrase tables for a reference date, built once per day and timezone.
+    """
+    return build(today)
+
+
+def from_format(string, fmt, now):
+    """
+    Same as `pendulum.from_format`, but filling in missing elements from the given reference time.
+    """
+    parts = formatter.parse(string, fmt, now.in_tz(pendulum.UTC))
+    if parts["tz"] is None:
+        parts["tz"] = pendulum.UTC
+    return pendulum.datetime(**parts)
+
+
+def identity(value):
+    return value
+
+
+def period_of(date_phrases, phrase, unit):
+    start = date_phrases[phrase]
+    return pendulum.Interval(start, start.end_of(unit))
+
+
+def month_of(anchor, month):
+    return anchor.add(months=month - anchor.month)
+
+
+def previous_month_of(anchor, month):
+    return anchor.subtract(months=month - anchor.month)
+
+
+# How the pendulum format tokens used by the format templates can match,
+# as alternative sequences of shape elements, see `FormatIndex`.
+DIGITS_1 = ("d", 1)
+DIGITS_2 = ("d", 2)
+WORD = ("w",)
+FORMAT_TOKEN_SHAPES: Dict[str, List[Any]] = {
+    "YYYY": [(DIGITS_1,), (DIGITS_2,), (("d", 3),), (("d", 4),)],
+    "YY": [(DIGITS_1,), (DIGITS_2,)],
+    "MMMM": [(WORD,)],
+    "MMM": [(WORD,)],
+    "MM": [(DIGITS_1,), (DIGITS_2,)],
+    "M": [(DIGITS_1,), (DIGITS_2,)],
+    # A left-padded day may also match a space.
+    "DD": [(DIGITS_1,), (DIGITS_2,), (" ", DIGITS_1), (" ",)],
+    "D": [(DIGITS_1,), (DIGITS_2,)],
+}
+FORMAT_TOKENS = re.compile(r"\[([^\[]*)\]|" + "|".join(FORMAT_TOKEN_SHAPES) + r"|[A-Za-z]+|.", re.DOTALL)
+SHAPE_TOKENS = re.compile(r"(\d+)|([^\W\d_]+)|.", re.DOTALL)
+
+
+class FormatIndex:
+    """
+    Index date formats by the shape of the strings they can match.
+
+    A shape is the sequence of digit runs with their lengths, words, and
+    separator characters. It is used to dispatch a normalized date string
+    to the few formats which can possibly match it, instead of trying all
+    of them. Month names are words, literal words of formats must match
+    verbatim. Formats the index can not reason about are always candidates.
+    """
+
+    def __init__(self, formats):
+        self.formats = formats
+        self.literal_words = set()
+        shapes: Dict[Any, Set[str]] = {}
+        unindexed = set()
+        for date_format in formats:
+            format_shapes = self.format_shapes(date_format)
+            if format_shapes is None:
+                unindexed.add(date_format)
+                continue
+            for shape in format_shapes:
+                shapes.setdefault(shape, set()).add(date_format)
+
+        # Keep the candidates in the order of `formats`, which defines precedence.
+        self.fallback = [date_format for date_format in formats if date_format in unindexed]
+        self.candidates = {
+            shape: [date_format for date_format in formats if date_format in members or date_format in unindexed]
+            for shape, members in shapes.items()
+        }
+
+    def __getitem__(self, string):
+        """
+        Return the formats which can possibly match the given string, in order of precedence.
+        """
+        return self.candidates.get(self.shape(string), self.fallback)
+
+    def shape(self, string, literal=False):
+        elements: List[Any] = []
+        for match in SHAPE_TOKENS.finditer(string):
+            digits, word = match.groups()
+            if digits is not None:
+                elements.append(("d", len(digits)))
+            elif word is not None:
+                if literal:
+                    self.literal_words.add(word)
+                if word in self.literal_words:
+                    elements.append(("w", word))
+                else:
+                    elements.append(WORD)
+            else:
+                elements.append(match.group(0))
+        return tuple(elements)
+
+    def format_shapes(self, date_format):
+        """
+        Enumerate all shapes of strings matching a date format.
+
+        Returns `None` if the format can not be indexed, because it uses
+        unknown tokens, or because adjacent tokens make shapes ambiguous.
+        """
+        alternatives: List[Any] = []
+        for match in FORMAT_TOKENS.finditer(date_format):
+            token = match.group(0)
+            if match.group(1) is not None:
+                alternatives.append([self.shape(match.group(1), literal=True)])
+            elif token in FORMAT_TOKEN_SHAPES:
+                alternatives.append(FORMAT_TOKEN_SHAPES[token])
+            elif token.isalpha():
+                return None
+            else:
+                alternatives.append([(token,)])
+
+        shapes = []
+        for combination in product(*alternatives):
+            shape = tuple(element for elements in combination for element in elements)
+            for left, right in zip(shape, shape[1:]):
+                if isinstance(left, tuple) and isinstance(right, tuple) and left[0] == right[0]:
+                    return None
+            shapes.append(shape)
+        return shapes
+
+
+# Runs of whitespace, collapsed to a single space when normalizing.
+WHITESPACE = re.compile(r"\s+")
+
+
+class Tokenizer:
+    """
+    Normalize date strings in a few passes, using tables compiled from the vocabulary of a parser.
+
+    Separators are translated to spaces using a translation table, all replaced
+    words are substituted by a single regular expression, and unfiltered words
+    are looked up in a set. The ordinal suffixes of numbers are removed by
+    another single regular expression.
+
+    Like `str.replace`, replaced words are matched anywhere in the string. When
+    replaced words overlap, the one which comes first in `replaced_words` wins.
+    Replacing the words one after another differs only for strings with
+    overlapping replaced words, or where a replacement forms another replaced
+    word, none of which are dates.
+    """
+
+    def __init__(self, splitters, space_strings, replaced_words, unfiltered_words, ordinal_suffixes=()):
+        # Keep the iteration order of the splitters, which breaks ties.
+        self.splitters = list(splitters)
+        self.separators = str.maketrans(dict.fromkeys(space_strings, " "))
+        self.replacements = dict(replaced_words)
+        self.words = None
+        if self.replacements:
+            self.words = re.compile("|".join(re.escape(word) for word in self.replacements))
+        self.vocabulary = frozenset(unfiltered_words)
+        self.ordinals = None
+        if ordinal_suffixes:
+            self.ordinals = re.compile(r"(\d)(?:" + "|".join(re.escape(suffix) for suffix in ordinal_suffixes) + ")")
+
+    def replace_words(self, string):
+        if self.words is None:
+            return string
+        replacements = self.replacements
+        return self.words.sub(lambda match: replacements[match.group()], string)
+
+    def split(self, string):
+        """
+        Split a date range using the splitter which yields the most parts, like splitting by each of them.
+        """
+        return string.split(max(self.splitters, key=string.count))
+
+    def normalize(self, string):
+        string = self.replace_words(string.lower().strip().translate(self.separators))
+        vocabulary = self.vocabulary
+        string = " ".join([token for token in string.split(" ") if token in vocabulary or not token.isalpha()])
+        if self.ordinals is not None:
+            string = self.ordinals.sub(r"\1", string)
+        return WHITESPACE.sub(" ", string)
 
-MONTH_NAMES = [calendar.month_name[x].lower() for x in range(1, 13)]
-MONTH_NAMES_ABBREVIATED = [calendar.month_abbr[x].lower() for x in range(1, 13)]
 
-# Start with Sunday for Indexing.
-DAY_NAMES = [calendar.day_name[x].lower() for x in range(7)]
-DAY_NAMES_ABBREVIATED = [calendar.day_abbr[x].lower() for x in range(7)]
+class Reference(NamedTuple):
+    """
+    The reference time of a single parse, with the phrase tables relative to it.
+
+    It is passed along per call, so concurrent calls on the same parser do not share state.
+    """
+
+    now: Any
+    date_phrases: PhraseTable
+    period_phrases: PhraseTable
 
 
 class DateParser:
+    # The phrase for the current point in time, which is not part of the phrase tables.
+    now_phrase = "now"
+
     def __init__(
         self,
         tz="local",
@@ -47,11 +303,6 @@ class DateParser:
         # These variables modify date ranges
         self.splitters = {" to ", " - ", " through "}
 
-        self.period_transformations = [lambda s: s.lower(), lambda s: s.strip()]
-
-        # These variables modify dates
-        self.pre_word_replace_date_transformations = [lambda s: s.lower(), lambda s: s.strip()]
-
         # Formats are separated by spaces only. So convert any other separator
         # you want to a space.
         self.space_strings = {"-", "/", ".", ","}
@@ -63,21 +314,8 @@ class DateParser:
         for i, month in enumerate(MONTH_NAMES):
             self.replaced_words[month] = MONTH_NAMES_ABBREVIATED[i]
 
-        # These variables modify dates
-        self.post_word_replace_date_transformations = [
-            lambda s: " ".join(x for x in s.split(" ") if x in self.unfiltered_words or not x.isalpha()),  # type: ignore[has-type]
-        ]
-
-        self.regex_replacements = {
-            re.compile(x): y
-            for x, y in {
-                r"(\d)st": r"\1",
-                r"(\d)nd": r"\1",
-                r"(\d)rd": r"\1",
-                r"(\d)th": r"\1",
-                r"\s+": " ",
-            }.items()
-        }
+        # Suffixes of ordinal numbers, which are removed
+        self.ordinal_suffixes: Tuple[str, ...] = ("st", "nd", "rd", "th")
 
         _day_formats = ("DD", "D")  # {d}
         _month_formats = ("MMMM", "MMM", "MM")  # {m}
@@ -123,6 +361,7 @@ class DateParser:
             return priority
 
         self.date_formats = sorted(self.date_formats, key=_format_sorter, reverse=True)
+        self.format_index = FormatIndex(self.date_formats)
 
         # Words that are not filtered (replacements -> this -> regex)
         self.unfiltered_words = unfiltered_words
@@ -146,100 +385,144 @@ class DateParser:
                 "of",
             )
 
+        self.compile()
         self.refresh_dates()
 
-    def refresh_dates(self):
+    def compile(self):
+        """
+        Compile the vocabulary into the tokenizer. Required after modifying it, like `replaced_words`.
+        """
+        self.tokenizer = Tokenizer(
+            splitters=self.splitters,
+            space_strings=self.space_strings,
+            replaced_words=self.replaced_words,
+            unfiltered_words=self.unfiltered_words,
+            ordinal_suffixes=self.ordinal_suffixes,
+        )
+
+    def reference(self, now=None):
+        """
+        Return the reference time and phrase tables for a single parse.
+
+        `now` is an optional reference time, defaulting to the current time.
+        Naive datetimes are interpreted as local time.
+
+        The phrase tables only change when the calendar day changes, so they
+        are shared per timezone and reference date, see `phrase_tables`.
+        """
+        if now is None:
+            now = pendulum.now(self.tz)
+        else:
+            now = pendulum.from_timestamp(now.timestamp(), tz=self.tz)
+        today = now.start_of("day")
+        date_phrases, period_phrases = phrase_tables(self.build_phrase_tables, today.timezone_name, today)
+        return Reference(now, date_phrases, period_phrases)
+
+    def refresh_dates(self, now=None):
         """
         Anything that sets an attribute with a datetime relative to the
         present is set here.
+
+        The attributes are only used by calls which pass `refresh=False`.
+        Other calls compute their own `Reference`, so they do not depend
+        on, or modify, the state of the instance.
+        """
+        reference = self.reference(now)
+        self.now, self.date_phrases, self.period_phrases = reference
+        self.today = reference.now.start_of("day")
+        return reference
+
+    def state(self):
+        """
+        Return the reference time and phrase tables of the last `refresh_dates` call.
+        """
+        return Reference(self.now, self.date_phrases, self.period_phrases)
+
+    @classmethod
+    def build_phrase_tables(cls, today):
+        """
+        Build the tables of date and period phrases, relative to `today`.
+
+        The `now` phrase is not part of the tables, because it changes on each call.
         """
-        self.now = pendulum.now(self.tz)
-        self.today = pendulum.today(self.tz)
-        self.this_week = self.today.start_of("week")
-        self.next_week = self.this_week.add(weeks=1)
-        self.previous_week = self.this_week.subtract(weeks=1)
-        self.this_month = self.today.start_of("month")
-        self.next_month = self.this_month.add(months=1)
-        self.previous_month = self.this_month.subtract(months=1)
-        self.this_year = self.today.start_of("year")
-        self.next_year = self.this_year.add(years=1)
-        self.previous_year = self.this_year.subtract(years=1)
+        this_week = today.start_of("week")
+        this_month = today.start_of("month")
+        next_month = this_month.add(months=1)
+        previous_month = this_month.subtract(months=1)
+        this_year = today.start_of("year")
 
         # Strings with direct date translations
-        self.date_phrases = {
-            "now": self.now,
-            "today": self.today,
-            "tomorrow": self.today.add(days=1),
-            "yesterday": self.today.subtract(days=1),
-            "this month": self.this_month,
-            "next month": self.next_month,
-            "previous month": self.previous_month,
-            "this week": self.this_week,
-            "next week": self.next_week,
-            "previous week": self.previous_week,
-            "this year": self.this_year,
-            "next year": self.next_year,
-            "previous year": self.previous_year,
-        }
+        date_phrases = PhraseTable(
+            {
+                "today": lambda: today,
+                "tomorrow": lambda: today.add(days=1),
+                "yesterday": lambda: today.subtract(days=1),
+                "this month": lambda: this_month,
+                "next month": lambda: next_month,
+                "previous month": lambda: previous_month,
+                "this week": lambda: this_week,
+                "next week": lambda: this_week.add(weeks=1),
+                "previous week": lambda: this_week.subtract(weeks=1),
+                "this year": lambda: this_year,
+                "next year": lambda: this_year.add(years=1),
+                "previous year": lambda: this_year.subtract(years=1),
+            }
+        )
 
         # Strings with direct period translations
-        self.period_phrases = {
-            "this month": pendulum.Interval(self.this_month, self.this_month.end_of("month")),
-            "next month": pendulum.Interval(self.next_month, self.next_month.end_of("month")),
-            "previous month": pendulum.Interval(self.previous_month, self.previous_month.end_of("month")),
-            "this week": pendulum.Interval(self.this_week, self.this_week.end_of("week")),
-            "next week": pendulum.Interval(self.next_week, self.next_week.end_of("week")),
-            "previous week": pendulum.Interval(self.previous_week, self.previous_week.end_of("week")),
-            "this year": pendulum.Interval(self.this_year, self.this_year.end_of("year")),
-            "previous year": pendulum.Interval(self.next_year, self.next_year.end_of("year")),
-        }
+        period_phrases = PhraseTable(
+            {
+                "this month": partial(period_of, date_phrases, "this month", "month"),
+                "next month": partial(period_of, date_phrases, "next month", "month"),
+                "previous month": partial(period_of, date_phrases, "previous month", "month"),
+                "this week": partial(period_of, date_phrases, "this week", "week"),
+                "next week": partial(period_of, date_phrases, "next week", "week"),
+                "previous week": partial(period_of, date_phrases, "previous week", "week"),
+                "this year": partial(period_of, date_phrases, "this year", "year"),
+                "previous year": partial(period_of, date_phrases, "next year", "year"),
+            }
+        )
 
         for i, day in enumerate(DAY_NAMES_ABBREVIATED):
-            self.date_phrases[f"next {day}"] = self.today.next(WeekDay(i))
-            self.date_phrases[f"previous {day}"] = self.today.previous(WeekDay(i))
+            date_phrases.factories[f"next {day}"] = partial(today.next, WeekDay(i))
+            date_phrases.factories[f"previous {day}"] = partial(today.previous, WeekDay(i))
 
-            if self.today.day_of_week == i:
-                self.date_phrases[day] = self.today
-                self.date_phrases[f"this {day}"] = self.today
+            if today.day_of_week == i:
+                date_phrases.factories[day] = date_phrases.factories[f"this {day}"] = partial(identity, today)
             else:
-                self.date_phrases[day] = self.today.next(WeekDay(i))
-                self.date_phrases[f"this {day}"] = self.today.next(WeekDay(i))
+                date_phrases.factories[day] = date_phrases.factories[f"this {day}"] = partial(today.next, WeekDay(i))
 
         for i, month in enumerate(MONTH_NAMES_ABBREVIATED):
-            self.date_phrases[f"next {month}"] = self.next_month.add(months=(i + 1) - self.next_month.month)
-            self.date_phrases[f"previous {month}"] = self.previous_month.subtract(
-                months=(i + 1) - self.previous_month.month
-            )
-            self.date_phrases[month] = self.this_month.add(months=(i + 1) - self.this_month.month)
-            self.date_phrases[f"this {month}"] = self.this_month.add(months=(i + 1) - self.this_month.month)
+            date_phrases.factories[f"next {month}"] = partial(month_of, next_month, i + 1)
+            date_phrases.factories[f"previous {month}"] = partial(previous_month_of, previous_month, i + 1)
+            date_phrases.factories[month] = partial(month_of, this_month, i + 1)
+            date_phrases.factories[f"this {month}"] = partial(month_of, this_month, i + 1)
 
             for month_phrase in (f"next {month}", f"previous {month}", month, f"this {month}"):
-                self.period_phrases[month_phrase] = pendulum.Interval(
-                    self.date_phrases[month_phrase], self.date_phrases[month_phrase].end_of("month")
-                )
+                period_phrases.factories[month_phrase] = partial(period_of, date_phrases, month_phrase, "month")
+
+        return date_phrases, period_phrases
 
-    def __call__(self, string, refresh=True):
+    def __call__(self, string, refresh=True, now=None):
+        return self.parse(string, refresh=refresh, now=now)
+
+    def parse(self, string, refresh=True, now=None):
         _unmodified_string = string
 
-        if refresh:
-            self.refresh_dates()
+        reference = self.reference(now) if refresh else self.state()
 
         if not self.support_periods:
-            return self._normalize_and_convert(string)
-
-        for f in self.period_transformations:
-            string = f(string)
+            return self._normalize_and_convert(string, reference=reference)
 
-        for word, replacement in self.replaced_words.items():
-            string = string.replace(word, replacement)
+        string = self.tokenizer.replace_words(string.lower().strip())
 
         try:
-            return self.period_phrases[string]
+            return reference.period_phrases[string]
         except KeyError:
             datetimes = self.split_datetime_string(string)
 
         if len(datetimes) == 1:
-            dt = self._normalize_and_convert(string)
+            dt = self._normalize_and_convert(string, reference=reference)
             return self._handle_singlet(dt)
 
         elif len(datetimes) == 2:
@@ -247,14 +530,14 @@ class DateParser:
             str_2 = self.normalize_date(datetimes[1])
 
             try:
-                dt_1 = min(self.period_phrases[str_1])
+                dt_1 = min(reference.period_phrases[str_1])
             except KeyError:
-                dt_1 = self.convert_normalized_date(str_1, False)
+                dt_1 = self.convert_normalized_date(str_1, False, reference=reference)
 
             try:
-                dt_2 = max(self.period_phrases[str_2])
+                dt_2 = max(reference.period_phrases[str_2])
             except KeyError:
-                dt_2 = self.convert_normalized_date(str_2, False)
+                dt_2 = self.convert_normalized_date(str_2, False, reference=reference)
 
             start, end = min(dt_1, dt_2), max(dt_1, dt_2)
             return pendulum.Interval(start, end)
@@ -267,45 +550,32 @@ class DateParser:
         else:
             return dt
 
-    def _normalize_and_convert(self, string, refresh=False):
+    def _normalize_and_convert(self, string, refresh=False, reference=None):
         string = self.normalize_date(string)
-        return self.convert_normalized_date(string, refresh)
+        return self.convert_normalized_date(string, refresh, reference=reference)
 
     def split_datetime_string(self, string):
-        return sorted((string.split(x) for x in self.splitters), key=lambda split: len(split), reverse=True)[0]
+        return self.tokenizer.split(string)
 
     def normalize_date(self, string):
-        for f in self.pre_word_replace_date_transformations:
-            string = f(string)
-
-        for space_string in self.space_strings:
-            string = string.replace(space_string, " ")
-
-        for word, replacement in self.replaced_words.items():
-            string = string.replace(word, replacement)
-
-        for f in self.post_word_replace_date_transformations:
-            string = f(string)
-
-        for pattern, replacement in self.regex_replacements.items():
-            string = pattern.sub(replacement, string)
-
-        return string
+        return self.tokenizer.normalize(string)
 
-    def convert_normalized_date(self, string, refresh=True):
-        if refresh:
-            self.refresh_dates()
+    def convert_normalized_date(self, string, refresh=True, reference=None):
+        if reference is None:
+            reference = self.reference() if refresh else self.state()
 
         # Try a known key phrase
+        if string == self.now_phrase:
+            return reference.now
         try:
-            return self.date_phrases[string]
+            return reference.date_phrases[string]
         except KeyError:
             pass
 
-        # Try all of the known date formats
-        for date_format in self.date_formats:
+        # Try the known date formats which can match the shape of the string
+        for date_format in self.format_index[string.title()]:
             try:
-                dt = pendulum.from_format(string.title(), date_format)
+                dt = from_format(string.title(), date_format, reference.now)
 
                 # Try to get behavior closer to the datetime module
                 if self.strict:
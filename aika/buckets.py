@@ -0,0 +1,127 @@
+# Copyright (c) 2026, The Panodata developers and contributors.
+# Distributed under the terms of the LGPL license, see LICENSE.
+"""
+Classify many timestamps by the time interval they fall into.
+"""
+
+import bisect
+import datetime as dt
+import itertools
+import sys
+import typing as t
+from array import array
+
+from .columnar import IntervalArray
+from .model import TimeInterval, trange
+
+if t.TYPE_CHECKING:
+    import numpy
+
+# Stand-in for the `end` of open intervals, greater than all encoded timestamps.
+INFINITY = 2**63 - 1
+
+CHUNK_SIZE = 65536
+
+
+class BucketIndex:
+    """
+    Classify timestamps by the interval containing them, using binary search.
+
+    The intervals must be sorted and disjoint, like the ones of an `IntervalSet`.
+    Classifying returns the index of the containing interval for each timestamp,
+    or -1 when no interval contains it. Intervals are closed, and intervals
+    without `end` extend indefinitely.
+
+    Timestamps are compared as microseconds since the epoch, so naive and
+    timezone-aware values can not be mixed, like with `IntervalArray`.
+    """
+
+    __slots__ = ("ends", "intervals", "starts")
+
+    def __init__(self, intervals: t.Iterable[t.Union[TimeInterval, trange]]):
+        columns = self.intervals = IntervalArray(intervals)
+        self.starts = columns.starts
+        self.ends = array("q", (end if valid else INFINITY for end, valid in zip(columns.ends, columns.mask)))
+        for index, (start, end) in enumerate(zip(self.starts, self.ends)):
+            if end < start:
+                raise ValueError(f"Interval ends before it starts: {self.intervals[index]}")
+            if index and start <= self.ends[index - 1]:
+                raise ValueError(f"Intervals must be sorted and disjoint: {self.intervals[index]}")
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __repr__(self) -> str:
+        return f"<BucketIndex of {len(self)} intervals>"
+
+    def lookup(self, when: dt.datetime) -> int:
+        """
+        Return the index of the interval containing a single timestamp, or -1.
+        """
+        value = self.intervals.encode(when)
+        index = bisect.bisect_right(self.starts, value) - 1
+        if index >= 0 and value <= self.ends[index]:
+            return index
+        return -1
+
+    @t.overload
+    def classify(self, timestamps: "numpy.ndarray") -> "numpy.ndarray": ...
+
+    @t.overload
+    def classify(self, timestamps: t.Iterable[dt.datetime]) -> "array[int]": ...
+
+    def classify(
+        self, timestamps: t.Union["numpy.ndarray", t.Iterable[dt.datetime]]
+    ) -> t.Union["numpy.ndarray", "array[int]"]:
+        """
+        Return the index of the interval containing each timestamp, or -1.
+
+        NumPy `datetime64` arrays are classified using `numpy.searchsorted`, and
+        return an `int64` array. Like with `IntervalArray.from_numpy`, their values
+        are naive, or in UTC when the intervals are timezone-aware, and `NaT`
+        values are never contained. All other iterables of datetimes return an
+        `array` of 64-bit integers.
+        """
+        numpy = sys.modules.get("numpy")
+        if numpy is not None and isinstance(timestamps, numpy.ndarray):
+            return self.classify_numpy(timestamps)
+        starts, ends, encode, search = self.starts, self.ends, self.intervals.encode, bisect.bisect_right
+        result = array("q")
+        for when in t.cast(t.Iterable[dt.datetime], timestamps):
+            value = encode(when)
+            index = search(starts, value) - 1
+            result.append(index if index >= 0 and value <= ends[index] else -1)
+        return result
+
+    def classify_numpy(self, timestamps: "numpy.ndarray") -> "numpy.ndarray":
+        """
+        Classify a NumPy `datetime64` array at once, using `numpy.searchsorted`. Requires `numpy`.
+        """
+        import numpy
+
+        values = timestamps.astype("datetime64[us]").astype(numpy.int64)
+        if not len(self):
+            return numpy.full(values.shape, -1, dtype=numpy.int64)
+        starts = numpy.frombuffer(self.starts, dtype=numpy.int64)
+        ends = numpy.frombuffer(self.ends, dtype=numpy.int64)
+        # `NaT` is the smallest 64-bit integer, so it sorts before all intervals, and misses.
+        indices = numpy.searchsorted(starts, values, side="right") - 1
+        hits = (indices >= 0) & (values <= ends[indices.clip(0)])
+        return numpy.where(hits, indices, -1)
+
+    def classify_chunks(
+        self, timestamps: t.Iterable[t.Any], size: int = CHUNK_SIZE
+    ) -> t.Iterator[t.Union["numpy.ndarray", "array[int]"]]:
+        """
+        Classify a stream of timestamps lazily, yielding one result per chunk.
+
+        `timestamps` is either an iterable of chunks, like NumPy arrays, or lists
+        of datetimes, or a flat iterable of datetimes, which is split into chunks
+        of `size` items. Only one chunk is held in memory at a time.
+        """
+        iterator = iter(timestamps)
+        for first in iterator:
+            if isinstance(first, dt.datetime):
+                yield self.classify(itertools.chain([first], itertools.islice(iterator, size - 1)))
+            else:
+                yield self.classify(first)
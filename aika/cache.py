@@ -0,0 +1,153 @@
+# Copyright (c) 2026, The Panodata developers and contributors.
+# Distributed under the terms of the LGPL license, see LICENSE.
+"""
+Cache the results of the parser cascade, taking care of relative expressions.
+"""
+
+import dataclasses
+import datetime as dt
+import math
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+
+from .notation import CALENDAR_NOTATION
+
+# Lifetime of results which do not depend on the reference time.
+FOREVER = math.inf
+
+# Times of day which can be produced by calendar arithmetic alone.
+DAY_BOUNDARIES = [dt.time(hour=0, minute=0, second=0), dt.time(hour=23, minute=59, second=59, microsecond=999999)]
+
+
+@dataclasses.dataclass
+class CacheStatistics:
+    """
+    Counters of a `ResultCache`.
+
+    Lookups of expired entries are counted as `expirations`, and as `misses`.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    size: int = 0
+    maxsize: int = 0
+
+
+@dataclasses.dataclass(frozen=True)
+class CacheEntry:
+    """
+    A cached parsing outcome: Either a value, or the error message of a failed expression.
+    """
+
+    value: t.Any
+    error: t.Optional[str]
+    expires: float
+
+
+class ResultCache:
+    """
+    A size-bounded LRU cache for the results of `TimeIntervalParser.parse`, safe for concurrent use.
+
+    Each entry carries its expiry time, as POSIX timestamp. Entries of absolute
+    expressions never expire, entries of relative expressions expire at the
+    next day boundary.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        if maxsize < 1:
+            raise ValueError(f"Cache size must be positive: {maxsize}")
+        self.maxsize = maxsize
+        self.entries: "OrderedDict[t.Hashable, CacheEntry]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: t.Hashable) -> t.Optional[CacheEntry]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.expires != FOREVER and time.time() >= entry.expires:
+                del self.entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: t.Hashable, entry: CacheEntry) -> None:
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Remove all entries, retaining the statistics.
+        """
+        with self.lock:
+            self.entries.clear()
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        with self.lock:
+            return CacheStatistics(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                expirations=self.expirations,
+                size=len(self.entries),
+                maxsize=self.maxsize,
+            )
+
+
+def next_day_boundary(tz: str) -> float:
+    """
+    Return the POSIX timestamp of the next midnight, whichever comes first of
+    the given timezone, used by `arbitrary-dateparser`, and the local timezone,
+    used by DateRangeParser and DUDP.
+    """
+    import pendulum
+
+    local = dt.datetime.combine(dt.date.today() + dt.timedelta(days=1), dt.time()).timestamp()
+    return min(local, pendulum.tomorrow(tz).timestamp())
+
+
+def expiry(
+    when: str, result: t.Optional[t.Tuple[t.Any, t.Any]], tz: str, parser: t.Optional[str] = None
+) -> t.Optional[float]:
+    """
+    Compute the expiry time of a parsing outcome, or `None` if it must not be cached.
+
+    `result` is the raw outcome of the parser cascade, before applying any
+    time snapping, or `None` if the expression failed to parse. `parser` is
+    the name of the parser which produced the result.
+
+    - Results of the calendar notation parser, like `2025W01` or `2025Q03`, are
+      absolute, they never expire. Malformed notations like `2025W00` falling
+      through to other parsers are treated like any other expression.
+    - Other results only depend on the reference time through its date, as long as
+      they are at a day boundary, so they expire at the next one. This includes
+      failed expressions.
+    - Results carrying a time of day, like `now`, depend on the clock, and are not cached.
+    """
+    if result is not None and parser == CALENDAR_NOTATION:
+        return FOREVER
+    if result is not None:
+        for value in result:
+            if isinstance(value, dt.datetime) and value.time() not in DAY_BOUNDARIES:
+                return None
+    return next_day_boundary(tz)
@@ -0,0 +1,177 @@
+# Copyright (c) 2026, The Panodata developers and contributors.
+# Distributed under the terms of the LGPL license, see LICENSE.
+"""
+Convert time interval expressions in bulk, reading one expression per line.
+
+Examples::
+
+    echo "last week" | aika
+    aika --format=jsonl --now=2023-08-17T23:03:17+02:00 expressions.txt
+    zcat queries.log.gz | aika --format=lucene --jobs=4 > clauses.txt
+
+Each input line yields one output line, in input order. Expressions which
+fail to parse yield an empty line, or a JSON object carrying the error, and
+are reported on stderr, without stopping the stream. Blank lines are passed through.
+"""
+
+import argparse
+import datetime as dt
+import itertools
+import json
+import os
+import sys
+import typing as t
+
+from . import formatting
+from .model import ParseResult, TimeInterval
+
+# Rendering functions of the text output formats.
+FORMATS: t.Dict[str, t.Callable[[t.List[TimeInterval]], t.List[str]]] = {
+    "github": formatting.githubformat,
+    "iso": formatting.isoformat,
+    "lucene": formatting.luceneformat,
+    "math": formatting.mathformat,
+    "opsgenie": formatting.opsgenieformat,
+}
+
+# Number of results rendered and written at once.
+BATCH_SIZE = 1000
+
+
+def parse_now(value: str) -> dt.datetime:
+    """
+    Parse the reference time from an ISO 8601 timestamp. Naive timestamps are interpreted as local time.
+    """
+    try:
+        now = dt.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError as ex:
+        raise argparse.ArgumentTypeError(f"Invalid ISO 8601 timestamp: {value}") from ex
+    return now.astimezone()
+
+
+def read_lines(files: t.List[str]) -> t.Iterator[str]:
+    """
+    Read lines from files, or from stdin, without line endings.
+    """
+    for path in files or ["-"]:
+        if path == "-":
+            for line in sys.stdin:
+                yield line.rstrip("\r\n")
+        else:
+            with open(path, encoding="utf-8", buffering=1024 * 1024) as stream:
+                for line in stream:
+                    yield line.rstrip("\r\n")
+
+
+def record(result: ParseResult) -> t.Dict[str, t.Optional[str]]:
+    """
+    Represent a result as JSON object, with `input`, `start`, `end`, and `error` keys.
+    """
+    value = result.value if isinstance(result.value, TimeInterval) else None
+    return {
+        "input": result.when,
+        "start": value.start.isoformat() if value else None,
+        "end": value.end.isoformat() if value and value.end else None,
+        "error": None if result.ok else str(result.error),
+    }
+
+
+def render(results: t.List[ParseResult], format_: str) -> t.List[str]:
+    """
+    Render a batch of results. Failed expressions yield an empty line, or an object carrying the error.
+    """
+    if format_ == "jsonl":
+        return [json.dumps(record(result), ensure_ascii=False) for result in results]
+    values = [result.value if isinstance(result.value, TimeInterval) else None for result in results]
+    rendered = iter(FORMATS[format_]([value for value in values if value is not None]))
+    return [next(rendered) if value is not None else "" for value in values]
+
+
+def parse_results(lines: t.Iterable[str], args: argparse.Namespace) -> t.Iterator[t.Optional[ParseResult]]:
+    """
+    Parse non-blank lines, using worker processes with `--jobs`. Blank lines yield `None`.
+    """
+    lines, expressions = itertools.tee(lines)
+    expressions = (line.strip() for line in expressions if line.strip())
+    if args.jobs == 1:
+        from .core import TimeIntervalParser
+
+        parser = TimeIntervalParser(tz=args.tz, languages=args.languages)
+        results = parser.parse_many(expressions, now=args.now)
+        for line in lines:
+            yield next(results) if line.strip() else None
+    else:
+        from .parallel import ParallelParser, ParserConfig
+
+        config = ParserConfig(tz=args.tz, languages=tuple(args.languages) if args.languages else None)
+        with ParallelParser(config, processes=args.jobs or None) as pool:
+            results = pool.parse_many(expressions, now=args.now)
+            for line in lines:
+                yield next(results) if line.strip() else None
+
+
+def convert(args: argparse.Namespace, output: t.TextIO) -> int:
+    """
+    Convert all input lines, and return the number of failed expressions.
+    """
+    from .core import DEFAULT_TIMEZONE, current_time
+
+    args.tz = args.tz or DEFAULT_TIMEZONE
+    args.now = args.now or current_time()
+    failures = 0
+    number = 0
+    results = parse_results(read_lines(args.files), args)
+    while True:
+        batch = list(itertools.islice(results, BATCH_SIZE))
+        if not batch:
+            break
+        parsed = [result for result in batch if result is not None]
+        rendered = iter(render(parsed, args.format))
+        lines = []
+        for result in batch:
+            number += 1
+            if result is None:
+                lines.append("")
+                continue
+            if not result.ok:
+                failures += 1
+                print(f"Line {number}: {result.error}", file=sys.stderr)
+            lines.append(next(rendered))
+        output.write("\n".join(lines) + "\n")
+    return failures
+
+
+def main(argv: t.Optional[t.List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="aika", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("files", nargs="*", metavar="FILE", help="Files to read, defaults to stdin, or `-`")
+    parser.add_argument(
+        "--format", choices=["jsonl", *sorted(FORMATS)], default="iso", help="Output format, defaults to `iso`"
+    )
+    parser.add_argument("--now", type=parse_now, help="Reference time as ISO 8601 timestamp, defaults to now")
+    parser.add_argument("--tz", help="Timezone of relative expressions")
+    parser.add_argument(
+        "--languages", type=lambda value: value.split(","), help="Languages of dateparser, like `en,de`"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=1, help="Number of worker processes, 0 uses all CPUs, defaults to 1"
+    )
+    parser.add_argument("--strict", action="store_true", help="Exit with status 1 if any expression failed")
+    args = parser.parse_args(argv)
+    if args.jobs < 0:
+        parser.error(f"Number of jobs must not be negative: {args.jobs}")
+
+    try:
+        failures = convert(args, sys.stdout)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # The reader went away, like `head`. Avoid another error when flushing at exit.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    return 1 if args.strict and failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
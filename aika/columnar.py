@@ -0,0 +1,164 @@
+# Copyright (c) 2026, The Panodata developers and contributors.
+# Distributed under the terms of the LGPL license, see LICENSE.
+"""
+Store many time intervals compactly, in columns.
+"""
+
+import datetime as dt
+import typing as t
+from array import array
+
+from .model import TimeInterval, trange
+
+if t.TYPE_CHECKING:
+    import numpy
+
+EPOCH = dt.datetime(1970, 1, 1)
+EPOCH_UTC = EPOCH.replace(tzinfo=dt.timezone.utc)
+
+
+class IntervalArray:
+    """
+    A sequence of time intervals, stored as two columns of 64-bit integers.
+
+    Values are microseconds since the epoch, `end` values are accompanied by a
+    validity mask for open intervals. Intervals are materialized as `TimeInterval`
+    objects on access only, so millions of them need just 17 bytes each.
+
+    All intervals either carry naive datetimes, or timezone-aware ones. The
+    latter are stored in UTC, and materialized in the timezone of the first
+    interval, or in `tzinfo`, if given.
+    """
+
+    __slots__ = ("aware", "ends", "mask", "starts", "tzinfo")
+
+    def __init__(
+        self,
+        intervals: t.Iterable[t.Union[TimeInterval, trange]] = (),
+        tzinfo: t.Optional[dt.tzinfo] = None,
+    ):
+        self.starts = array("q")
+        self.ends = array("q")
+        self.mask = bytearray()
+        self.tzinfo = tzinfo
+        self.aware: t.Optional[bool] = None if tzinfo is None else True
+        self.extend(intervals)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    @t.overload
+    def __getitem__(self, index: int) -> TimeInterval: ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> "IntervalArray": ...
+
+    def __getitem__(self, index: t.Union[int, slice]) -> t.Union[TimeInterval, "IntervalArray"]:
+        if isinstance(index, slice):
+            result = self.empty()
+            result.starts = self.starts[index]
+            result.ends = self.ends[index]
+            result.mask = self.mask[index]
+            return result
+        end = self.decode(self.ends[index]) if self.mask[index] else None
+        return TimeInterval(self.decode(self.starts[index]), end)
+
+    def __iter__(self) -> t.Iterator[TimeInterval]:
+        for start, end, valid in zip(self.starts, self.ends, self.mask):
+            yield TimeInterval(self.decode(start), self.decode(end) if valid else None)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalArray):
+            return NotImplemented
+        return (
+            self.aware == other.aware
+            and self.starts == other.starts
+            and self.ends == other.ends
+            and self.mask == other.mask
+        )
+
+    def __repr__(self) -> str:
+        return f"<IntervalArray of {len(self)} intervals>"
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The number of bytes occupied by the columns.
+        """
+        return (len(self.starts) + len(self.ends)) * self.starts.itemsize + len(self.mask)
+
+    def empty(self) -> "IntervalArray":
+        """
+        Return an empty array, using the same timezone.
+        """
+        result = IntervalArray(tzinfo=self.tzinfo)
+        result.aware = self.aware
+        return result
+
+    def append(self, interval: t.Union[TimeInterval, trange]) -> None:
+        if isinstance(interval, TimeInterval):
+            start, end = interval.start, interval.end
+        else:
+            start, end = interval
+        # Encode both values before appending, so a failure leaves the columns consistent.
+        start_value = self.encode(start)
+        end_value = self.encode(end) if end is not None else 0
+        self.starts.append(start_value)
+        self.ends.append(end_value)
+        self.mask.append(end is not None)
+
+    def extend(self, intervals: t.Iterable[t.Union[TimeInterval, trange]]) -> None:
+        for interval in intervals:
+            self.append(interval)
+
+    def encode(self, value: dt.datetime) -> int:
+        aware = value.tzinfo is not None
+        if self.aware is None:
+            self.aware = aware
+            if aware:
+                self.tzinfo = value.tzinfo
+        elif aware != self.aware:
+            raise ValueError(f"Unable to mix naive and timezone-aware datetimes: {value}")
+        delta = value - (EPOCH_UTC if aware else EPOCH)
+        return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+    def decode(self, value: int) -> dt.datetime:
+        if self.aware:
+            return (EPOCH_UTC + dt.timedelta(microseconds=value)).astimezone(self.tzinfo)
+        return EPOCH + dt.timedelta(microseconds=value)
+
+    def to_numpy(self) -> t.Tuple["numpy.ndarray", "numpy.ndarray"]:
+        """
+        Return copies of the `start` and `end` columns as `datetime64[us]` arrays, using `NaT` for open intervals.
+
+        Timezone-aware values are returned in UTC. Requires `numpy`.
+        """
+        import numpy
+
+        starts = numpy.frombuffer(self.starts, dtype=numpy.int64).astype("datetime64[us]")
+        ends = numpy.frombuffer(self.ends, dtype=numpy.int64).astype("datetime64[us]")
+        ends[numpy.frombuffer(self.mask, dtype=numpy.bool_) == 0] = numpy.datetime64("NaT")
+        return starts, ends
+
+    @classmethod
+    def from_numpy(
+        cls, starts: "numpy.ndarray", ends: "numpy.ndarray", tzinfo: t.Optional[dt.tzinfo] = None
+    ) -> "IntervalArray":
+        """
+        Create an array from `datetime64` columns, where `NaT` denotes open intervals.
+
+        The values are naive, or in UTC when `tzinfo` is given. Requires `numpy`.
+        """
+        import numpy
+
+        if len(starts) != len(ends):
+            raise ValueError(f"Columns differ in length: {len(starts)} != {len(ends)}")
+        if numpy.isnat(starts).any():
+            raise ValueError("Start values must not be NaT")
+        valid = ~numpy.isnat(ends)
+        result = cls(tzinfo=tzinfo)
+        result.aware = tzinfo is not None
+        result.starts.frombytes(starts.astype("datetime64[us]").astype(numpy.int64).tobytes())
+        result.ends.frombytes(numpy.where(valid, ends.astype("datetime64[us]").astype(numpy.int64), 0).tobytes())
+        result.mask = bytearray(valid.astype(numpy.uint8).tobytes())
+        return result
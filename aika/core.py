@@ -1,27 +1,45 @@
 # Copyright (c) 2023-2025, The Panodata developers and contributors.
 # Distributed under the terms of the LGPL license, see LICENSE.
 
+import copy
 import datetime as dt
 import logging
+import threading
+import time
 import typing as t
+from collections import OrderedDict
+from functools import lru_cache, partial
 
-import dateparser
-import dateutil.parser.isoparser
-import fiscalyear
-from daterangeparser import parse as drp_parse_english
-from dateutil.rrule import MONTHLY, WEEKLY, YEARLY
-
-from .arbitrary_dateparser import DateParser
+from .cache import CacheEntry, CacheStatistics, ResultCache, expiry
+from .daterangeparser_german import grammar_german
 from .daterangeparser_german import parse_german as drp_parse_german
-from .model import Parser, TimeInterval, trange
+from .grammar import grammar_english
+from .grammar import parse_english as drp_parse_english
+from .metrics import POSTPROCESSING, Metrics, MetricsSink, StageStatistics
+from .model import Parser, ParseResult, TimeInterval, trange
+from .notation import CALENDAR_NOTATION
+from .notation import admissible as notation_admissible
+from .notation import parse as notation_parse
+from .router import Route, route
 
 if t.TYPE_CHECKING:
     import pandulum
+    from dateparser.date import DateDataParser
+
+    from .aio import AsyncParser
+    from .arbitrary_dateparser import DateParser
 
 
 # FIXME: Do not set timezone explicitly.
-arbitrary_parser_english = DateParser(tz="Europe/Berlin")
-arbitrary_parser_english.replaced_words["in"] = "this"
+DEFAULT_TIMEZONE = "Europe/Berlin"
+
+# Instances of `arbitrary-dateparser`, created on first use, one per language and timezone.
+arbitrary_parsers: t.Dict[t.Tuple[str, str], "DateParser"] = {}
+arbitrary_parsers_lock = threading.Lock()
+
+# Instances of `dateparser.date.DateDataParser`, created on first use, one per selection of languages and locales.
+date_data_parsers: t.Dict[t.Tuple[t.Optional[t.Tuple[str, ...]], t.Optional[t.Tuple[str, ...]]], "DateDataParser"] = {}
+date_data_parsers_lock = threading.Lock()
 
 
 before_midnight = dt.time(hour=23, minute=59, second=59, microsecond=999999)
@@ -51,50 +69,292 @@ class TimeIntervalParser:
         midnight_heuristics: bool = False,
         snap_hours: bool = False,
         return_tuple: bool = False,
+        tz: str = DEFAULT_TIMEZONE,
+        cache_size: t.Optional[int] = None,
+        languages: t.Optional[t.Sequence[str]] = None,
+        locales: t.Optional[t.Sequence[str]] = None,
+        metrics: t.Optional[MetricsSink] = None,
+        parser_order: t.Optional[t.Mapping[str, t.Sequence[str]]] = None,
     ):
+        self.tz = tz
+        # Languages and locales considered by `dateparser`, defaulting to all of them.
+        self.languages = tuple(languages) if languages is not None else None
+        self.locales = tuple(locales) if locales is not None else None
         self.default_start_time = default_start_time
         self.default_end_time = default_end_time
         self.return_tuple = return_tuple
         self.midnight_heuristics = midnight_heuristics
         self.snap_hours = snap_hours
+        # Receives attempts and latencies of each parser, and of post-processing. Disabled by default.
+        self.metrics = metrics
+        self.cache: t.Optional[ResultCache] = None
+        if cache_size is not None:
+            self.cache = ResultCache(maxsize=cache_size)
         self.parsers: t.List[Parser] = []
         self.use_all_parsers()
+        self._parser_order: t.Optional[t.Dict[str, t.Tuple[str, ...]]] = None
+        self.parser_order = parser_order
+        self._aio: t.Optional["AsyncParser"] = None
 
     def use_all_parsers(self):
+        self.clear_cache()
         self.parsers += [
-            Parser(name="DateRangeParser [en]", fun=drp_parse_english),
-            Parser(name="DateRangeParser [de]", fun=drp_parse_german),
-            Parser(name="arbitrary-dateparser [de]", fun=adp_parse_german),
-            Parser(name="arbitrary-dateparser [en]", fun=adp_parse_english),
-            Parser(name="DUDP [all]", fun=self.dudp_parse),
+            Parser(name=CALENDAR_NOTATION, fun=notation_parse, accepts=notation_admissible, clocked=True),
+            Parser(
+                name="DateRangeParser [en]", fun=drp_parse_english, accepts=grammar_english.admissible, clocked=True
+            ),
+            Parser(name="DateRangeParser [de]", fun=drp_parse_german, accepts=grammar_german.admissible, clocked=True),
+            Parser(name="arbitrary-dateparser [de]", fun=partial(adp_parse_german, tz=self.tz), clocked=True),
+            Parser(name="arbitrary-dateparser [en]", fun=partial(adp_parse_english, tz=self.tz), clocked=True),
+            Parser(name="DUDP [all]", fun=self.dudp_parse, clocked=True),
         ]
 
     def clear_parsers(self):
+        self.clear_cache()
         self.parsers = []
 
-    def add_parser(self, fun: t.Callable, name: str = "unknown"):
-        self.parsers.append(Parser(name=name, fun=fun))
+    def add_parser(self, fun: t.Callable, name: str = "unknown", accepts: t.Optional[t.Callable[[str], bool]] = None):
+        self.clear_cache()
+        self.parsers.append(Parser(name=name, fun=fun, accepts=accepts))
+
+    def clear_cache(self):
+        """
+        Discard cached results. Required after modifying `parsers` directly.
+        """
+        if self.cache is not None:
+            self.cache.clear()
+
+    def cache_statistics(self) -> t.Optional[CacheStatistics]:
+        """
+        Return hit, miss, and eviction counters of the result cache, if enabled.
+        """
+        if self.cache is None:
+            return None
+        return self.cache.statistics
 
-    def parse(self, when: str) -> t.Union[trange, TimeInterval]:
+    @property
+    def parser_order(self) -> t.Optional[t.Dict[str, t.Tuple[str, ...]]]:
+        """
+        The order of parsers pinned per shape of the expression, by name, usually learned using `aika.adaptive`.
+
+        Without pinning, the order of `parsers` is used. Pinning can change results.
+        """
+        return self._parser_order
+
+    @parser_order.setter
+    def parser_order(self, value: t.Optional[t.Mapping[str, t.Sequence[str]]]):
+        self.clear_cache()
+        self._parser_order = {shape: tuple(names) for shape, names in value.items()} if value else None
+
+    def stage_statistics(self) -> t.Optional[t.Dict[str, StageStatistics]]:
+        """
+        Return attempts, successes, failures, and latencies of each parser and of post-processing.
+
+        Requires the `metrics` sink to be a `Metrics` instance.
+        """
+        if not isinstance(self.metrics, Metrics):
+            return None
+        return self.metrics.snapshot()
+
+    def route(self, when: str) -> Route:
+        """
+        Select the parsers to try for an expression, skipping those which are certain to fail.
+        """
+        return route(when, self.parsers, order=self._parser_order)
+
+    def parse(self, when: str, now: t.Optional[dt.datetime] = None) -> t.Union[trange, TimeInterval]:
         """
         Parse date range from textual expression.
+
+        Relative expressions are resolved against the reference time `now`,
+        defaulting to the current time. Naive datetimes are interpreted as
+        local time. Parsing with an explicit reference time does not use the
+        result cache.
         """
         if not when:
             when = "now"
 
+        if now is None and self.cache is not None and when not in self.NOW:
+            date_start, date_end = self.parse_cached(when)
+        else:
+            date_start, date_end = self.adjust(when, *self.run_parsers(when, now=now or current_time()))
+
+        if self.return_tuple:
+            return date_start, date_end
+
+        return TimeInterval(date_start, date_end)
+
+    def parse_cached(self, when: str) -> trange:
+        """
+        Parse date range from textual expression, using the result cache.
+
+        Failed expressions are cached, too, and raise the same error again.
+        """
+        cache = t.cast(ResultCache, self.cache)
+        key = (
+            when,
+            self.tz,
+            self.snap_hours,
+            self.midnight_heuristics,
+            self.default_start_time,
+            self.default_end_time,
+            self.languages,
+            self.locales,
+        )
+        entry = cache.get(key)
+        if entry is not None:
+            if entry.error is not None:
+                raise ValueError(entry.error)
+            return entry.value
+
+        try:
+            result, name = self.run_cascade(when, now=current_time())
+        except ValueError as ex:
+            expires = expiry(when, None, self.tz)
+            if expires is not None:
+                cache.put(key, CacheEntry(value=None, error=str(ex), expires=expires))
+            raise
+
+        value = self.adjust(when, *result)
+        expires = expiry(when, result, self.tz, parser=name)
+        if expires is not None:
+            cache.put(key, CacheEntry(value=value, error=None, expires=expires))
+        return value
+
+    def parse_many(
+        self, expressions: t.Iterable[str], window: int = 1024, now: t.Optional[dt.datetime] = None
+    ) -> t.Iterator[ParseResult]:
+        """
+        Parse many textual expressions lazily, yielding one `ParseResult` per expression, in input order.
+
+        Instead of raising, failed expressions yield a result carrying the error.
+        All expressions are parsed relative to the same reference time `now`,
+        defaulting to the current time when the first expression is parsed.
+        Outcomes of the `window` most recently used distinct expressions are
+        reused for repeated expressions, so memory use is bounded.
+
+        The result cache is not used, because the reference time is fixed.
+        """
+        if window < 1:
+            raise ValueError(f"Window size must be positive: {window}")
+        recent: "OrderedDict[str, t.Union[trange, Exception]]" = OrderedDict()
+        for when in expressions:
+            if now is None:
+                now = current_time()
+            try:
+                outcome = recent[when]
+                recent.move_to_end(when)
+            except KeyError:
+                try:
+                    outcome = self.adjust(when or "now", *self.run_parsers(when or "now", now=now))
+                except Exception as ex:
+                    outcome = ex
+                recent[when] = outcome
+                if len(recent) > window:
+                    recent.popitem(last=False)
+            if isinstance(outcome, Exception):
+                yield ParseResult(when=when, error=outcome)
+            elif self.return_tuple:
+                yield ParseResult(when=when, value=outcome)
+            else:
+                yield ParseResult(when=when, value=TimeInterval(*outcome))
+
+    @property
+    def aio(self) -> "AsyncParser":
+        """
+        The asyncio adapter used by `aparse` and `aparse_many`. Replace it to configure its executor and concurrency.
+        """
+        if self._aio is None:
+            from .aio import AsyncParser
+
+            self._aio = AsyncParser(self)
+        return self._aio
+
+    @aio.setter
+    def aio(self, value: "AsyncParser"):
+        self._aio = value
+
+    async def aparse(self, when: str, now: t.Optional[dt.datetime] = None) -> t.Union[trange, TimeInterval]:
+        """
+        Parse date range from textual expression, without blocking the event loop.
+
+        Concurrent requests for the same expression are merged into a single parse.
+        """
+        return await self.aio.aparse(when, now=now)
+
+    def aparse_many(
+        self, expressions: t.Union[t.Iterable[str], t.AsyncIterable[str]], now: t.Optional[dt.datetime] = None
+    ) -> t.AsyncIterator[ParseResult]:
+        """
+        Parse textual expressions from an iterable or async iterable, without blocking the event loop.
+
+        Yields one `ParseResult` per expression, in input order.
+        """
+        return self.aio.aparse_many(expressions, now=now)
+
+    def run_parsers(self, when: str, now: t.Optional[dt.datetime] = None) -> trange:
+        """
+        Run the parser cascade, returning the result of the first parser which succeeds.
+
+        `now` is the reference time for relative expressions, defaulting to the
+        current time. It is only propagated to parsers flagged as `clocked`,
+        converted into the timezone `tz`. Naive datetimes are interpreted as local time.
+        """
+        return self.run_cascade(when, now=now)[0]
+
+    def run_cascade(self, when: str, now: t.Optional[dt.datetime] = None) -> t.Tuple[trange, str]:
+        """
+        Run the parser cascade like `run_parsers`, also returning the name of the parser which succeeded.
+        """
         date_start: t.Optional[dt.datetime] = None
         date_end: t.Optional[dt.datetime] = None
+        name = ""
+
+        # Clocked parsers read the calendar date of `now` in the configured timezone, not in the one of the host.
+        if now is not None:
+            now = now.astimezone(get_timezone(self.tz))
 
-        for parser in self.parsers:
+        metrics = self.metrics
+        started = 0.0
+        for parser in self.route(when).parsers:
+            if metrics is not None:
+                started = time.perf_counter()
             try:
-                date_start, date_end = parser.fun(when)
-                break
+                if now is not None and parser.clocked:
+                    date_start, date_end = parser.fun(when, now=now)
+                else:
+                    date_start, date_end = parser.fun(when)
             except Exception as ex:
-                logger.debug(f"Parsing date range failed ({parser.name}) for '{when}': {ex}")
+                if metrics is not None:
+                    metrics.record(parser.name, time.perf_counter() - started, False)
+                logger.debug("Parsing date range failed (%s) for '%s': %s", parser.name, when, ex)
+                continue
+            if metrics is not None:
+                metrics.record(parser.name, time.perf_counter() - started, True)
+            name = parser.name
+            break
 
         if date_start is None:
             raise ValueError(f"Failed detecting start date: {when}")
 
+        return (date_start, date_end), name
+
+    def adjust(self, when: str, date_start: dt.datetime, date_end: t.Optional[dt.datetime]) -> trange:
+        """
+        Apply `snap_hours` and `midnight_heuristics` to a parsing result.
+        """
+        if self.metrics is None:
+            return self.postprocess(when, date_start, date_end)
+        started = time.perf_counter()
+        ok = False
+        try:
+            result = self.postprocess(when, date_start, date_end)
+            ok = True
+            return result
+        finally:
+            self.metrics.record(POSTPROCESSING, time.perf_counter() - started, ok)
+
+    def postprocess(self, when: str, date_start: dt.datetime, date_end: t.Optional[dt.datetime]) -> trange:
         # A specific datetime must not be changed through `default_start_time`.
         is_now = when in self.NOW
         if self.snap_hours and not is_now:
@@ -114,16 +374,13 @@ class TimeIntervalParser:
                     time = dt.time(hour=23, minute=59, second=59, microsecond=999999)
                 date_end = dt.datetime.combine(date_end, time)
 
-        if self.return_tuple:
-            return date_start, date_end
+        return date_start, date_end
 
-        return TimeInterval(date_start, date_end)
-
-    def parse_single(self, when: str) -> dt.datetime:
+    def parse_single(self, when: str, now: t.Optional[dt.datetime] = None) -> dt.datetime:
         """
         Parse single date from textual expression.
         """
-        ti = self.parse(when)
+        ti = self.parse(when, now=now)
         if isinstance(ti, TimeInterval):
             return ti.start
         elif isinstance(ti, tuple):
@@ -131,13 +388,26 @@ class TimeIntervalParser:
         else:
             raise TypeError(f"Invalid time interval type: {type(ti)}")
 
-    def dudp_parse(self, when: str) -> trange:
+    def dudp_parse(self, when: str, now: t.Optional[dt.datetime] = None) -> trange:
         """
         Parse date range using `python-dateutil` and `dateparser` libraries.
         """
+        import dateutil.parser
+        import fiscalyear
+        from dateutil.rrule import MONTHLY, WEEKLY, YEARLY
+
+        # Reference time, as naive datetime in the timezone of `now`, like `datetime.datetime.now()`.
+        today: t.Optional[dt.datetime] = None
+        if now is not None:
+            today = now.replace(tzinfo=None)
 
         if ".." in when:
-            return t.cast(trange, when.split(".."))
+            # Ranges like `2025-01-01..2025-02-01`, optionally open like `2025-01-01..*`.
+            lower, _, upper = when.partition("..")
+            default = today and today.replace(hour=0, minute=0, second=0, microsecond=0)
+            start = parse_timestamp(lower, default)
+            end = parse_timestamp(upper, default) if upper.strip() not in ("", "*") else None
+            return start, end
 
         if "Q" in when:
             year, quarter = when.split("Q")
@@ -158,9 +428,12 @@ class TimeIntervalParser:
             try:
                 t_start = dateutil.parser.isoparse(when)
             except Exception:
-                t_start = dateutil.parser.parse(when)
+                default = today and today.replace(hour=0, minute=0, second=0, microsecond=0)
+                t_start = dateutil.parser.parse(when, default=default)
         except dateutil.parser.ParserError:
-            parser = dateparser.date.DateDataParser()
+            parser = get_date_data_parser(self.languages, self.locales)
+            if today is not None:
+                parser = with_relative_base(parser, today)
             response = parser.get_date_data(when)
             t_start = response.date_obj
             if self.snap_hours:
@@ -178,27 +451,126 @@ class TimeIntervalParser:
         elif interval == WEEKLY:
             t_end = t_start + dt.timedelta(days=7)
         else:
-            t_end = dt.datetime.today().replace(hour=23, minute=59, second=59, microsecond=999999)
+            t_end = (today or dt.datetime.today()).replace(hour=23, minute=59, second=59, microsecond=999999)
 
         return t_start, t_end
 
 
-def adp_parse_english(when: str) -> trange:
+def parse_timestamp(text: str, default: t.Optional[dt.datetime] = None) -> dt.datetime:
     """
-    Parse date range using `arbitrary-dateparser`. English variant.
+    Parse a single timestamp using `python-dateutil`, trying ISO 8601 first.
+
+    Missing components are taken from `default`. Raises `ValueError` for invalid timestamps.
     """
-    return from_pendulum(arbitrary_parser_english(when))
+    import dateutil.parser
+
+    text = text.strip()
+    try:
+        return dateutil.parser.isoparse(text)
+    except ValueError:
+        return dateutil.parser.parse(text, default=default)
 
 
-def adp_parse_german(when: str) -> trange:
+def current_time() -> dt.datetime:
     """
-    Parse date range using `arbitrary-dateparser`. German variant.
+    Return the current time, used as reference time when none is given.
+    """
+    return dt.datetime.now(dt.timezone.utc)
+
+
+@lru_cache(maxsize=None)
+def get_timezone(tz: str) -> dt.tzinfo:
+    """
+    Return the `tzinfo` instance for a timezone name, like `Europe/Berlin`.
+    """
+    import pendulum
+
+    return pendulum.timezone(tz)
+
+
+def get_arbitrary_parser(language: str, tz: str = DEFAULT_TIMEZONE) -> "DateParser":
+    """
+    Return the `arbitrary-dateparser` instance for the given language and timezone.
+
+    Instances are expensive to create, so they are created on first use, and reused afterwards.
+    """
+    key = (language, tz)
+    try:
+        return arbitrary_parsers[key]
+    except KeyError:
+        pass
+    with arbitrary_parsers_lock:
+        if key not in arbitrary_parsers:
+            arbitrary_parsers[key] = create_arbitrary_parser(language, tz)
+        return arbitrary_parsers[key]
+
+
+def get_date_data_parser(
+    languages: t.Optional[t.Tuple[str, ...]] = None, locales: t.Optional[t.Tuple[str, ...]] = None
+) -> "DateDataParser":
+    """
+    Return the `dateparser` instance for the given languages and locales.
+
+    Without any languages or locales, `dateparser` detects the language of each
+    expression across all of its locales, which is slow. Restrict them if possible.
     """
-    from .dateparser_german import DateParserGerman
+    key = (languages, locales)
+    try:
+        return date_data_parsers[key]
+    except KeyError:
+        pass
+    with date_data_parsers_lock:
+        if key not in date_data_parsers:
+            from dateparser.date import DateDataParser
+
+            date_data_parsers[key] = DateDataParser(languages=languages, locales=locales)
+        return date_data_parsers[key]
+
+
+def with_relative_base(parser: "DateDataParser", now: dt.datetime) -> "DateDataParser":
+    """
+    Return a shallow copy of a `dateparser` instance, resolving relative expressions against `now`.
+
+    `Settings.replace` would register a new settings instance per reference time,
+    which is never released, and `dateparser` keys its dictionary caches by it.
+    The derived settings keep the registry key of the original ones instead.
+    """
+    settings = object.__new__(type(parser._settings))
+    vars(settings).update(vars(parser._settings))
+    settings.RELATIVE_BASE = now
+    parser = copy.copy(parser)
+    parser._settings = settings
+    return parser
+
 
-    arbitrary_parser_german = DateParserGerman(tz="Europe/Berlin")
+def create_arbitrary_parser(language: str, tz: str) -> "DateParser":
+    if language == "en":
+        from .arbitrary_dateparser import DateParser
 
-    return from_pendulum(arbitrary_parser_german(when))
+        parser = DateParser(tz=tz)
+        parser.replaced_words["in"] = "this"
+        parser.compile()
+        return parser
+    elif language == "de":
+        from .dateparser_german import DateParserGerman
+
+        return DateParserGerman(tz=tz)
+    else:
+        raise ValueError(f"Unsupported language for arbitrary-dateparser: {language}")
+
+
+def adp_parse_english(when: str, tz: str = DEFAULT_TIMEZONE, now: t.Optional[dt.datetime] = None) -> trange:
+    """
+    Parse date range using `arbitrary-dateparser`. English variant.
+    """
+    return from_pendulum(get_arbitrary_parser("en", tz)(when, now=now))
+
+
+def adp_parse_german(when: str, tz: str = DEFAULT_TIMEZONE, now: t.Optional[dt.datetime] = None) -> trange:
+    """
+    Parse date range using `arbitrary-dateparser`. German variant.
+    """
+    return from_pendulum(get_arbitrary_parser("de", tz)(when, now=now))
 
 
 def from_pendulum(period: "pandulum.Period") -> trange:
@@ -220,3 +592,10 @@ class DaterangeExpression(TimeIntervalParser):
         kwargs.setdefault("midnight_heuristics", True)
         kwargs.setdefault("return_tuple", True)
         super().__init__(*args, **kwargs)
+
+
+def __getattr__(name: str):
+    # The English `arbitrary-dateparser` instance for the default timezone, created on first use.
+    if name == "arbitrary_parser_english":
+        return get_arbitrary_parser("en", DEFAULT_TIMEZONE)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,29 +4,41 @@ The German variant of the DateParser module from the arbitrary-dateparser packag
 https://pypi.org/project/arbitrary-dateparser/
 """
 
-import calendar
-import locale
-import re
+from functools import partial
 from itertools import product
-from typing import List
 
-import pendulum
 from pendulum import WeekDay
 
-from aika.util import LocaleManager
-
-from .arbitrary_dateparser import DateParser
-
-try:
-    with LocaleManager("de_DE.UTF-8"):
-        MONTH_NAMES = [calendar.month_name[x].lower() for x in range(1, 13)]
-        MONTH_NAMES_ABBREVIATED = [calendar.month_abbr[x].lower() for x in range(1, 13)]
-
-        # Start with Sunday for Indexing.
-        DAY_NAMES = [calendar.day_name[x].lower() for x in range(7)]
-        DAY_NAMES_ABBREVIATED = [calendar.day_abbr[x].lower() for x in range(7)]
-except locale.Error as ex:
-    raise NotImplementedError("German locales not available on this system") from ex
+from .arbitrary_dateparser import (
+    DateParser,
+    FormatIndex,
+    PhraseTable,
+    identity,
+    month_of,
+    period_of,
+    previous_month_of,
+)
+
+# Calendar names, like `calendar` provides them for the `de_DE` locale, shipped as
+# static data, so the module does not need to switch the process-wide locale.
+# Indexed like `calendar.month_name[1:]` and `calendar.day_name`, starting with Monday.
+MONTH_NAMES = [
+    "januar",
+    "februar",
+    "märz",
+    "april",
+    "mai",
+    "juni",
+    "juli",
+    "august",
+    "september",
+    "oktober",
+    "november",
+    "dezember",
+]
+MONTH_NAMES_ABBREVIATED = ["jan", "feb", "mär", "apr", "mai", "jun", "jul", "aug", "sep", "okt", "nov", "dez"]
+DAY_NAMES = ["montag", "dienstag", "mittwoch", "donnerstag", "freitag", "samstag", "sonntag"]
+DAY_NAMES_ABBREVIATED = ["mo", "di", "mi", "do", "fr", "sa", "so"]
 
 
 # German language has masculine, feminine, and neuter forms for entities of calendar nouns.
@@ -48,6 +60,9 @@ PREVIOUS_N = "vorheriges"
 
 
 class DateParserGerman(DateParser):
+    # The phrase for the current point in time, which is not part of the phrase tables.
+    now_phrase = "jetzt"
+
     def __init__(
         self,
         tz="local",
@@ -83,11 +98,6 @@ class DateParserGerman(DateParser):
             "-",
         }
 
-        self.period_transformations = [lambda s: s.lower(), lambda s: s.strip()]
-
-        # These variables modify dates
-        self.pre_word_replace_date_transformations = [lambda s: s.lower(), lambda s: s.strip()]
-
         # Formats are separated by spaces only. So convert any other separator
         # you want to a space.
         self.space_strings = {"-", "/", ","}
@@ -113,18 +123,8 @@ class DateParserGerman(DateParser):
         for i, month in enumerate(MONTH_NAMES):
             self.replaced_words[month] = MONTH_NAMES_ABBREVIATED[i]
 
-        # These variables modify dates
-        self.unfiltered_words: List[str]
-        self.post_word_replace_date_transformations = [
-            lambda s: " ".join(x for x in s.split(" ") if x in self.unfiltered_words or not x.isalpha()),
-        ]
-
-        self.regex_replacements = {
-            re.compile(x): y
-            for x, y in {
-                r"\s+": " ",
-            }.items()
-        }
+        # German does not use suffixes for ordinal numbers
+        self.ordinal_suffixes = ()
 
         _day_formats = ("DD", "D")  # {d}
         _month_formats = ("MMMM", "MMM", "MM", "M")  # {m}
@@ -166,6 +166,7 @@ class DateParserGerman(DateParser):
             return priority
 
         self.date_formats = sorted(self.date_formats, key=_format_sorter, reverse=True)
+        self.format_index = FormatIndex(self.date_formats)
 
         # Words that are not filtered (replacements -> this -> regex)
         self.unfiltered_words = unfiltered_words
@@ -198,86 +199,81 @@ class DateParserGerman(DateParser):
                 "of",
             )
 
+        self.compile()
         self.refresh_dates()
 
-    def refresh_dates(self):
+    @classmethod
+    def build_phrase_tables(cls, today):
         """
-        Anything that sets an attribute with a datetime relative to the
-        present is set here.
+        Build the tables of date and period phrases, relative to `today`.
+
+        The `jetzt` phrase is not part of the tables, because it changes on each call.
         """
-        self.now = pendulum.now(self.tz)
-        self.today = pendulum.today(self.tz)
-        self.this_week = self.today.start_of("week")
-        self.next_week = self.this_week.add(weeks=1)
-        self.previous_week = self.this_week.subtract(weeks=1)
-        self.this_month = self.today.start_of("month")
-        self.next_month = self.this_month.add(months=1)
-        self.previous_month = self.this_month.subtract(months=1)
-        self.this_year = self.today.start_of("year")
-        self.next_year = self.this_year.add(years=1)
-        self.previous_year = self.this_year.subtract(years=1)
+        this_week = today.start_of("week")
+        this_month = today.start_of("month")
+        next_month = this_month.add(months=1)
+        previous_month = this_month.subtract(months=1)
+        this_year = today.start_of("year")
 
         # Strings with direct date translations
-        self.date_phrases = {
-            "jetzt": self.now,
-            "heute": self.today,
-            "morgen": self.today.add(days=1),
-            "gestern": self.today.subtract(days=1),
-            f"{THIS_MN} monat": self.this_month,
-            f"{THIS_MG} monat": self.this_month,
-            f"{NEXT_MN} monat": self.next_month,
-            f"{NEXT_MG} monat": self.next_month,
-            f"{PREVIOUS_MN} monat": self.previous_month,
-            f"{PREVIOUS_MG} monat": self.previous_month,
-            f"{THIS_F} woche": self.this_week,
-            f"{NEXT_F} woche": self.next_week,
-            f"{PREVIOUS_F} woche": self.previous_week,
-            f"{THIS_N} jahr": self.this_year,
-            f"{NEXT_N} jahr": self.next_year,
-            f"{PREVIOUS_N} jahr": self.previous_year,
-        }
+        date_phrases = PhraseTable(
+            {
+                "heute": lambda: today,
+                "morgen": lambda: today.add(days=1),
+                "gestern": lambda: today.subtract(days=1),
+                f"{THIS_MN} monat": lambda: this_month,
+                f"{THIS_MG} monat": lambda: this_month,
+                f"{NEXT_MN} monat": lambda: next_month,
+                f"{NEXT_MG} monat": lambda: next_month,
+                f"{PREVIOUS_MN} monat": lambda: previous_month,
+                f"{PREVIOUS_MG} monat": lambda: previous_month,
+                f"{THIS_F} woche": lambda: this_week,
+                f"{NEXT_F} woche": lambda: this_week.add(weeks=1),
+                f"{PREVIOUS_F} woche": lambda: this_week.subtract(weeks=1),
+                f"{THIS_N} jahr": lambda: this_year,
+                f"{NEXT_N} jahr": lambda: this_year.add(years=1),
+                f"{PREVIOUS_N} jahr": lambda: this_year.subtract(years=1),
+            }
+        )
 
         # Strings with direct period translations
-        self.period_phrases = {
-            f"{THIS_MN} monat": pendulum.Interval(self.this_month, self.this_month.end_of("month")),
-            f"{THIS_MG} monat": pendulum.Interval(self.this_month, self.this_month.end_of("month")),
-            f"{NEXT_MN} monat": pendulum.Interval(self.next_month, self.next_month.end_of("month")),
-            f"{NEXT_MG} monat": pendulum.Interval(self.next_month, self.next_month.end_of("month")),
-            f"{PREVIOUS_MN} monat": pendulum.Interval(self.previous_month, self.previous_month.end_of("month")),
-            f"{PREVIOUS_MG} monat": pendulum.Interval(self.previous_month, self.previous_month.end_of("month")),
-            f"{THIS_F} woche": pendulum.Interval(self.this_week, self.this_week.end_of("week")),
-            f"{NEXT_F} woche": pendulum.Interval(self.next_week, self.next_week.end_of("week")),
-            f"{PREVIOUS_F} woche": pendulum.Interval(self.previous_week, self.previous_week.end_of("week")),
-            f"{THIS_N} jahr": pendulum.Interval(self.this_year, self.this_year.end_of("year")),
-            f"{PREVIOUS_N} jahr": pendulum.Interval(self.next_year, self.next_year.end_of("year")),
-        }
-
-        def set_phrase(*prefixes, key, value):
+        period_phrases = PhraseTable(
+            {
+                f"{THIS_MN} monat": partial(period_of, date_phrases, f"{THIS_MN} monat", "month"),
+                f"{THIS_MG} monat": partial(period_of, date_phrases, f"{THIS_MG} monat", "month"),
+                f"{NEXT_MN} monat": partial(period_of, date_phrases, f"{NEXT_MN} monat", "month"),
+                f"{NEXT_MG} monat": partial(period_of, date_phrases, f"{NEXT_MG} monat", "month"),
+                f"{PREVIOUS_MN} monat": partial(period_of, date_phrases, f"{PREVIOUS_MN} monat", "month"),
+                f"{PREVIOUS_MG} monat": partial(period_of, date_phrases, f"{PREVIOUS_MG} monat", "month"),
+                f"{THIS_F} woche": partial(period_of, date_phrases, f"{THIS_F} woche", "week"),
+                f"{NEXT_F} woche": partial(period_of, date_phrases, f"{NEXT_F} woche", "week"),
+                f"{PREVIOUS_F} woche": partial(period_of, date_phrases, f"{PREVIOUS_F} woche", "week"),
+                f"{THIS_N} jahr": partial(period_of, date_phrases, f"{THIS_N} jahr", "year"),
+                f"{PREVIOUS_N} jahr": partial(period_of, date_phrases, f"{NEXT_N} jahr", "year"),
+            }
+        )
+
+        def set_phrase(*prefixes, key, factory):
             for prefix in prefixes:
                 key_effective = f"{prefix} {key}"
-                self.date_phrases[key_effective] = value
+                date_phrases.factories[key_effective] = factory
 
         for i, day in enumerate(DAY_NAMES_ABBREVIATED):
-            set_phrase(NEXT_MN, NEXT_MG, key=day, value=self.today.next(WeekDay(i)))
-            set_phrase(PREVIOUS_MN, PREVIOUS_MG, key=day, value=self.today.previous(WeekDay(i)))
+            set_phrase(NEXT_MN, NEXT_MG, key=day, factory=partial(today.next, WeekDay(i)))
+            set_phrase(PREVIOUS_MN, PREVIOUS_MG, key=day, factory=partial(today.previous, WeekDay(i)))
 
-            if self.today.day_of_week == i:
-                self.date_phrases[day] = self.today
-                set_phrase(THIS_MN, THIS_MG, key=day, value=self.today)
+            if today.day_of_week == i:
+                date_phrases.factories[day] = partial(identity, today)
+                set_phrase(THIS_MN, THIS_MG, key=day, factory=partial(identity, today))
             else:
-                self.date_phrases[day] = self.today.next(WeekDay(i))
-                set_phrase(THIS_MN, THIS_MG, key=day, value=self.today.next(WeekDay(i)))
+                date_phrases.factories[day] = partial(today.next, WeekDay(i))
+                set_phrase(THIS_MN, THIS_MG, key=day, factory=partial(today.next, WeekDay(i)))
 
         for i, month in enumerate(MONTH_NAMES_ABBREVIATED):
-            set_phrase(NEXT_MN, NEXT_MG, key=month, value=self.next_month.add(months=(i + 1) - self.next_month.month))
-            set_phrase(
-                PREVIOUS_MN,
-                PREVIOUS_MG,
-                key=month,
-                value=self.previous_month.subtract(months=(i + 1) - self.previous_month.month),
-            )
-            self.date_phrases[month] = self.this_month.add(months=(i + 1) - self.this_month.month)
-            set_phrase(THIS_MN, THIS_MG, key=month, value=self.this_month.add(months=(i + 1) - self.this_month.month))
+            set_phrase(NEXT_MN, NEXT_MG, key=month, factory=partial(month_of, next_month, i + 1))
+            set_phrase(PREVIOUS_MN, PREVIOUS_MG, key=month, factory=partial(previous_month_of, previous_month, i + 1))
+            date_phrases.factories[month] = partial(month_of, this_month, i + 1)
+            set_phrase(THIS_MN, THIS_MG, key=month, factory=partial(month_of, this_month, i + 1))
 
             month_phrases = [
                 f"{NEXT_MN} {month}",
@@ -289,6 +285,6 @@ class DateParserGerman(DateParser):
                 f"{THIS_MG} {month}",
             ]
             for month_phrase in month_phrases:
-                self.period_phrases[month_phrase] = pendulum.Interval(
-                    self.date_phrases[month_phrase], self.date_phrases[month_phrase].end_of("month")
-                )
+                period_phrases.factories[month_phrase] = partial(period_of, date_phrases, month_phrase, "month")
+
+        return date_phrases, period_phrases
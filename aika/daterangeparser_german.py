@@ -15,10 +15,9 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import datetime
+import typing as t
 
-from daterangeparser.parse_date_range import check_day, post_process
-from pyparsing import Group, Literal, Optional, ParseException, Word, nums, oneOf, stringEnd
-
+from aika.grammar import Grammar, local_date, parse_daterange
 from aika.model import trange
 
 MONTHS = {
@@ -51,6 +50,11 @@ MONTHS = {
 }
 
 
+DAYS = "Mo Montag Di Dienstag Mi Mittwoch Do Donnerstag Fr Freitag Sa Samstag So Sonntag"
+SEPARATORS = "- -- bis \u2013 \u2014 ->"
+IGNORABLES = ", von vom ab anfang zum"
+
+
 def month_to_number(tokens):
     """
     Converts a given month in string format to the equivalent month number.
@@ -63,10 +67,12 @@ def month_to_number(tokens):
 
 def create_daterangeparser_german():
     """Creates the parser using PyParsing functions."""
+    from daterangeparser.parse_date_range import check_day
+    from pyparsing import Group, Literal, Optional, Word, nums, oneOf, stringEnd
 
     # Day details (day number, superscript and day name)
     daynum = Word(nums, max=2)
-    day = oneOf("Mo Montag Di Dienstag Mi Mittwoch Do Donnerstag Fr Freitag Sa Samstag So Sonntag", caseless=True)
+    day = oneOf(DAYS, caseless=True)
 
     full_day_string = daynum + Optional(Literal(".").suppress())
     full_day_string.setParseAction(check_day)
@@ -97,10 +103,10 @@ def create_daterangeparser_german():
     )
 
     # Possible separators
-    separator = oneOf("- -- bis \u2013 \u2014 ->", caseless=True)
+    separator = oneOf(SEPARATORS, caseless=True)
 
     # Strings to completely ignore (whitespace ignored by default)
-    ignoreable_chars = oneOf(", von vom ab anfang zum", caseless=True)
+    ignoreable_chars = oneOf(IGNORABLES, caseless=True)
 
     # Final putting together of everything
     daterange = (
@@ -114,7 +120,19 @@ def create_daterangeparser_german():
     return daterange
 
 
-def parse_german(text: str, allow_implicit: bool = True) -> trange:
+# The words of the grammar, see `create_daterangeparser_german`.
+VOCABULARY = [
+    *MONTHS.keys(),
+    *DAYS.split(),
+    *"am pm".split(),
+    *[word for word in SEPARATORS.split() if word.isalpha()],
+    *[word for word in IGNORABLES.split() if word.isalpha()],
+]
+
+grammar_german = Grammar(create_daterangeparser_german, vocabulary=VOCABULARY)
+
+
+def parse_german(text: str, allow_implicit: bool = True, now: t.Optional[datetime.datetime] = None) -> trange:
     """
     Parses a date range string and returns the start and end as datetimes.
 
@@ -151,47 +169,9 @@ def parse_german(text: str, allow_implicit: bool = True) -> trange:
     :param allow_implicit: If implicit dates are allowed. For example,
     string 'May' by default treated as range
            from May, 1st to May, 31th. Setting allow_implicit to False helps avoid it.
+    :param now: The reference time for implicit years, defaults to the current time
     :return: A tuple ``(start, end)`` where each element is a datetime object.
     If the string only defines a single date then the tuple is ``(date, None)``.
     All times in the datetime objects are set to 00:00 as this function only parses dates.
     """
-    parser = create_daterangeparser_german()
-
-    result = parser.parseString(text)
-    res = post_process(result, allow_implicit)
-
-    # Create standard dd/mm/yyyy strings and then convert to Python datetime
-    # objects
-    if "year" not in res.start:
-        # in case only separator was given
-        raise ParseException("Couldn't parse resulting datetime")
-
-    try:
-        start_str = "%(day)s/%(month)s/%(year)s" % res.start
-        start_datetime = datetime.datetime.strptime(start_str, "%d/%m/%Y")
-    except ValueError as ex:
-        raise ParseException("Couldn't parse resulting datetime") from ex
-
-    if res.end is None:
-        return start_datetime, None
-    elif not res.end:
-        raise ParseException("Couldn't parse resulting datetime")
-    else:
-        try:
-            if "month" not in res.end:
-                res.end["month"] = res.start["month"]
-            end_str = "%(day)s/%(month)s/%(year)s" % res.end
-            end_datetime = datetime.datetime.strptime(end_str, "%d/%m/%Y")
-        except ValueError as ex:
-            raise ParseException("Couldn't parse resulting datetime") from ex
-
-        if end_datetime < start_datetime:
-            # end is before beginning!
-            # This is probably caused by a date straddling the change of year
-            # without the year being given
-            # So, we assume that the start should be the previous year
-            res.start["year"] = res.start["year"] - 1
-            start_str = "%(day)s/%(month)s/%(year)s" % res.start
-            start_datetime = datetime.datetime.strptime(start_str, "%d/%m/%Y")
-
-        return start_datetime, end_datetime
+    return parse_daterange(grammar_german, text, allow_implicit, today=local_date(now))
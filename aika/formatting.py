@@ -0,0 +1,184 @@
+# Copyright (c) 2026, The Panodata developers and contributors.
+# Distributed under the terms of the LGPL license, see LICENSE.
+"""
+Render time intervals as query clauses, one by one, or many at once.
+
+Instead of `strftime`, datetime fields are rendered using precompiled
+`%`-format layouts, which is considerably faster. When rendering many
+intervals, each distinct naive value is rendered only once, because values
+like day boundaries repeat a lot.
+"""
+
+import dataclasses
+import datetime as dt
+import operator
+import typing as t
+
+if t.TYPE_CHECKING:
+    from .columnar import IntervalArray
+    from .model import TimeInterval
+
+# Fields of a naive datetime: year, month, day, hour, minute, second, microsecond.
+Fields = t.Tuple[int, int, int, int, int, int, int]
+YEAR, MONTH, DAY, HOUR, MINUTE, SECOND, MICROSECOND = range(7)
+
+datetime_fields = t.cast(
+    t.Callable[[dt.datetime], Fields],
+    operator.attrgetter("year", "month", "day", "hour", "minute", "second", "microsecond"),
+)
+
+EPOCH = dt.datetime(1970, 1, 1)
+
+
+@dataclasses.dataclass(frozen=True)
+class Layout:
+    """
+    A datetime layout, equivalent to the `strftime` format `reference`.
+
+    `pattern` is a `%`-format string for the datetime fields selected by `fields`.
+    """
+
+    reference: str
+    pattern: str
+    fields: t.Tuple[int, ...]
+
+    def __post_init__(self):
+        object.__setattr__(self, "getter", operator.itemgetter(*self.fields))
+
+    def __call__(self, fields: Fields) -> str:
+        # `strftime` pads years below 1000 differently across platforms, so defer to it.
+        if fields[YEAR] < 1000:
+            return dt.datetime(*fields).strftime(self.reference)
+        return self.pattern % self.getter(fields)  # type: ignore[attr-defined]
+
+
+def iso_layout(fields: Fields) -> str:
+    """
+    Render fields like `datetime.isoformat`.
+    """
+    if fields[MICROSECOND]:
+        return "%04d-%02d-%02dT%02d:%02d:%02d.%06d" % fields
+    return "%04d-%02d-%02dT%02d:%02d:%02d" % fields[:MICROSECOND]
+
+
+@dataclasses.dataclass(frozen=True)
+class Format:
+    """
+    A query clause format for time intervals.
+
+    `closed` and `open` are `%`-format strings for intervals with and without end.
+    Values are rendered by `layout` from their fields, or by `method` from a
+    `datetime`, when given. The latter is used for timezone-aware values.
+    """
+
+    layout: t.Callable[[Fields], str]
+    closed: str
+    open: str
+    method: t.Optional[t.Callable[[dt.datetime], str]] = None
+
+    def value(self, value: dt.datetime) -> str:
+        if self.method is not None:
+            return self.method(value)
+        return self.layout(datetime_fields(value))
+
+    def render(self, start: dt.datetime, end: t.Optional[dt.datetime]) -> str:
+        if end is None:
+            return self.open % self.value(start)
+        return self.closed % (self.value(start), self.value(end))
+
+    def render_many(self, intervals: t.Union[t.Iterable["TimeInterval"], "IntervalArray"]) -> t.List[str]:
+        from .columnar import IntervalArray
+
+        closed, open_ = self.closed, self.open
+        if isinstance(intervals, IntervalArray) and not intervals.aware:
+            columns = RenderedColumn(self.layout)
+            return [
+                closed % (columns[start], columns[end]) if valid else open_ % columns[start]
+                for start, end, valid in zip(intervals.starts, intervals.ends, intervals.mask)
+            ]
+        values = RenderedValues(self)
+        return [
+            open_ % values[interval.start]
+            if interval.end is None
+            else closed % (values[interval.start], values[interval.end])
+            for interval in intervals
+        ]
+
+
+class RenderedValues(t.Dict[dt.datetime, str]):
+    """
+    Rendered datetimes of a batch, computed on first lookup.
+
+    Only naive values are retained: Timezone-aware values of the same instant
+    compare equal, but render differently.
+    """
+
+    def __init__(self, format_: Format):
+        super().__init__()
+        self.format = format_
+
+    def __missing__(self, value: dt.datetime) -> str:
+        rendered = self.format.value(value)
+        if value.tzinfo is None:
+            self[value] = rendered
+        return rendered
+
+
+class RenderedColumn(t.Dict[int, str]):
+    """
+    Rendered values of a naive `IntervalArray` column, computed on first lookup.
+    """
+
+    def __init__(self, layout: t.Callable[[Fields], str]):
+        super().__init__()
+        self.layout = layout
+
+    def __missing__(self, value: int) -> str:
+        rendered = self[value] = self.layout(datetime_fields(EPOCH + dt.timedelta(microseconds=value)))
+        return rendered
+
+
+GITHUB = Format(layout=Layout("%Y-%m-%d", "%04d-%02d-%02d", (YEAR, MONTH, DAY)), closed="%s..%s", open="%s")
+ISO = Format(layout=iso_layout, closed="%s/%s", open="%s", method=dt.datetime.isoformat)
+LUCENE = Format(layout=iso_layout, closed="[%s TO %s]", open="[%s TO *]", method=dt.datetime.isoformat)
+MATH = Format(layout=iso_layout, closed="%s..%s", open="%s", method=dt.datetime.isoformat)
+OPSGENIE = Format(
+    layout=Layout("%d-%m-%YT%H:%M:%S", "%02d-%02d-%04dT%02d:%02d:%02d", (DAY, MONTH, YEAR, HOUR, MINUTE, SECOND)),
+    closed='createdAt >= "%s" and createdAt <= "%s"',
+    open='createdAt >= "%s"',
+)
+
+
+def githubformat(intervals: t.Union[t.Iterable["TimeInterval"], "IntervalArray"]) -> t.List[str]:
+    """
+    Render intervals like `TimeInterval.githubformat`.
+    """
+    return GITHUB.render_many(intervals)
+
+
+def isoformat(intervals: t.Union[t.Iterable["TimeInterval"], "IntervalArray"]) -> t.List[str]:
+    """
+    Render intervals like `TimeInterval.isoformat`.
+    """
+    return ISO.render_many(intervals)
+
+
+def luceneformat(intervals: t.Union[t.Iterable["TimeInterval"], "IntervalArray"]) -> t.List[str]:
+    """
+    Render intervals like `TimeInterval.luceneformat`.
+    """
+    return LUCENE.render_many(intervals)
+
+
+def mathformat(intervals: t.Union[t.Iterable["TimeInterval"], "IntervalArray"]) -> t.List[str]:
+    """
+    Render intervals like `TimeInterval.mathformat`.
+    """
+    return MATH.render_many(intervals)
+
+
+def opsgenieformat(intervals: t.Union[t.Iterable["TimeInterval"], "IntervalArray"]) -> t.List[str]:
+    """
+    Render intervals like `TimeInterval.opsgenieformat`.
+    """
+    return OPSGENIE.render_many(intervals)
@@ -0,0 +1,132 @@
+# Copyright (c) 2026, The Panodata developers and contributors.
+# Distributed under the terms of the LGPL license, see LICENSE.
+"""
+Parse columns of pandas DataFrames and Arrow tables.
+
+Columns often hold millions of rows, but only a few distinct expressions. Each
+distinct expression is parsed only once, and the results are broadcast back to
+the rows. Missing values yield missing results, without an error.
+
+Requires `pandas` or `pyarrow` respectively, installable using the
+`pandas` and `arrow` extras.
+"""
+
+import datetime as dt
+import typing as t
+
+from .columnar import IntervalArray
+from .model import TimeInterval, trange
+
+if t.TYPE_CHECKING:
+    import numpy
+    import pandas
+    import pyarrow
+
+    from .core import TimeIntervalParser
+
+
+def parse_distinct(
+    expressions: t.Sequence[str], parser: t.Optional["TimeIntervalParser"] = None, now: t.Optional[dt.datetime] = None
+) -> t.Tuple["numpy.ndarray", "numpy.ndarray", "numpy.ndarray", bool]:
+    """
+    Parse distinct expressions, returning `start`, `end`, and `error` columns as numpy arrays.
+
+    Timestamps are `datetime64[us]` values, using `NaT` for failed expressions
+    and open intervals. The last element of each column is a missing value,
+    so the columns can be indexed using codes where `-1` denotes a missing value.
+
+    The returned flag signals timezone-aware results, which are converted to UTC.
+    Naive results are then interpreted in the timezone of the parser.
+    """
+    import numpy
+
+    if parser is None:
+        from .core import TimeIntervalParser
+
+        parser = TimeIntervalParser()
+
+    errors = numpy.full(len(expressions) + 1, None, dtype=object)
+    succeeded = []
+    bounds: t.List[trange] = []
+    for index, result in enumerate(parser.parse_many(expressions, now=now)):
+        if result.value is None:
+            errors[index] = str(result.error)
+            continue
+        start, end = (result.value.start, result.value.end) if isinstance(result.value, TimeInterval) else result.value
+        # Custom parsers may return anything, only intervals of datetimes fit into the columns.
+        if not isinstance(start, dt.datetime) or not (end is None or isinstance(end, dt.datetime)):
+            errors[index] = f"Invalid time interval: {start!r}, {end!r}"
+            continue
+        succeeded.append(index)
+        bounds.append((start, end))
+
+    # Parsers may return naive and timezone-aware values, even within one interval. When there
+    # is any timezone-aware value, naive ones are interpreted in the timezone of the parser.
+    if any(value is not None and value.tzinfo is not None for interval in bounds for value in interval):
+        from .core import get_timezone
+
+        tzinfo = get_timezone(parser.tz)
+        bounds = [(localize(start, tzinfo), end and localize(end, tzinfo)) for start, end in bounds]
+    intervals = IntervalArray(bounds)
+    starts = numpy.full(len(expressions) + 1, numpy.datetime64("NaT"), dtype="datetime64[us]")
+    ends = starts.copy()
+    starts[succeeded], ends[succeeded] = intervals.to_numpy()
+    return starts, ends, errors, bool(intervals.aware)
+
+
+def localize(value: dt.datetime, tzinfo: dt.tzinfo) -> dt.datetime:
+    """
+    Attach `tzinfo` to a naive datetime, keeping timezone-aware ones as they are.
+    """
+    return value.replace(tzinfo=tzinfo) if value.tzinfo is None else value
+
+
+def parse_series(
+    series: "pandas.Series", parser: t.Optional["TimeIntervalParser"] = None, now: t.Optional[dt.datetime] = None
+) -> "pandas.DataFrame":
+    """
+    Parse a pandas Series of expressions into a DataFrame with `start`, `end`, and `error` columns.
+
+    The DataFrame shares the index of the series. All expressions are parsed
+    relative to the same reference time `now`, defaulting to the current time.
+    """
+    import pandas
+
+    codes, uniques = pandas.factorize(series)
+    starts, ends, errors, aware = parse_distinct(list(uniques), parser=parser, now=now)
+    frame = pandas.DataFrame(
+        {"start": starts[codes], "end": ends[codes], "error": errors[codes]},
+        index=series.index,
+    )
+    if aware:
+        frame["start"] = frame["start"].dt.tz_localize("UTC")
+        frame["end"] = frame["end"].dt.tz_localize("UTC")
+    return frame
+
+
+def parse_arrow(
+    array: t.Union["pyarrow.Array", "pyarrow.ChunkedArray"],
+    parser: t.Optional["TimeIntervalParser"] = None,
+    now: t.Optional[dt.datetime] = None,
+) -> "pyarrow.Table":
+    """
+    Parse an Arrow array of expressions into a table with `start`, `end`, and `error` columns.
+
+    Dictionary-encoded arrays are used as they are, others are dictionary-encoded first.
+    """
+    import pyarrow
+
+    if isinstance(array, pyarrow.ChunkedArray):
+        array = array.combine_chunks()
+    if not pyarrow.types.is_dictionary(array.type):
+        array = array.dictionary_encode()
+    starts, ends, errors, aware = parse_distinct(array.dictionary.to_pylist(), parser=parser, now=now)
+    timestamp = pyarrow.timestamp("us", tz="UTC" if aware else None)
+    # Omit the missing value at the end, null indices take nulls anyway.
+    return pyarrow.table(
+        {
+            "start": pyarrow.array(starts[:-1], type=timestamp, from_pandas=True).take(array.indices),
+            "end": pyarrow.array(ends[:-1], type=timestamp, from_pandas=True).take(array.indices),
+            "error": pyarrow.array(errors[:-1], type=pyarrow.string()).take(array.indices),
+        }
+    )
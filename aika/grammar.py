@@ -0,0 +1,335 @@
+# Copyright (c) 2026, The Panodata developers and contributors.
+# Distributed under the terms of the LGPL license, see LICENSE.
+"""
+Build the DateRangeParser grammars once per process, and share them across threads.
+
+pyparsing and daterangeparser are imported on first use, so checking admissibility
+of expressions does not pay for importing them.
+"""
+
+import calendar
+import datetime
+import re
+import threading
+import typing as t
+
+from aika.model import trange
+
+if t.TYPE_CHECKING:
+    from pyparsing import ParserElement, ParseResults
+
+LETTERS = re.compile(r"[^\W\d_]+")
+SEPARATOR_CHARACTERS = "-\u2013\u2014>"
+SEPARATORS = re.compile(f"[{SEPARATOR_CHARACTERS}]+")
+
+# A leading run of three or four digits, like the year of ISO 8601 notations. The grammar
+# consumes the first two digits as day number, and can not continue with the remaining ones,
+# unless they are hours followed by a time separator.
+LEADING_DIGITS = re.compile(r"\s*(?:0[1-9]|[12]\d|3[01])\d{1,2}(?!\d)")
+TIME_SEPARATORS = re.compile(r"[:.]")
+
+
+class Grammar:
+    """
+    A pyparsing grammar, built lazily on first use, and reused afterwards.
+
+    pyparsing finalizes a grammar on its first parse (streamlining, `Each`
+    expression groups), which mutates the parser elements. To make the grammar
+    safe for concurrent use, this happens once while holding the lock, so
+    threads will only ever see a fully initialized grammar.
+    """
+
+    # Characters the DateRangeParser grammars can consume, besides letters: Whitespace,
+    # digits, ignored commas, dots and colons of dates and times, and separators.
+    CHARACTERS = set(" \t\n\r0123456789,.:") | set(SEPARATOR_CHARACTERS)
+
+    def __init__(
+        self,
+        factory: t.Callable[[], "ParserElement"],
+        vocabulary: t.Optional[t.Iterable[str]] = None,
+        warmup: str = "2000",
+    ):
+        self.factory = factory
+        self.warmup = warmup
+        self.words: t.Optional[t.Pattern] = None
+        if vocabulary is not None:
+            words = sorted(vocabulary, key=len, reverse=True)
+            self.words = re.compile("(?:" + "|".join(map(re.escape, words)) + ")+", re.IGNORECASE)
+        self._element: t.Optional["ParserElement"] = None
+        self._lock = threading.Lock()
+
+    def admissible(self, text: str) -> bool:
+        """
+        Cheap necessary condition for the grammar to accept the text.
+
+        Returns `False` only if parsing the text is certain to fail, because it
+        contains characters or words the grammar can not consume, more than one
+        separator, or starts with a year. The grammar consumes letters only through the words of its
+        vocabulary, and accepts a single separator between two dates.
+        """
+        if self.words is None:
+            return True
+        if LEADING_DIGITS.match(text) and not TIME_SEPARATORS.search(text):
+            return False
+        for match in LETTERS.finditer(text):
+            if not self.words.fullmatch(match.group(0)):
+                return False
+        for character in LETTERS.sub("", text):
+            if character not in self.CHARACTERS:
+                return False
+        return len(SEPARATORS.findall(text)) <= 1
+
+    @property
+    def element(self) -> "ParserElement":
+        element = self._element
+        if element is None:
+            with self._lock:
+                if self._element is None:
+                    self._element = self.build()
+                element = self._element
+        return element
+
+    def build(self) -> "ParserElement":
+        from pyparsing import ParseException
+
+        element = self.factory()
+        element.streamline()
+        try:
+            element.parseString(self.warmup)
+        except ParseException:
+            pass
+        return element
+
+    def parse(self, text: str) -> "ParseResults":
+        return self.element.parseString(text)
+
+
+def enable_packrat(cache_size_limit: t.Optional[int] = 128) -> None:
+    """
+    Enable pyparsing's packrat memoization, process-wide.
+
+    It speeds up the backtracking-heavy DateRangeParser grammars. Note that
+    pyparsing keeps a single cache for all grammars, so this affects other
+    pyparsing users within the same process, too.
+    """
+    from pyparsing import ParserElement
+
+    ParserElement.enable_packrat(cache_size_limit=cache_size_limit)
+
+
+# Vendored from `daterangeparser.parse_date_range`, version 1.3.2, adding the `today` argument.
+# Copyright (C) 2013 Robin Wilson, LGPL-3.0-or-later.
+def post_process(res, allow_implicit=True, today=None):
+    """
+    Perform post-processing on the results of the date range parsing.
+
+    At the moment this consists mainly of ensuring that any missing information is filled in.
+    For example, if no years are specified at all in the string then both years are set to the
+    current year, and if one part of the string includes no month or year then these are
+    filled in from the other part of the string.
+
+    :param res: The results from the parsing operation, as returned by the parseString function
+    :param allow_implicit: If implicit dates are allowed
+    :param today: The reference date for implicit years, defaults to the current date
+    :return: the results with populated date information
+    """
+
+    from pyparsing import ParseException
+
+    # Get current date
+    if today is None:
+        today = datetime.date.today()
+
+    if not allow_implicit:
+        if ("start" in res and "day" not in res.start) or ("end" in res and "day" not in res.end):
+            raise ParseException("Couldn't parse resulting datetime")
+
+    if "start" not in res:
+        # We have a single date, not a range
+        res["start"] = {}
+
+        if "month" not in res.end and "day" not in res.end:
+            # We have only got a year, so go from start to end of the year
+            res["start"]["year"] = res.end.year
+            res["start"]["month"] = 1
+            res["start"]["day"] = 1
+
+            res["end"]["month"] = 12
+            res["end"]["day"] = 31
+            return res
+        elif "month" in res.end and "day" not in res.end:
+            if not isinstance(res.end.month, int):
+                raise ParseException("Couldn't parse resulting datetime")
+
+            # special case - treat bare month as a range from start to end of month
+            if "year" not in res.end or res.end.year == "":
+                res["start"]["year"] = today.year
+                res["end"]["year"] = today.year
+            else:
+                res["start"]["year"] = res.end.year
+
+            res["start"]["day"] = 1
+            res["start"]["month"] = res.end.month
+
+            res["end"]["day"] = calendar.monthrange(res["start"]["year"], res.end.month)[1]
+        else:
+            res["start"]["day"] = res.end.day
+            res["start"]["month"] = res.end.month
+
+            if "year" not in res.end:
+                res["start"]["year"] = today.year
+            else:
+                res["start"]["year"] = res.end.year
+
+            res["end"] = None
+
+        return res
+
+    if "month" not in res.end and "month" not in res.start and "day" not in res.end and "day" not in res.start:
+        # No months or days given, just years
+        res["start"]["month"] = 1
+        res["start"]["day"] = 1
+
+        res["end"]["month"] = 12
+        res["end"]["day"] = 31
+        return res
+
+    # Sort out years
+    if "year" not in res.end:
+        res.end["year"] = today.year
+        res.start["year"] = today.year
+    elif "year" not in res.start:
+        res.start["year"] = res.end.year
+
+    # Sort out months
+    if "month" not in res.start:
+        res.start["month"] = res.end.month
+
+    if "day" not in res.start or res.start["day"] == "":
+        res.start["day"] = 1
+
+    if res.end.month and ("day" not in res.end or res.end["day"] == ""):
+        res.end["day"] = calendar.monthrange(res.end.year, res.end.month)[1]
+
+    return res
+
+
+def parse_daterange(
+    grammar: Grammar, text: str, allow_implicit: bool = True, today: t.Optional[datetime.date] = None
+) -> trange:
+    """
+    Parse a date range string using the given DateRangeParser grammar.
+
+    This is the post-processing of `daterangeparser.parse`, decoupled from
+    the grammar construction, so it can be used for all language variants.
+    `today` is the reference date for implicit years, defaulting to the current date.
+    """
+    from pyparsing import ParseException
+
+    result = grammar.parse(text)
+    res = post_process(result, allow_implicit, today)
+
+    # Create standard dd/mm/yyyy strings and then convert to Python datetime
+    # objects
+    if "year" not in res.start:
+        # in case only separator was given
+        raise ParseException("Couldn't parse resulting datetime")
+
+    try:
+        start_str = "%(day)s/%(month)s/%(year)s" % res.start
+        start_datetime = datetime.datetime.strptime(start_str, "%d/%m/%Y")
+    except ValueError as ex:
+        raise ParseException("Couldn't parse resulting datetime") from ex
+
+    if res.end is None:
+        return start_datetime, None
+    elif not res.end:
+        raise ParseException("Couldn't parse resulting datetime")
+    else:
+        try:
+            if "month" not in res.end:
+                res.end["month"] = res.start["month"]
+            end_str = "%(day)s/%(month)s/%(year)s" % res.end
+            end_datetime = datetime.datetime.strptime(end_str, "%d/%m/%Y")
+        except ValueError as ex:
+            raise ParseException("Couldn't parse resulting datetime") from ex
+
+        if end_datetime < start_datetime:
+            # end is before beginning!
+            # This is probably caused by a date straddling the change of year
+            # without the year being given
+            # So, we assume that the start should be the previous year
+            res.start["year"] = res.start["year"] - 1
+            start_str = "%(day)s/%(month)s/%(year)s" % res.start
+            start_datetime = datetime.datetime.strptime(start_str, "%d/%m/%Y")
+
+        return start_datetime, end_datetime
+
+
+# The month names of the vanilla English grammar, see `daterangeparser.parse_date_range.MONTHS`.
+MONTHS_ENGLISH = {
+    "jan": 1,
+    "january": 1,
+    "feb": 2,
+    "february": 2,
+    "mar": 3,
+    "march": 3,
+    "apr": 4,
+    "april": 4,
+    "may": 5,
+    "jun": 6,
+    "june": 6,
+    "jul": 7,
+    "july": 7,
+    "aug": 8,
+    "august": 8,
+    "sep": 9,
+    "sept": 9,
+    "september": 9,
+    "oct": 10,
+    "october": 10,
+    "nov": 11,
+    "november": 11,
+    "dec": 12,
+    "december": 12,
+}
+
+# The words of the vanilla English grammar, see `daterangeparser.parse_date_range.create_parser`.
+VOCABULARY_ENGLISH = [
+    *MONTHS_ENGLISH.keys(),
+    *"Mon Monday Tue Tues Tuesday Wed Weds Wednesday Thu Thur Thurs Thursday".split(),
+    *"Fri Friday Sat Saturday Sun Sunday".split(),
+    *"th rd st nd".split(),
+    *"am pm".split(),
+    *"to until through till untill".split(),
+    *"from starting beginning of".split(),
+]
+
+
+def create_daterangeparser_english() -> "ParserElement":
+    from daterangeparser.parse_date_range import create_parser
+
+    return create_parser()
+
+
+grammar_english = Grammar(create_daterangeparser_english, vocabulary=VOCABULARY_ENGLISH)
+
+
+def parse_english(text: str, allow_implicit: bool = True, now: t.Optional[datetime.datetime] = None) -> trange:
+    """
+    Parses a date range string and returns the start and end as datetimes.
+
+    Same as `daterangeparser.parse`, but reusing the grammar across calls.
+    """
+    return parse_daterange(grammar_english, text, allow_implicit, today=local_date(now))
+
+
+def local_date(now: t.Optional[datetime.datetime]) -> t.Optional[datetime.date]:
+    """
+    Return the calendar date of a reference time, in its own timezone, like `datetime.date.today()`.
+
+    `TimeIntervalParser` passes reference times converted into its timezone `tz`.
+    """
+    if now is None:
+        return None
+    return now.date()
@@ -0,0 +1,245 @@
+# Copyright (c) 2026, The Panodata developers and contributors.
+# Distributed under the terms of the LGPL license, see LICENSE.
+"""
+Combine many time intervals using set operations: union, intersection, difference, and complement.
+
+An `IntervalSet` keeps its intervals sorted, disjoint, and separated by gaps,
+so all operations are linear sweeps over both operands, after sorting once
+on construction. Intervals are closed, at the resolution of `datetime`, so
+intervals like `[00:00, 11:59:59.999999]` and `[12:00, 23:59:59.999999]`
+are adjacent, and merged. Intervals without `end` are open, they extend
+indefinitely.
+"""
+
+import bisect
+import datetime as dt
+import typing as t
+
+from .model import ParseResult, TimeInterval, trange
+
+# The resolution of `datetime`, the distance between adjacent instants.
+RESOLUTION = dt.timedelta(microseconds=1)
+
+
+class IntervalSet:
+    """
+    An immutable set of instants, represented by sorted, disjoint, and non-adjacent time intervals.
+
+    Intervals ending before they start are empty, and dropped.
+    """
+
+    __slots__ = ("intervals", "starts")
+
+    def __init__(self, intervals: t.Iterable[t.Union[TimeInterval, trange]] = ()):
+        items = [item if isinstance(item, TimeInterval) else TimeInterval(*item) for item in intervals]
+        self.intervals: t.Tuple[TimeInterval, ...] = tuple(merge(sorted(items, key=TimeInterval.sortkey), RESOLUTION))
+        self.starts = [interval.start for interval in self.intervals]
+
+    @classmethod
+    def normalized(cls, intervals: t.List[TimeInterval]) -> "IntervalSet":
+        """
+        Create a set from intervals which are already sorted, disjoint, and non-adjacent.
+        """
+        result = cls.__new__(cls)
+        result.intervals = tuple(intervals)
+        result.starts = [interval.start for interval in intervals]
+        return result
+
+    @classmethod
+    def from_results(
+        cls, results: t.Iterable[t.Union[ParseResult, TimeInterval, trange]], ignore_errors: bool = False
+    ) -> "IntervalSet":
+        """
+        Create a set from the output of `TimeIntervalParser`, like `parse_many`, or `parse`.
+
+        Failed results raise their error, unless `ignore_errors` is set.
+        """
+        intervals = []
+        for result in results:
+            if isinstance(result, ParseResult):
+                if result.error is not None:
+                    if ignore_errors:
+                        continue
+                    raise result.error
+                result = t.cast(t.Union[TimeInterval, trange], result.value)
+            intervals.append(result)
+        return cls(intervals)
+
+    def __iter__(self) -> t.Iterator[TimeInterval]:
+        return iter(self.intervals)
+
+    def __len__(self) -> int:
+        return len(self.intervals)
+
+    def __bool__(self) -> bool:
+        return bool(self.intervals)
+
+    def __getitem__(self, index: int) -> TimeInterval:
+        return self.intervals[index]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.intervals == other.intervals
+
+    def __hash__(self) -> int:
+        return hash(self.intervals)
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self.intervals)!r})"
+
+    def __contains__(self, when: dt.datetime) -> bool:
+        index = bisect.bisect_right(self.starts, when) - 1
+        if index < 0:
+            return False
+        end = self.intervals[index].end
+        return end is None or when <= end
+
+    def __or__(self, other: "IntervalSet") -> "IntervalSet":
+        return self.union(other)
+
+    def __and__(self, other: "IntervalSet") -> "IntervalSet":
+        return self.intersection(other)
+
+    def __sub__(self, other: "IntervalSet") -> "IntervalSet":
+        return self.difference(other)
+
+    def union(self, *others: "IntervalSet") -> "IntervalSet":
+        """
+        Return the instants which are in any of the sets.
+        """
+        intervals = list(self.intervals)
+        for other in others:
+            intervals = merge(merge_sorted(intervals, other.intervals), RESOLUTION)
+        return IntervalSet.normalized(intervals)
+
+    def intersection(self, other: "IntervalSet") -> "IntervalSet":
+        """
+        Return the instants which are in both sets.
+        """
+        result = []
+        left, right = self.intervals, other.intervals
+        i = j = 0
+        while i < len(left) and j < len(right):
+            a, b = left[i], right[j]
+            start = max(a.start, b.start)
+            end = earliest(a.end, b.end)
+            if end is None or start <= end:
+                result.append(TimeInterval(start, end))
+            # Advance the interval which ends first, the other one may overlap the next.
+            if a.end is not None and (b.end is None or a.end <= b.end):
+                i += 1
+            else:
+                j += 1
+        return IntervalSet.normalized(result)
+
+    def difference(self, other: "IntervalSet") -> "IntervalSet":
+        """
+        Return the instants which are in this set, but not in the other one.
+        """
+        result = []
+        subtrahends = other.intervals
+        j = 0
+        for interval in self.intervals:
+            # Skip intervals ending before this one, they can not overlap any of the following ones either.
+            while j < len(subtrahends):
+                passed = subtrahends[j].end
+                if passed is None or passed >= interval.start:
+                    break
+                j += 1
+            start: t.Optional[dt.datetime] = interval.start
+            end = interval.end
+            k = j
+            while start is not None and k < len(subtrahends):
+                cut = subtrahends[k]
+                if end is not None and cut.start > end:
+                    break
+                if cut.start > start:
+                    result.append(TimeInterval(start, cut.start - RESOLUTION))
+                if cut.end is None or (end is not None and cut.end >= end):
+                    start = None
+                else:
+                    start = max(start, cut.end + RESOLUTION)
+                k += 1
+            if start is not None:
+                result.append(TimeInterval(start, end))
+        return IntervalSet.normalized(result)
+
+    def complement(self, within: TimeInterval) -> "IntervalSet":
+        """
+        Return the instants of the bounding interval `within`, which are not in this set.
+        """
+        return IntervalSet([within]).difference(self)
+
+    def coalesce(self, gap: dt.timedelta) -> "IntervalSet":
+        """
+        Merge intervals which are separated by at most `gap`, filling the gaps in between.
+        """
+        return IntervalSet.normalized(merge(self.intervals, max(gap, RESOLUTION)))
+
+    def bounds(self) -> t.Optional[TimeInterval]:
+        """
+        Return the interval spanning all instants of the set, or `None` if it is empty.
+        """
+        if not self.intervals:
+            return None
+        return TimeInterval(self.intervals[0].start, self.intervals[-1].end)
+
+
+def merge(intervals: t.Iterable[TimeInterval], gap: dt.timedelta) -> t.List[TimeInterval]:
+    """
+    Merge intervals sorted by start, when they overlap, or are separated by at most `gap`.
+    """
+    result: t.List[TimeInterval] = []
+    start: t.Optional[dt.datetime] = None
+    end: t.Optional[dt.datetime] = None
+    for interval in intervals:
+        if interval.end is not None and interval.end < interval.start:
+            continue
+        if start is not None and (end is None or interval.start - end <= gap):
+            end = latest(end, interval.end)
+            continue
+        if start is not None:
+            result.append(TimeInterval(start, end))
+        start, end = interval.start, interval.end
+    if start is not None:
+        result.append(TimeInterval(start, end))
+    return result
+
+
+def merge_sorted(left: t.Sequence[TimeInterval], right: t.Sequence[TimeInterval]) -> t.List[TimeInterval]:
+    """
+    Merge two sequences of intervals sorted by start into one, in linear time.
+    """
+    result = []
+    i = j = 0
+    while i < len(left) and j < len(right):
+        if right[j].start < left[i].start:
+            result.append(right[j])
+            j += 1
+        else:
+            result.append(left[i])
+            i += 1
+    result.extend(left[i:])
+    result.extend(right[j:])
+    return result
+
+
+def earliest(a: t.Optional[dt.datetime], b: t.Optional[dt.datetime]) -> t.Optional[dt.datetime]:
+    """
+    Return the earlier of two ends, where `None` is an open end.
+    """
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return min(a, b)
+
+
+def latest(a: t.Optional[dt.datetime], b: t.Optional[dt.datetime]) -> t.Optional[dt.datetime]:
+    """
+    Return the later of two ends, where `None` is an open end.
+    """
+    if a is None or b is None:
+        return None
+    return max(a, b)
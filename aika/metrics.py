@@ -0,0 +1,98 @@
+# Copyright (c) 2026, The Panodata developers and contributors.
+# Distributed under the terms of the LGPL license, see LICENSE.
+"""
+Record where time goes within `TimeIntervalParser`, per parser of the cascade.
+"""
+
+import dataclasses
+import threading
+import typing as t
+from collections import deque
+
+# Name of the stage applying `snap_hours` and `midnight_heuristics` to parsing results.
+POSTPROCESSING = "post-processing"
+
+# Percentiles reported by `StageStatistics`.
+PERCENTILES = (50, 90, 99)
+
+
+class MetricsSink(t.Protocol):
+    """
+    Receives one measurement per parser attempt, and per post-processing step.
+    """
+
+    def record(self, stage: str, seconds: float, ok: bool) -> None: ...
+
+
+@dataclasses.dataclass
+class StageStatistics:
+    """
+    Counters and latencies of a stage, which is either a parser of the cascade, or post-processing.
+
+    Latencies are in seconds. Percentiles cover the most recent measurements only.
+    """
+
+    name: str
+    attempts: int = 0
+    successes: int = 0
+    failures: int = 0
+    total: float = 0.0
+    percentiles: t.Dict[int, float] = dataclasses.field(default_factory=dict)
+
+
+class Metrics:
+    """
+    A `MetricsSink` keeping statistics in memory, safe for concurrent use.
+
+    Percentiles are computed from the `window` most recent measurements of each stage.
+    """
+
+    def __init__(self, window: int = 1024):
+        if window < 1:
+            raise ValueError(f"Window size must be positive: {window}")
+        self.window = window
+        self.lock = threading.Lock()
+        self.stages: t.Dict[str, StageStatistics] = {}
+        self.samples: t.Dict[str, t.Deque[float]] = {}
+
+    def record(self, stage: str, seconds: float, ok: bool) -> None:
+        with self.lock:
+            statistics = self.stages.get(stage)
+            if statistics is None:
+                statistics = self.stages[stage] = StageStatistics(name=stage)
+                self.samples[stage] = deque(maxlen=self.window)
+            statistics.attempts += 1
+            if ok:
+                statistics.successes += 1
+            else:
+                statistics.failures += 1
+            statistics.total += seconds
+            self.samples[stage].append(seconds)
+
+    def snapshot(self) -> t.Dict[str, StageStatistics]:
+        """
+        Return a copy of the statistics of all stages, in order of their first measurement.
+        """
+        with self.lock:
+            result = {}
+            for stage, statistics in self.stages.items():
+                samples = sorted(self.samples[stage])
+                result[stage] = dataclasses.replace(
+                    statistics, percentiles={percentile: nearest(samples, percentile) for percentile in PERCENTILES}
+                )
+            return result
+
+    def reset(self) -> None:
+        with self.lock:
+            self.stages.clear()
+            self.samples.clear()
+
+
+def nearest(samples: t.Sequence[float], percentile: int) -> float:
+    """
+    Return a percentile of sorted samples, using the nearest-rank method.
+    """
+    if not samples:
+        return 0.0
+    rank = max(1, -(-percentile * len(samples) // 100))
+    return samples[rank - 1]
@@ -3,8 +3,12 @@
 
 import dataclasses
 import datetime as dt
+import functools
+import sys
 import typing as t
 
+from . import formatting
+
 trange = t.Tuple[dt.datetime, t.Optional[dt.datetime]]
 
 
@@ -12,20 +16,55 @@ trange = t.Tuple[dt.datetime, t.Optional[dt.datetime]]
 class Parser:
     name: str
     fun: t.Callable
+    # Cheap necessary condition for `fun` to succeed. When it returns `False`, the parser is skipped.
+    accepts: t.Optional[t.Callable[[str], bool]] = None
+    # Whether `fun` accepts the reference time as keyword argument `now`.
+    clocked: bool = False
 
 
 @dataclasses.dataclass
+class ParseResult:
+    """
+    The outcome of parsing a single expression: Either a value, or the error it raised.
+    """
+
+    when: str
+    value: t.Optional[t.Union[trange, "TimeInterval"]] = None
+    error: t.Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+# Slotted dataclasses are available on Python 3.10 and newer.
+SLOTS: t.Dict[str, t.Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@functools.total_ordering
+@dataclasses.dataclass(frozen=True, **SLOTS)
 class TimeInterval:
     """
     Mange a single time interval.
 
     The implementation uses `start` and `end`, because
     `from` and `to` are very likely to be reserved words.
+
+    Intervals are immutable and hashable. They are ordered by `start`, then by `end`,
+    where an interval without `end` is open, and sorts after all others.
     """
 
     start: dt.datetime
     end: t.Optional[dt.datetime] = None
 
+    def __lt__(self, other: object) -> bool:
+        if not isinstance(other, TimeInterval):
+            return NotImplemented
+        return self.sortkey() < other.sortkey()
+
+    def sortkey(self) -> t.Tuple[dt.datetime, bool, dt.datetime]:
+        return self.start, self.end is None, self.end or self.start
+
     def githubformat(self) -> str:
         """
         Mathematical interval format, short notation as used by GitHub: `n..n`.
@@ -33,29 +72,23 @@ class TimeInterval:
 
         https://docs.github.com/en/search-github/getting-started-with-searching-on-github/understanding-the-search-syntax#query-for-values-between-a-range
         """
-        github_datetime_format = "%Y-%m-%d"
-        buffer = f"{self.start.strftime(github_datetime_format)}"
-        if self.end:
-            buffer += f"..{self.end.strftime(github_datetime_format)}"
-        return buffer
+        return formatting.GITHUB.render(self.start, self.end)
 
     def isoformat(self) -> str:
         """
         Encode as ISO 8601 time interval.
         https://en.wikipedia.org/wiki/ISO_8601#Time_intervals
         """
-        buffer = f"{self.start.isoformat()}"
-        if self.end:
-            buffer += f"/{self.end.isoformat()}"
-        return buffer
+        return formatting.ISO.render(self.start, self.end)
 
     def luceneformat(self) -> str:
         """
-        Encode as Lucene range query. Example: [20020101 TO 20030101]
+        Encode as Lucene range query, using ISO 8601 timestamps, and `*` for open intervals.
+        Example: `[2002-01-01T00:00:00 TO 2003-01-01T00:00:00]`
 
         https://lucene.apache.org/core/2_9_4/queryparsersyntax.html#Range%20Searches
         """
-        raise NotImplementedError()
+        return formatting.LUCENE.render(self.start, self.end)
 
     def mathformat(self) -> str:
         """
@@ -68,10 +101,7 @@ class TimeInterval:
 
         https://math.stackexchange.com/a/2056522
         """
-        buffer = f"{self.start.isoformat()}"
-        if self.end:
-            buffer += f"..{self.end.isoformat()}"
-        return buffer
+        return formatting.MATH.render(self.start, self.end)
 
     def opsgenieformat(self) -> str:
         """
@@ -80,8 +110,4 @@ class TimeInterval:
 
         https://support.atlassian.com/opsgenie/docs/search-queries-for-alerts/
         """
-        opsgenie_datetime_format = "%d-%m-%YT%H:%M:%S"
-        buffer = f'createdAt >= "{self.start.strftime(opsgenie_datetime_format)}"'
-        if self.end:
-            buffer += f' and createdAt <= "{self.end.strftime(opsgenie_datetime_format)}"'
-        return buffer
+        return formatting.OPSGENIE.render(self.start, self.end)
@@ -0,0 +1,84 @@
+# Copyright (c) 2026, The Panodata developers and contributors.
+# Distributed under the terms of the LGPL license, see LICENSE.
+"""
+Parse ISO 8601 dates and calendar notations, without any third-party library.
+
+Accepted notations, all starting with a four-digit year:
+
+- Year: `2025`
+- Week: `2025W01`, `2025W1`, like ISO 8601 calendar weeks
+- Month: `2025M02`, `2025M2`, `2025-02`
+- Quarter: `2025Q03`, `2025Q3`
+- Date: `2024-08-20`
+
+Ends are inclusive, like the ones of the other parsers of the cascade. Weeks,
+months, and years end at the last microsecond before the next period, quarters
+end at the last second of their last day. Dates end at the end of the day of
+the reference time, in its own timezone, like `TimeIntervalParser.dudp_parse` does.
+
+Everything else is rejected immediately, so the next parser of the cascade
+can take its turn.
+"""
+
+import calendar
+import datetime as dt
+import typing as t
+
+from .model import trange
+
+# Name of the parser in the cascade of `TimeIntervalParser`.
+CALENDAR_NOTATION = "calendar-notation"
+
+WEEK = dt.timedelta(days=7)
+RESOLUTION = dt.timedelta(microseconds=1)
+
+
+def admissible(when: str) -> bool:
+    """
+    Cheap necessary condition for `parse` to accept the text: It starts with four ASCII digits.
+    """
+    return 4 <= len(when) <= 10 and when[:4].isdigit() and when[:4].isascii()
+
+
+def parse(when: str, now: t.Optional[dt.datetime] = None) -> trange:
+    """
+    Parse an ISO 8601 date or calendar notation, in a single pass over the text.
+
+    Raises `ValueError` for any other text, and for invalid dates or period numbers.
+    """
+    if not admissible(when):
+        raise ValueError(f"Not a calendar notation: {when}")
+    year = int(when[:4])
+    length = len(when)
+    if length == 4:
+        return dt.datetime(year, 1, 1), end_of_month(year, 12)
+
+    marker = when[4]
+    number = when[5:]
+    if marker == "-" and length == 10 and when[7] == "-" and number.isascii():
+        month, day = number[:2], number[3:]
+        if month.isdigit() and day.isdigit():
+            today = (now.replace(tzinfo=None) if now is not None else dt.datetime.today()).replace(
+                hour=23, minute=59, second=59, microsecond=999999
+            )
+            return dt.datetime(year, int(month), int(day)), today
+
+    if length <= 7 and number.isdigit() and number.isascii():
+        value = int(number)
+        if marker == "W":
+            start = dt.datetime.combine(dt.date.fromisocalendar(year, value, 1), dt.time())
+            return start, start + WEEK - RESOLUTION
+        if marker == "M" or (marker == "-" and length == 7):
+            return dt.datetime(year, value, 1), end_of_month(year, value)
+        if marker == "Q" and 1 <= value <= 4:
+            first = 3 * value - 2
+            return dt.datetime(year, first, 1), end_of_month(year, first + 2).replace(microsecond=0)
+
+    raise ValueError(f"Not a calendar notation: {when}")
+
+
+def end_of_month(year: int, month: int) -> dt.datetime:
+    """
+    Return the last microsecond of a month. Raises `ValueError` for invalid months.
+    """
+    return dt.datetime(year, month, calendar.monthrange(year, month)[1], 23, 59, 59, 999999)
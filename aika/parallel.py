@@ -0,0 +1,146 @@
+# Copyright (c) 2026, The Panodata developers and contributors.
+# Distributed under the terms of the LGPL license, see LICENSE.
+"""
+Parse many expressions in parallel, using a pool of worker processes.
+
+The `TimeIntervalParser` itself is not shipped to the workers, because its
+cascade holds bound methods and refers to module-level parser instances.
+Instead, each worker builds its own parser from a picklable `ParserConfig`.
+"""
+
+import dataclasses
+import datetime as dt
+import itertools
+import multiprocessing
+import os
+import typing as t
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from .core import DEFAULT_TIMEZONE, TimeIntervalParser
+from .model import ParseResult
+
+# Expressions exercising all parsers of the cascade, used to warm up workers.
+WARMUP = ["1st july", "1. Juli", "heute", "today", "-1d", "2025W01"]
+
+
+@dataclasses.dataclass(frozen=True)
+class ParserConfig:
+    """
+    Picklable settings of a `TimeIntervalParser`, covering the default parser cascade.
+    """
+
+    default_start_time: t.Optional[dt.time] = None
+    default_end_time: t.Optional[dt.time] = None
+    midnight_heuristics: bool = False
+    snap_hours: bool = False
+    return_tuple: bool = False
+    tz: str = DEFAULT_TIMEZONE
+    languages: t.Optional[t.Tuple[str, ...]] = None
+    locales: t.Optional[t.Tuple[str, ...]] = None
+    parser_order: t.Optional[t.Tuple[t.Tuple[str, t.Tuple[str, ...]], ...]] = None
+
+    @classmethod
+    def from_parser(cls, parser: TimeIntervalParser) -> "ParserConfig":
+        """
+        Capture the settings of a parser. Custom parsers can not be captured, so they are rejected.
+        """
+        names = [item.name for item in parser.parsers]
+        if names != [item.name for item in TimeIntervalParser(tz=parser.tz).parsers]:
+            raise ValueError(f"Unable to run custom parser cascade in worker processes: {names}")
+        return cls(
+            default_start_time=parser.default_start_time,
+            default_end_time=parser.default_end_time,
+            midnight_heuristics=parser.midnight_heuristics,
+            snap_hours=parser.snap_hours,
+            return_tuple=parser.return_tuple,
+            tz=parser.tz,
+            languages=parser.languages,
+            locales=parser.locales,
+            parser_order=tuple(parser.parser_order.items()) if parser.parser_order else None,
+        )
+
+    def create(self) -> TimeIntervalParser:
+        settings = dataclasses.asdict(self)
+        settings["parser_order"] = dict(self.parser_order) if self.parser_order else None
+        return TimeIntervalParser(**settings)
+
+
+# The parser of a worker process.
+worker_parser: t.Optional[TimeIntervalParser] = None
+
+
+def initialize(config: ParserConfig) -> None:
+    """
+    Create and warm up the parser of a worker process.
+
+    Parsing the warmup expressions builds the grammars, the `arbitrary-dateparser`
+    instances and their phrase tables, and loads the `dateparser` language data.
+    """
+    global worker_parser
+    worker_parser = config.create()
+    for _ in worker_parser.parse_many(WARMUP):
+        pass
+
+
+def parse_chunk(chunk: t.List[str], now: dt.datetime) -> t.List[ParseResult]:
+    if worker_parser is None:
+        raise RuntimeError("Worker process has not been initialized")
+    return list(worker_parser.parse_many(chunk, now=now))
+
+
+class ParallelParser:
+    """
+    Parse expressions using a pool of worker processes.
+
+    Expressions are sent to the workers in chunks. Results are yielded in input
+    order, one `ParseResult` per expression, carrying either the value or the error.
+    """
+
+    def __init__(
+        self,
+        config: t.Optional[ParserConfig] = None,
+        processes: t.Optional[int] = None,
+        chunksize: int = 1000,
+        mp_context: t.Optional[multiprocessing.context.BaseContext] = None,
+    ):
+        if chunksize < 1:
+            raise ValueError(f"Chunk size must be positive: {chunksize}")
+        self.config = config or ParserConfig()
+        self.processes = processes or os.cpu_count() or 1
+        self.chunksize = chunksize
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=mp_context,
+            initializer=initialize,
+            initargs=(self.config,),
+        )
+
+    def __enter__(self) -> "ParallelParser":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.executor.shutdown()
+
+    def parse_many(self, expressions: t.Iterable[str], now: t.Optional[dt.datetime] = None) -> t.Iterator[ParseResult]:
+        """
+        Parse expressions lazily, relative to the same reference time `now`, defaulting to the current time.
+
+        At most two chunks per process are in flight, so memory use is bounded.
+        """
+        if now is None:
+            now = dt.datetime.now(dt.timezone.utc).astimezone()
+        iterator = iter(expressions)
+        pending: "deque[Future]" = deque()
+        while True:
+            while len(pending) < 2 * self.processes:
+                chunk = list(itertools.islice(iterator, self.chunksize))
+                if not chunk:
+                    break
+                pending.append(self.executor.submit(parse_chunk, chunk, now))
+            if not pending:
+                return
+            yield from pending.popleft().result()
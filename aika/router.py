@@ -0,0 +1,86 @@
+# Copyright (c) 2026, The Panodata developers and contributors.
+# Distributed under the terms of the LGPL license, see LICENSE.
+"""
+Route expressions through the parser cascade, skipping parsers which are certain to fail.
+"""
+
+import dataclasses
+import re
+import typing as t
+
+from .model import Parser
+
+# Shapes of input expressions, in order of precedence.
+SHAPES = [
+    ("range", re.compile(r".+\.\..+")),
+    ("calendar", re.compile(r"\d{4}(?:[WMQ]\d{1,2}|-\d{2})?")),
+    ("iso", re.compile(r"\d{4}-\d{2}-\d{2}(?:[T ][\d:.,]+(?:Z|[+-][\d:]+)?)?")),
+    ("delta", re.compile(r"[+-]\s*\d.*")),
+    ("numeric", re.compile(r"[\d\s./,:-]+")),
+]
+
+
+def classify(when: str) -> str:
+    """
+    Classify the shape of an expression, using character classes only.
+
+    Shapes are `empty`, `range` (`..`), `calendar` (`2025`, `2025W01`, `2025M02`,
+    `2025Q03`, `2025-02`), `iso` (`2024-08-20`), `delta` (`-1d`), `numeric`
+    (`20.8.2024`), and `text` for everything else.
+    """
+    when = when.strip()
+    if not when:
+        return "empty"
+    for shape, pattern in SHAPES:
+        if pattern.fullmatch(when):
+            return shape
+    return "text"
+
+
+@dataclasses.dataclass
+class Route:
+    """
+    The routing decision for an expression: Which parsers to try, in order, and which to skip.
+    """
+
+    when: str
+    parsers: t.List[Parser]
+    skipped: t.List[Parser]
+
+    @property
+    def shape(self) -> str:
+        return classify(self.when)
+
+    @property
+    def names(self) -> t.List[str]:
+        return [parser.name for parser in self.parsers]
+
+    @property
+    def skipped_names(self) -> t.List[str]:
+        return [parser.name for parser in self.skipped]
+
+
+def route(when: str, parsers: t.List[Parser], order: t.Optional[t.Mapping[str, t.Sequence[str]]] = None) -> Route:
+    """
+    Select the parsers of the cascade which need to be tried for an expression.
+
+    A parser is skipped only if its `accepts` predicate proves that it would fail,
+    and the order of the cascade is retained, so routing never changes the result.
+
+    `order` optionally pins the order of parsers by name, per shape of the
+    expression, see `aika.adaptive`. Parsers not named keep their relative
+    order after the named ones. Pinning an order can change the result.
+    """
+    selected = []
+    skipped = []
+    for parser in parsers:
+        if parser.accepts is None or parser.accepts(when):
+            selected.append(parser)
+        else:
+            skipped.append(parser)
+    if order:
+        names = order.get(classify(when))
+        if names:
+            rank = {name: index for index, name in enumerate(names)}
+            selected.sort(key=lambda parser: rank.get(parser.name, len(rank)))
+    return Route(when=when, parsers=selected, skipped=skipped)
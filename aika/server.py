@@ -0,0 +1,451 @@
+# Copyright (c) 2026, The Panodata developers and contributors.
+# Distributed under the terms of the LGPL license, see LICENSE.
+"""
+Serve the parser cascade over HTTP, for applications written in other languages.
+
+Start the server using `aika-serve`, or `python -m aika.server`. It listens
+on localhost, and keeps a warm `TimeIntervalParser` per timezone and
+languages. Endpoints, all responding with JSON::
+
+    GET /parse?q=last+week&tz=UTC&languages=en,de&now=2023-08-17T23:03:17+02:00
+    POST /batch {"expressions": ["today", "last week"], "tz": "UTC"}
+    GET /stats
+    GET /health
+
+All parameters except the expression are optional. Results carry `input`,
+`start`, `end`, and `error` keys. Expressions of requests arriving
+concurrently are parsed together in batches, on one thread per parser.
+"""
+
+import argparse
+import dataclasses
+import datetime as dt
+import json
+import logging
+import queue
+import threading
+import time
+import typing as t
+import urllib.parse
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .cli import parse_now, record
+from .core import DEFAULT_TIMEZONE, TimeIntervalParser
+from .metrics import Metrics
+from .model import ParseResult
+from .parallel import WARMUP
+
+logger = logging.getLogger(__name__)
+
+# Timezone and languages of a parser.
+ParserKey = t.Tuple[str, t.Optional[t.Tuple[str, ...]]]
+
+# Largest accepted request body, in bytes.
+MAX_BODY_SIZE = 16 * 1024 * 1024
+
+
+class RequestError(Exception):
+    """
+    An error caused by the client, reported using an HTTP status code.
+    """
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+@dataclasses.dataclass
+class Job:
+    """
+    The expressions of a single request, waiting to be parsed.
+    """
+
+    expressions: t.List[str]
+    now: t.Optional[dt.datetime]
+    future: "Future[t.List[ParseResult]]" = dataclasses.field(default_factory=Future)
+
+
+class Batcher:
+    """
+    Parse the expressions of concurrent requests together, using a parser owned by a dedicated thread.
+
+    The thread collects waiting jobs until they hold `size` expressions, waiting
+    up to `delay` seconds for more jobs to arrive. By default, it does not wait,
+    so only jobs arriving while the previous batch is parsed are combined.
+    """
+
+    def __init__(self, parser: TimeIntervalParser, size: int = 256, delay: float = 0.0):
+        if size < 1:
+            raise ValueError(f"Batch size must be positive: {size}")
+        self.parser = parser
+        self.size = size
+        self.delay = delay
+        self.batches = 0
+        self.jobs = 0
+        self.queue: "queue.SimpleQueue[t.Optional[Job]]" = queue.SimpleQueue()
+        self.thread = threading.Thread(target=self.run, name="aika-batcher", daemon=True)
+        self.thread.start()
+
+    def submit(self, expressions: t.List[str], now: t.Optional[dt.datetime] = None) -> "Future[t.List[ParseResult]]":
+        job = Job(expressions=expressions, now=now)
+        self.queue.put(job)
+        return job.future
+
+    def close(self) -> None:
+        self.queue.put(None)
+        self.thread.join()
+
+    def run(self) -> None:
+        while True:
+            job = self.queue.get()
+            if job is None:
+                return
+            batch = [job]
+            count = len(job.expressions)
+            deadline = time.monotonic() + self.delay
+            while count < self.size:
+                try:
+                    job = self.queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if job is None:
+                    # Stop after this batch.
+                    self.queue.put(None)
+                    break
+                batch.append(job)
+                count += len(job.expressions)
+            self.process(batch)
+
+    def process(self, batch: t.List[Job]) -> None:
+        self.batches += 1
+        self.jobs += len(batch)
+        groups: t.Dict[t.Optional[dt.datetime], t.List[Job]] = {}
+        for job in batch:
+            groups.setdefault(job.now, []).append(job)
+        for now, jobs in groups.items():
+            try:
+                results = self.parse([when for job in jobs for when in job.expressions], now=now)
+            except Exception as ex:
+                for job in jobs:
+                    job.future.set_exception(ex)
+                continue
+            offset = 0
+            for job in jobs:
+                job.future.set_result(results[offset : offset + len(job.expressions)])
+                offset += len(job.expressions)
+
+    def parse(self, expressions: t.List[str], now: t.Optional[dt.datetime]) -> t.List[ParseResult]:
+        """
+        Parse expressions, each distinct expression only once.
+
+        Without reference time, expressions are parsed using the result cache of the parser.
+        """
+        if now is not None:
+            return list(self.parser.parse_many(expressions, now=now))
+        outcomes: t.Dict[str, ParseResult] = {}
+        results = []
+        for when in expressions:
+            result = outcomes.get(when)
+            if result is None:
+                try:
+                    result = ParseResult(when=when, value=self.parser.parse(when))
+                except Exception as ex:
+                    result = ParseResult(when=when, error=ex)
+                outcomes[when] = result
+            results.append(result)
+        return results
+
+
+class ParsingService:
+    """
+    Warm parsers and their batchers, per timezone and languages, and the latencies of the endpoints.
+
+    At most `max_parsers` configurations are served, to bound memory use.
+    """
+
+    def __init__(
+        self,
+        cache_size: t.Optional[int] = 4096,
+        batch_size: int = 256,
+        batch_delay: float = 0.0,
+        max_parsers: int = 16,
+    ):
+        self.cache_size = cache_size
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.max_parsers = max_parsers
+        self.metrics = Metrics()
+        # Batchers are created outside the lock, other requests for the same configuration wait for their future.
+        self.batchers: t.Dict[ParserKey, "Future[Batcher]"] = {}
+        self.lock = threading.Lock()
+
+    def batcher(self, tz: str = DEFAULT_TIMEZONE, languages: t.Optional[t.Sequence[str]] = None) -> Batcher:
+        """
+        Return the batcher of a configuration, creating and warming up its parser on first use.
+
+        Requests for other configurations are not blocked while a parser warms up.
+        """
+        key = (tz, tuple(languages) if languages is not None else None)
+        with self.lock:
+            future = self.batchers.get(key)
+            owner = future is None
+            if future is None:
+                validate(tz, languages)
+                if len(self.batchers) >= self.max_parsers:
+                    raise RequestError(f"Too many parser configurations, the limit is {self.max_parsers}")
+                future = self.batchers[key] = Future()
+        if owner:
+            try:
+                parser = TimeIntervalParser(tz=tz, languages=languages, cache_size=self.cache_size)
+                for _ in parser.parse_many(WARMUP):
+                    pass
+                future.set_result(Batcher(parser, size=self.batch_size, delay=self.batch_delay))
+            except Exception as ex:
+                with self.lock:
+                    self.batchers.pop(key, None)
+                future.set_exception(ex)
+        return future.result()
+
+    def parse(
+        self,
+        expressions: t.List[str],
+        now: t.Optional[dt.datetime] = None,
+        tz: str = DEFAULT_TIMEZONE,
+        languages: t.Optional[t.Sequence[str]] = None,
+    ) -> t.List[ParseResult]:
+        if not expressions:
+            return []
+        return self.batcher(tz, languages).submit(expressions, now=now).result()
+
+    def statistics(self) -> t.Dict[str, t.Any]:
+        """
+        Return latencies per endpoint, and batch and cache counters per parser.
+        """
+        with self.lock:
+            futures = list(self.batchers.items())
+        batchers = [(key, future.result()) for key, future in futures if future.done() and not future.exception()]
+        parsers = []
+        for (tz, languages), batcher in batchers:
+            cache = batcher.parser.cache_statistics()
+            parsers.append(
+                {
+                    "tz": tz,
+                    "languages": languages,
+                    "batches": batcher.batches,
+                    "jobs": batcher.jobs,
+                    "cache": dataclasses.asdict(cache) if cache is not None else None,
+                }
+            )
+        endpoints = {name: dataclasses.asdict(statistics) for name, statistics in self.metrics.snapshot().items()}
+        return {"endpoints": endpoints, "parsers": parsers}
+
+    def close(self) -> None:
+        with self.lock:
+            futures = list(self.batchers.values())
+            self.batchers.clear()
+        for future in futures:
+            if not future.exception():
+                future.result().close()
+
+
+def validate(tz: str, languages: t.Optional[t.Sequence[str]]) -> None:
+    """
+    Reject unknown timezones and languages, before they occupy a parser configuration.
+    """
+    import pendulum
+    from dateparser.data.languages_info import language_order
+
+    try:
+        pendulum.timezone(tz)
+    except Exception as ex:
+        raise RequestError(f"Invalid timezone: {tz}") from ex
+    for language in languages or ():
+        if language not in language_order:
+            raise RequestError(f"Invalid language: {language}")
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    """
+    Dispatch requests to the endpoints, and respond with JSON.
+    """
+
+    server: "ParsingServer"
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, avoid delaying the body on persistent connections.
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.dispatch("GET")
+
+    def do_POST(self):
+        self.dispatch("POST")
+
+    def dispatch(self, method: str) -> None:
+        started = time.perf_counter()
+        url = urllib.parse.urlsplit(self.path)
+        endpoint = f"{method} {url.path}"
+        handler = ENDPOINTS.get(endpoint)
+        try:
+            body = self.read_body() if method == "POST" else b""
+            if handler is None:
+                raise RequestError(f"Unknown endpoint: {endpoint}", status=404)
+            status, response = 200, handler(self, url.query, body)
+        except RequestError as ex:
+            status, response = ex.status, {"error": str(ex)}
+        except Exception as ex:
+            logger.exception("Request failed: %s", endpoint)
+            status, response = 500, {"error": str(ex)}
+        self.send_json(status, response)
+        # Unknown endpoints are not recorded, so the number of metrics is bounded.
+        if handler is not None:
+            self.server.service.metrics.record(endpoint, time.perf_counter() - started, ok=status < 400)
+
+    def read_body(self) -> bytes:
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError as ex:
+            raise RequestError("Invalid Content-Length") from ex
+        if length < 0:
+            raise RequestError("Invalid Content-Length")
+        if length > MAX_BODY_SIZE:
+            self.close_connection = True
+            raise RequestError(f"Request body too large, the limit is {MAX_BODY_SIZE} bytes", status=413)
+        return self.rfile.read(length)
+
+    def send_json(self, status: int, response: t.Any) -> None:
+        payload = json.dumps(response, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: t.Any) -> None:  # noqa: A002
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def parse_get(self, query: str, body: bytes) -> t.Dict[str, t.Any]:
+        params = {name: values[-1] for name, values in urllib.parse.parse_qs(query, keep_blank_values=True).items()}
+        if "q" not in params:
+            raise RequestError("Missing parameter: q")
+        return record(self.parse(params, [params["q"]])[0])
+
+    def parse_batch(self, query: str, body: bytes) -> t.Dict[str, t.Any]:
+        try:
+            params = json.loads(body)
+        except ValueError as ex:
+            raise RequestError(f"Invalid JSON: {ex}") from ex
+        if not isinstance(params, dict):
+            raise RequestError("Request body must be a JSON object")
+        expressions = params.get("expressions")
+        if not isinstance(expressions, list) or not all(isinstance(when, str) for when in expressions):
+            raise RequestError("Parameter `expressions` must be a list of strings")
+        return {"results": [record(result) for result in self.parse(params, expressions)]}
+
+    def parse(self, params: t.Mapping[str, t.Any], expressions: t.List[str]) -> t.List[ParseResult]:
+        """
+        Parse expressions using the reference time, timezone, and languages of the request parameters.
+        """
+        now = None
+        if params.get("now"):
+            try:
+                now = parse_now(str(params["now"]))
+            except argparse.ArgumentTypeError as ex:
+                raise RequestError(str(ex)) from ex
+        tz = params.get("tz") or self.server.tz
+        if not isinstance(tz, str):
+            raise RequestError("Parameter `tz` must be a string")
+        languages = params.get("languages") or self.server.languages
+        if isinstance(languages, str):
+            languages = languages.split(",")
+        if languages is not None and not all(isinstance(language, str) for language in languages):
+            raise RequestError("Parameter `languages` must be a list of strings")
+        return self.server.service.parse(expressions, now=now, tz=tz, languages=languages)
+
+    def health(self, query: str, body: bytes) -> t.Dict[str, t.Any]:
+        return {"status": "ok"}
+
+    def statistics(self, query: str, body: bytes) -> t.Dict[str, t.Any]:
+        return self.server.service.statistics()
+
+
+ENDPOINTS: t.Dict[str, t.Callable[[RequestHandler, str, bytes], t.Any]] = {
+    "GET /parse": RequestHandler.parse_get,
+    "POST /batch": RequestHandler.parse_batch,
+    "GET /stats": RequestHandler.statistics,
+    "GET /health": RequestHandler.health,
+}
+
+
+class ParsingServer(ThreadingHTTPServer):
+    """
+    An HTTP server handling each connection on its own thread, parsing using a shared `ParsingService`.
+
+    `tz` and `languages` are the defaults of requests not specifying them.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: t.Tuple[str, int],
+        service: t.Optional[ParsingService] = None,
+        tz: str = DEFAULT_TIMEZONE,
+        languages: t.Optional[t.Sequence[str]] = None,
+    ):
+        super().__init__(address, RequestHandler)
+        self.service = service or ParsingService()
+        self.tz = tz
+        self.languages = languages
+
+    @property
+    def url(self) -> str:
+        host, port = t.cast(t.Tuple[str, int], self.server_address[:2])
+        return f"http://{host}:{port}"
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.service.close()
+
+
+def main(argv: t.Optional[t.List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="aika-serve", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on, defaults to `127.0.0.1`")
+    parser.add_argument("--port", type=int, default=8712, help="Port to listen on, defaults to 8712")
+    parser.add_argument("--tz", default=DEFAULT_TIMEZONE, help="Default timezone of relative expressions")
+    parser.add_argument(
+        "--languages", type=lambda value: value.split(","), help="Default languages of dateparser, like `en,de`"
+    )
+    parser.add_argument(
+        "--cache-size", type=int, default=4096, help="Result cache size per parser, 0 disables, defaults to 4096"
+    )
+    parser.add_argument("--batch-size", type=int, default=256, help="Most expressions per batch, defaults to 256")
+    parser.add_argument(
+        "--batch-delay", type=float, default=0.0, help="Milliseconds to wait for more requests per batch"
+    )
+    parser.add_argument("--verbose", action="store_true", help="Log each request")
+    args = parser.parse_args(argv)
+    if args.batch_size < 1:
+        parser.error(f"Batch size must be positive: {args.batch_size}")
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
+    service = ParsingService(
+        cache_size=args.cache_size or None, batch_size=args.batch_size, batch_delay=args.batch_delay / 1000
+    )
+    with ParsingServer((args.host, args.port), service=service, tz=args.tz, languages=args.languages) as server:
+        # Warm up the parser of the default configuration, before accepting requests.
+        service.batcher(args.tz, args.languages)
+        logger.info("Serving on %s", server.url)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
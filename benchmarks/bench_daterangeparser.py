@@ -0,0 +1,74 @@
+"""
+Benchmark the DateRangeParser entries of the `TimeIntervalParser` cascade.
+
+Compares building the pyparsing grammar on each call, like `daterangeparser.parse`
+does, against reusing the grammar built once per process.
+
+Usage::
+
+    python benchmarks/bench_daterangeparser.py
+"""
+
+import timeit
+
+from daterangeparser import parse as daterangeparser_parse
+
+from aika.daterangeparser_german import create_daterangeparser_german, parse_german
+from aika.grammar import enable_packrat, parse_daterange, parse_english
+
+NUMBER = 200
+
+CORPUS = {
+    "en": ["1st july", "March 2024", "30 May to 9th Aug", "Wed 23 Jan -> Sat 16 February 2013"],
+    "de": ["1. Juli", "März 2024", "Juli bis Dezember", "Vom 3. März bis zum 9. März 2024"],
+}
+
+
+class GrammarPerCall:
+    """
+    Build the grammar on each call, like the vanilla `daterangeparser.parse`.
+    """
+
+    def __init__(self, factory):
+        self.factory = factory
+
+    def parse(self, text: str):
+        return self.factory().parseString(text)
+
+
+def parse_german_per_call(text: str):
+    return parse_daterange(GrammarPerCall(create_daterangeparser_german), text)  # type: ignore[arg-type]
+
+
+def run(label: str, fun, expressions) -> float:
+    def work():
+        for expression in expressions:
+            fun(expression)
+
+    seconds = min(timeit.repeat(work, number=NUMBER, repeat=3))
+    per_call = seconds / (NUMBER * len(expressions)) * 1e6
+    print(f"{label:<48} {per_call:10.1f} µs/call")
+    return per_call
+
+
+def main():
+    variants = (
+        ("en", daterangeparser_parse, parse_english),
+        ("de", parse_german_per_call, parse_german),
+    )
+    baseline = {}
+    for language, per_call, reused in variants:
+        expressions = CORPUS[language]
+        baseline[language] = run(f"DateRangeParser [{language}] per-call grammar", per_call, expressions)
+        after = run(f"DateRangeParser [{language}] shared grammar", reused, expressions)
+        print(f"{'':<48} {baseline[language] / after:10.1f} x faster")
+
+    # Packrat memoization is process-wide, so measure it last.
+    enable_packrat()
+    for language, _, reused in variants:
+        after = run(f"DateRangeParser [{language}] shared grammar, packrat", reused, CORPUS[language])
+        print(f"{'':<48} {baseline[language] / after:10.1f} x faster")
+
+
+if __name__ == "__main__":
+    main()
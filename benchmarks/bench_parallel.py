@@ -0,0 +1,59 @@
+"""
+Benchmark parsing many expressions using a pool of worker processes.
+
+Compares the throughput of `TimeIntervalParser.parse_many` in a single process
+against `ParallelParser` with an increasing number of worker processes.
+Deduplication is defeated by making each expression unique.
+
+Usage::
+
+    python benchmarks/bench_parallel.py [ITEMS]
+"""
+
+import os
+import sys
+import time
+
+from aika import TimeIntervalParser
+from aika.parallel import ParallelParser
+
+CORPUS = [
+    "{day} jul to {day} aug",
+    "{day}. Juli - {day}. August",
+    "2024-08-{day:02d}",
+    "-{day}d",
+    "{day} days ago",
+]
+
+
+def expressions(count: int):
+    for index in range(count):
+        yield CORPUS[index % len(CORPUS)].format(day=index % 28 + 1) + " " * (index // 140)
+
+
+def run(label: str, parse_many, count: int, baseline=None) -> float:
+    start = time.perf_counter()
+    for _ in parse_many(expressions(count)):
+        pass
+    seconds = time.perf_counter() - start
+    throughput = count / seconds
+    speedup = f"{throughput / baseline:6.1f} x" if baseline else ""
+    print(f"{label:<32} {throughput:10.0f} items/s {speedup}")
+    return throughput
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    baseline = run("parse_many, 1 process", TimeIntervalParser().parse_many, count)
+    processes = 1
+    while processes <= (os.cpu_count() or 1):
+        with ParallelParser(processes=processes) as pool:
+            # Let the workers start and warm up, before measuring.
+            for _ in pool.parse_many(["today"] * processes):
+                pass
+            run(f"ParallelParser, {processes} processes", pool.parse_many, count, baseline)
+        processes *= 2
+
+
+if __name__ == "__main__":
+    main()
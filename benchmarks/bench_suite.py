@@ -0,0 +1,271 @@
+"""
+Benchmark suite covering every parser of the `TimeIntervalParser` cascade.
+
+The corpus are the example expressions of the README, in English and German.
+All expressions are parsed relative to the same frozen reference time.
+
+Measures:
+
+- Each entry of `TimeIntervalParser.use_all_parsers()` on its own.
+- The full cascade, end to end.
+- Cold import time of the `aika` package.
+- First-call latency versus warm latency, and peak memory, in a fresh process.
+
+Usage::
+
+    python benchmarks/bench_suite.py --output before.json
+    python benchmarks/bench_suite.py --output after.json
+    python benchmarks/bench_suite.py --compare before.json after.json
+"""
+
+import argparse
+import datetime as dt
+import json
+import platform
+import re
+import subprocess
+import sys
+import time
+import timeit
+import typing as t
+from functools import partial
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+README = ROOT / "README.md"
+
+NOW = dt.datetime(2023, 8, 17, 23, 3, 17, tzinfo=dt.timezone(dt.timedelta(hours=2)))
+
+REPEAT = 5
+
+
+def corpus(readme: Path = README) -> t.Dict[str, t.List[str]]:
+    """
+    Read the example expressions from the README, grouped by section.
+    """
+    text = readme.read_text(encoding="utf-8")
+    text = text[text.index("### Example Expressions") : text.index("## Advanced Usage")]
+    sections: t.Dict[str, t.List[str]] = {}
+    section = None
+    for line in text.splitlines():
+        heading = re.match(r"#{4,5} (.+)", line)
+        if heading:
+            section = heading.group(1).replace("»", "/").strip()
+            continue
+        item = re.match(r"- (.+)", line)
+        if section is None or item is None:
+            continue
+        value = item.group(1).strip()
+        # Calendar notations are labelled, like `Month: 2025M02, 2025-02`.
+        if ":" in value and not value[0].isdigit() and not value.startswith("`"):
+            value = value.split(":", 1)[1]
+        for expression in re.split(r",\s+", value):
+            expression = expression.strip().strip("`").replace("\\.", ".")
+            if expression:
+                sections.setdefault(section, []).append(expression)
+    return sections
+
+
+def expressions() -> t.List[str]:
+    return [expression for items in corpus().values() for expression in items]
+
+
+def measure(fun: t.Callable[[], t.Any], calls: int) -> float:
+    """
+    Return the best time per call, in microseconds.
+    """
+    number = max(1, int(0.2 / max(timeit.timeit(fun, number=1), 1e-6)))
+    seconds = min(timeit.repeat(fun, number=number, repeat=REPEAT)) / number
+    return seconds / calls * 1e6
+
+
+def bench_parsers() -> t.Dict[str, t.Dict[str, float]]:
+    from aika import TimeIntervalParser
+
+    items = expressions()
+    results = {}
+    for parser in TimeIntervalParser().parsers:
+        succeeded = []
+        failed = []
+        for when in items:
+            try:
+                call(parser, when)
+                succeeded.append(when)
+            except Exception:
+                failed.append(when)
+        results[parser.name] = {
+            "succeeded": len(succeeded),
+            "failed": len(failed),
+            "success_us": measure(partial(run, parser, succeeded), len(succeeded)) if succeeded else 0.0,
+            "failure_us": measure(partial(run, parser, failed), len(failed)) if failed else 0.0,
+        }
+    return results
+
+
+def call(parser, when: str):
+    if parser.clocked:
+        return parser.fun(when, now=NOW)
+    return parser.fun(when)
+
+
+def run(parser, items: t.List[str]):
+    for when in items:
+        try:
+            call(parser, when)
+        except Exception:  # noqa: S110
+            pass
+
+
+def bench_cascade() -> t.Dict[str, t.Dict[str, float]]:
+    from aika import TimeIntervalParser
+
+    ti = TimeIntervalParser()
+
+    def cascade(items):
+        for when in items:
+            try:
+                ti.adjust(when, *ti.run_parsers(when, now=NOW))
+            except ValueError:
+                pass
+
+    results = {}
+    for section, items in corpus().items():
+        results[section] = {"expressions": len(items), "us": measure(lambda items=items: cascade(items), len(items))}
+    items = expressions()
+    results["total"] = {"expressions": len(items), "us": measure(lambda: cascade(items), len(items))}
+    return results
+
+
+def bench_import() -> float:
+    """
+    Return the best cold import time of the `aika` package in a fresh process, in milliseconds.
+    """
+    code = "import time; start = time.perf_counter(); import aika; print(time.perf_counter() - start)"
+    timings = [float(subprocess.check_output([sys.executable, "-c", code], cwd=ROOT)) for _ in range(REPEAT)]  # noqa: S603
+    return min(timings) * 1e3
+
+
+def bench_first_call() -> t.Dict[str, float]:
+    """
+    Parse the corpus twice in a fresh process, and report latencies and peak memory.
+    """
+    output = subprocess.check_output([sys.executable, __file__, "--first-call"], cwd=ROOT)  # noqa: S603
+    return json.loads(output)
+
+
+def first_call() -> t.Dict[str, float]:
+    import tracemalloc
+
+    tracemalloc.start()
+    from aika import TimeIntervalParser
+
+    ti = TimeIntervalParser()
+    items = expressions()
+
+    def cascade():
+        latencies = []
+        for when in items:
+            start = time.perf_counter()
+            try:
+                ti.adjust(when, *ti.run_parsers(when, now=NOW))
+            except ValueError:
+                pass
+            latencies.append(time.perf_counter() - start)
+        return latencies
+
+    cold = cascade()
+    warm = cascade()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    result = {
+        "first_call_ms": cold[0] * 1e3,
+        "cold_total_ms": sum(cold) * 1e3,
+        "cold_max_ms": max(cold) * 1e3,
+        "warm_total_ms": sum(warm) * 1e3,
+        "warm_max_ms": max(warm) * 1e3,
+        "peak_traced_mib": peak / 2**20,
+    }
+    try:
+        import resource
+
+        # Kilobytes on Linux, bytes on macOS.
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        result["max_rss_mib"] = maxrss / (2**20 if sys.platform == "darwin" else 2**10)
+    except ImportError:
+        pass
+    return result
+
+
+def revision() -> t.Optional[str]:
+    try:
+        command = ["git", "describe", "--always", "--dirty"]
+        return subprocess.check_output(command, cwd=ROOT, text=True, stderr=subprocess.DEVNULL).strip()  # noqa: S603
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main_run(output: t.Optional[str]):
+    results = {
+        "meta": {
+            "revision": revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": dt.datetime.now(dt.timezone.utc).isoformat(),
+            "reference_time": NOW.isoformat(),
+        },
+        "import_ms": bench_import(),
+        "first_call": bench_first_call(),
+        "parsers": bench_parsers(),
+        "cascade": bench_cascade(),
+    }
+    report(results)
+    if output:
+        Path(output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+def flatten(results: t.Dict[str, t.Any], prefix: str = "") -> t.Dict[str, float]:
+    flat = {}
+    for key, value in results.items():
+        if key == "meta":
+            continue
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, prefix=f"{name} » "))
+        else:
+            flat[name] = value
+    return flat
+
+
+def report(results: t.Dict[str, t.Any]):
+    print(f"Revision {results['meta']['revision']}, Python {results['meta']['python']}")
+    for name, value in flatten(results).items():
+        print(f"{name:<72} {value:12.1f}")
+
+
+def main_compare(before: str, after: str):
+    old = flatten(json.loads(Path(before).read_text(encoding="utf-8")))
+    new = flatten(json.loads(Path(after).read_text(encoding="utf-8")))
+    print(f"{'':<72} {'before':>12} {'after':>12} {'ratio':>8}")
+    for name, value in new.items():
+        if name not in old:
+            continue
+        ratio = f"{old[name] / value:7.2f}x" if value else ""
+        print(f"{name:<72} {old[name]:12.1f} {value:12.1f} {ratio:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", help="Save results as JSON to this file")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="Compare two JSON result files")
+    parser.add_argument("--first-call", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.first_call:
+        print(json.dumps(first_call()))
+    elif args.compare:
+        main_compare(*args.compare)
+    else:
+        main_run(args.output)
+
+
+if __name__ == "__main__":
+    main()
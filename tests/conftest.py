@@ -1,3 +1,7 @@
+# aika imports them on first use. Import them upfront, because importing
+# them while freezegun patches the `datetime` module breaks them.
+import dateparser  # noqa: F401
+import pendulum  # noqa: F401
 import pytest
 
 from aika import DaterangeExpression, TimeIntervalParser
@@ -0,0 +1,99 @@
+import datetime as dt
+
+from aika import TimeIntervalParser
+from aika.adaptive import CascadeProfile, Observation
+
+NOW = dt.datetime(2023, 8, 17, 21, 3, 17, tzinfo=dt.timezone.utc)
+
+EXPRESSIONS = ["2025W01", "2025Q01", "2025", "-1d", "today", "jul 1 to jul 7", "1. Juli", "foobar"]
+
+A = (dt.datetime(2000, 1, 1), None)
+B = (dt.datetime(2000, 1, 2), None)
+
+
+def profile_of(*observations: Observation) -> CascadeProfile:
+    ti = TimeIntervalParser()
+    ti.clear_parsers()
+    for name in ["first", "second", "third"]:
+        ti.add_parser(lambda when: A, name=name)
+    profile = CascadeProfile(ti)
+    for observation in observations:
+        profile.observations[observation.when] = observation
+    return profile
+
+
+def test_observation_result():
+    observation = Observation(
+        when="a",
+        shape="text",
+        results={"first": None, "second": A, "third": B},
+        seconds={"first": 1.0, "second": 2.0, "third": 0.5},
+    )
+    assert observation.result(["first", "second", "third"]) == (A, 3.0)
+    assert observation.result(["third", "second"]) == (B, 0.5)
+    assert observation.result(["first"]) == (None, 1.0)
+    assert observation.result(["unknown"]) == (None, 0.0)
+
+
+def test_order_cheapest():
+    profile = profile_of(
+        Observation("a", "text", {"first": None, "second": None, "third": A}, {"first": 1, "second": 2, "third": 1}),
+        Observation("b", "text", {"first": None, "second": B, "third": None}, {"first": 1, "second": 3, "third": 1}),
+    )
+    assert profile.latency("text") == 4
+    assert profile.order("text") == ["third", "second", "first"]
+    assert profile.latency("text", ["third", "second", "first"]) == 2.5
+    assert profile.export() == {"text": ["third", "second", "first"]}
+
+
+def test_order_retains_results():
+    """
+    Orders returning a different result for any expression of the sample are rejected.
+    """
+    profile = profile_of(
+        Observation("a", "text", {"first": None, "second": A, "third": B}, {"first": 5, "second": 5, "third": 1}),
+    )
+    assert profile.order("text") == ["second", "first", "third"]
+
+
+def test_order_keeps_original_without_gain():
+    profile = profile_of(
+        Observation("a", "text", {"first": A, "second": B}, {"first": 1, "second": 1}),
+    )
+    assert profile.order("text") == ["first", "second"]
+
+
+def test_statistics():
+    profile = profile_of(
+        Observation("a", "text", {"first": None, "second": A}, {"first": 1, "second": 2}),
+        Observation("1", "numeric", {"first": A}, {"first": 4}),
+    )
+    statistics = profile.statistics()
+    assert [(item.name, item.attempts, item.successes, item.failures, item.total) for item in statistics.values()] == [
+        ("first", 2, 1, 1, 5),
+        ("second", 1, 1, 0, 2),
+    ]
+    assert list(profile.statistics("numeric")) == ["first"]
+
+
+def test_learned_order_same_results():
+    ti = TimeIntervalParser()
+    profile = CascadeProfile(ti)
+    profile.observe(EXPRESSIONS, now=NOW)
+    profile.observe(EXPRESSIONS, now=NOW)
+    assert list(profile.observations) == EXPRESSIONS
+    assert profile.shapes == ["calendar", "delta", "text"]
+    assert profile.observations["2025W01"].results.keys() == {
+        "calendar-notation",
+        "arbitrary-dateparser [de]",
+        "arbitrary-dateparser [en]",
+        "DUDP [all]",
+    }
+
+    pinned = TimeIntervalParser(parser_order=profile.export())
+    assert pinned.parser_order == {shape: tuple(order) for shape, order in profile.export().items()}
+    for when in EXPRESSIONS:
+        observation = profile.observations[when]
+        order = profile.order(observation.shape)
+        assert pinned.route(when).names == [name for name in order if name in observation.results]
+        assert list(pinned.parse_many([when], now=NOW))[0].value == list(ti.parse_many([when], now=NOW))[0].value
@@ -0,0 +1,123 @@
+import asyncio
+import datetime as dt
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from freezegun import freeze_time
+
+from aika import DaterangeExpression, TimeInterval, TimeIntervalParser
+from aika.aio import AsyncParser
+from tests.conftest import TESTDRIVE_DATETIME
+
+EXPRESSIONS = ["today", "foobar", "2025Q01", "Sat - Tue", "jul 1 to jul 7", "2024-08-20", "today"]
+
+
+@freeze_time(TESTDRIVE_DATETIME)
+@pytest.mark.parametrize("parser", [TimeIntervalParser, DaterangeExpression])
+def test_aparse(parser):
+    ti = parser()
+    assert asyncio.run(ti.aparse("Sat - Tue")) == ti.parse("Sat - Tue")
+
+
+def test_aparse_error():
+    with pytest.raises(ValueError) as ex:
+        asyncio.run(TimeIntervalParser().aparse("foobar"))
+    assert ex.match("Failed detecting start date: foobar")
+
+
+@freeze_time(TESTDRIVE_DATETIME)
+def test_aparse_many():
+    ti = TimeIntervalParser()
+
+    async def stream():
+        for when in EXPRESSIONS:
+            yield when
+
+    async def collect(expressions):
+        return [result async for result in ti.aparse_many(expressions)]
+
+    for expressions in [EXPRESSIONS, stream()]:
+        results = asyncio.run(collect(expressions))
+        assert [result.when for result in results] == EXPRESSIONS
+        assert [result.ok for result in results] == [True, False, True, True, True, True, True]
+        assert results[0].value == TimeInterval(dt.datetime(2023, 8, 17), dt.datetime(2023, 8, 17, 23, 59, 59, 999999))
+        assert str(results[1].error) == "Failed detecting start date: foobar"
+
+
+def test_aparse_merges_inflight():
+    ti = TimeIntervalParser()
+    calls = []
+    release = threading.Event()
+
+    def slow(when):
+        calls.append(when)
+        release.wait(timeout=5)
+        return dt.datetime(2000, 1, 1), None
+
+    ti.clear_parsers()
+    ti.add_parser(slow, name="slow")
+
+    async def main():
+        requests = [asyncio.ensure_future(ti.aparse(when)) for when in ["a", "a", "b", "a"]]
+        await asyncio.sleep(0.1)
+        release.set()
+        results = await asyncio.gather(*requests)
+        await asyncio.sleep(0)
+        assert ti.aio.state().inflight == {}
+        return results
+
+    results = asyncio.run(main())
+    assert sorted(calls) == ["a", "b"]
+    assert results == [TimeInterval(dt.datetime(2000, 1, 1))] * 4
+    assert results[0] is results[1]
+
+
+def test_aparse_concurrency_limit():
+    ti = TimeIntervalParser()
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def tracking(when):
+        with lock:
+            running.append(when)
+            peak.append(len(running))
+        threading.Event().wait(0.02)
+        with lock:
+            running.remove(when)
+        return dt.datetime(2000, 1, 1), None
+
+    ti.clear_parsers()
+    ti.add_parser(tracking, name="tracking")
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        ti.aio = AsyncParser(ti, executor=executor, concurrency=2)
+
+        async def main():
+            return [result async for result in ti.aparse_many(str(index) for index in range(10))]
+
+        results = asyncio.run(main())
+    assert len(results) == 10
+    assert max(peak) <= 2
+
+
+def test_aparse_multiple_event_loops():
+    """
+    The adapter of a parser is reused across event loops, like consecutive `asyncio.run` calls.
+    """
+    ti = TimeIntervalParser()
+    ti.aio = AsyncParser(ti, concurrency=1)
+    now = dt.datetime(2023, 8, 17, 23, 3, 17, tzinfo=dt.timezone(dt.timedelta(hours=2)))
+
+    async def main():
+        return await asyncio.gather(*[ti.aparse(when, now=now) for when in ["2025Q01", "today", "2024-08-20"]])
+
+    for _ in range(3):
+        assert asyncio.run(main())[1] == TimeInterval(
+            dt.datetime(2023, 8, 17), dt.datetime(2023, 8, 17, 23, 59, 59, 999999)
+        )
+
+
+def test_async_parser_invalid_concurrency():
+    with pytest.raises(ValueError):
+        AsyncParser(TimeIntervalParser(), concurrency=0)
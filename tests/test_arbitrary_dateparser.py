@@ -2,8 +2,10 @@
 # Distributed under the terms of the LGPL license, see LICENSE.
 
 import datetime as dt
+import subprocess
 import sys
 
+import pytest
 from freezegun import freeze_time
 
 from aika import TimeIntervalParser
@@ -213,3 +215,170 @@ def test_months():
             dt.datetime(2023, 12, 31, 17, 0, 0),
         )
     )
+
+
+def test_arbitrary_parser_reused():
+    """
+    `arbitrary-dateparser` instances are created once per language and timezone.
+    """
+    from aika.core import arbitrary_parser_english, get_arbitrary_parser
+
+    assert get_arbitrary_parser("en") is arbitrary_parser_english
+    assert get_arbitrary_parser("de") is get_arbitrary_parser("de")
+    assert get_arbitrary_parser("de", tz="UTC") is not get_arbitrary_parser("de")
+    assert get_arbitrary_parser("de", tz="UTC").tz == "UTC"
+
+
+@freeze_time(TESTDRIVE_DATETIME)
+def test_arbitrary_parser_threaded():
+    """
+    A shared `arbitrary-dateparser` instance can be used from multiple threads, without locking.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from aika.core import adp_parse_german
+
+    expressions = ["morgen", "nächste woche", "letzten monat", "1. juli bis 7. juli"] * 25
+    expected = [adp_parse_german(expression) for expression in expressions]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert list(executor.map(adp_parse_german, expressions)) == expected
+
+
+def test_arbitrary_parser_threaded_reference_times():
+    """
+    Concurrent calls with different reference times on a shared instance do not interfere.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from aika.core import get_arbitrary_parser
+
+    parser = get_arbitrary_parser("en")
+    days = [dt.datetime(2020, 1, 1, 12, tzinfo=dt.timezone.utc) + dt.timedelta(days=day) for day in range(200)]
+
+    def tomorrow(now):
+        return parser("tomorrow", now=now).start.date()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(tomorrow, days))
+    assert results == [(now + dt.timedelta(days=1)).date() for now in days]
+
+
+def test_phrase_tables_lazy_and_shared():
+    """
+    Phrase tables are shared per timezone and reference date, and computed on demand.
+    """
+    from aika.arbitrary_dateparser import DateParser, phrase_tables
+
+    phrase_tables.cache_clear()
+    with freeze_time(TESTDRIVE_DATETIME):
+        parser = DateParser(tz="Europe/Berlin")
+        other = DateParser(tz="Europe/Berlin")
+        assert parser.date_phrases is other.date_phrases
+        assert "next fri" in parser.date_phrases
+        assert "next fri" not in parser.date_phrases.computed
+        assert parser("next friday").start == parser.date_phrases["next fri"]
+        assert "next fri" in parser.date_phrases.computed
+        assert "next mon" not in parser.date_phrases.computed
+        tables = parser.date_phrases, parser.period_phrases
+
+    with freeze_time("2023-08-17T23:59:00+0200"):
+        parser("now")
+        assert parser.reference()[1:] == tables
+
+    with freeze_time("2023-08-18T00:01:00+0200"):
+        assert parser("today").start == dt.datetime(2023, 8, 18, tzinfo=parser.today.tzinfo)
+        assert parser.reference().date_phrases is not tables[0]
+
+    # Calls do not modify the state of the instance.
+    assert (parser.date_phrases, parser.period_phrases) == tables
+
+
+def test_format_index():
+    """
+    Normalized date strings are dispatched to the formats matching their shape only.
+    """
+    from aika.arbitrary_dateparser import DateParser, FormatIndex
+
+    parser = DateParser(tz="Europe/Berlin")
+    assert set(parser.format_index["Jul 1"]) == {"MMM D", "MMMM D", "MMM DD", "MMMM DD"}
+    assert all("[Of]" in date_format for date_format in parser.format_index["1 Of Jul 2024"])
+    assert parser.format_index["123 Foo"] == []
+
+    # Candidates keep the order of precedence.
+    candidates = parser.format_index["1 Of Jul 2024"]
+    assert candidates == [date_format for date_format in parser.date_formats if date_format in candidates]
+
+    # Formats which can not be indexed are always candidates.
+    index = FormatIndex(["MMM D", "DDDD [Day Of] YYYY", "DDMM"])
+    assert index["Jul 1"] == ["MMM D", "DDDD [Day Of] YYYY", "DDMM"]
+    assert index["Foo"] == ["DDDD [Day Of] YYYY", "DDMM"]
+
+
+def test_tokenizer():
+    """
+    Date strings are normalized using the vocabulary compiled into the tokenizer.
+    """
+    from aika.arbitrary_dateparser import DateParser
+    from aika.dateparser_german import DateParserGerman
+
+    parser = DateParser(tz="UTC")
+    assert parser.normalize_date(" Last Friday, July 1st ") == "previous fri jul 1"
+    assert parser.normalize_date("1st  of july 2024") == "1 of jul 2024"
+    assert parser.normalize_date("22nd-Aug foo  3rd") == "22 aug 3"
+    assert parser.split_datetime_string("jul 1 to jul 7") == ["jul 1", "jul 7"]
+    assert parser.split_datetime_string("jul 1") == ["jul 1"]
+
+    german = DateParserGerman(tz="UTC")
+    assert german.normalize_date("Letzten Freitag") == "vorherigen fr"
+    assert german.normalize_date("kommendes Jahr") == "nächstes jahr"
+    assert german.normalize_date("1. Juli, 2024") == "1. jul 2024"
+    assert german.split_datetime_string("1.7. - 7.7.") in (["1.7. ", " 7.7."], ["1.7.", "7.7."])
+
+    # The vocabulary is compiled when the parser is created, and when asked for.
+    parser.replaced_words["in"] = "this"
+    assert parser.normalize_date("in july") == "jul"
+    parser.compile()
+    assert parser.normalize_date("in july") == "this jul"
+
+
+@freeze_time(TESTDRIVE_DATETIME)
+def test_format_index_strict():
+    """
+    The strict length check and the two-digit year fix still apply.
+    """
+    from aika.arbitrary_dateparser import DateParser
+
+    assert DateParser(tz="UTC").convert_normalized_date("jul 1 2024", refresh=False).date() == dt.date(2024, 7, 1)
+    with pytest.raises(ValueError):
+        DateParser(tz="UTC").convert_normalized_date("jul 1 024", refresh=False)
+    assert DateParser(tz="UTC", strict=False).convert_normalized_date("jul 1 024", refresh=False).date() == dt.date(
+        2024, 7, 1
+    )
+
+
+def test_german_without_setlocale():
+    """
+    Importing and using the German parser must not switch the process-wide locale.
+    """
+    code = """
+import locale
+
+def fail(*args, **kwargs):
+    raise AssertionError("setlocale invoked")
+
+locale.setlocale = fail
+
+from aika.dateparser_german import DateParserGerman
+assert DateParserGerman()("heute")
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+
+def test_calendar_names():
+    from aika import dateparser_german
+    from aika.arbitrary_dateparser import DAY_NAMES, MONTH_NAMES
+
+    assert MONTH_NAMES[2] == "march"
+    assert DAY_NAMES[0] == "monday"
+    assert dateparser_german.MONTH_NAMES[2] == "märz"
+    assert dateparser_german.DAY_NAMES_ABBREVIATED[0] == "mo"
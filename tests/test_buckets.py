@@ -0,0 +1,98 @@
+import datetime as dt
+import random
+
+import pytest
+
+from aika import BucketIndex, IntervalSet, TimeInterval
+
+INTERVALS = [
+    TimeInterval(dt.datetime(2025, 1, 1), dt.datetime(2025, 3, 31, 23, 59, 59)),
+    TimeInterval(dt.datetime(2025, 5, 1), dt.datetime(2025, 6, 1)),
+    TimeInterval(dt.datetime(2025, 8, 1)),
+]
+
+TIMESTAMPS = [
+    dt.datetime(2024, 12, 31, 23, 59, 59, 999999),
+    dt.datetime(2025, 1, 1),
+    dt.datetime(2025, 3, 31, 23, 59, 59),
+    dt.datetime(2025, 3, 31, 23, 59, 59, 1),
+    dt.datetime(2025, 6, 1),
+    dt.datetime(2025, 7, 1),
+    dt.datetime(2025, 8, 1),
+    dt.datetime(9999, 12, 31),
+]
+
+EXPECTED = [-1, 0, 0, -1, 1, -1, 2, 2]
+
+
+def test_bucket_index_classify():
+    index = BucketIndex(INTERVALS)
+    assert len(index) == 3
+    assert list(index.classify(TIMESTAMPS)) == EXPECTED
+    assert [index.lookup(when) for when in TIMESTAMPS] == EXPECTED
+    assert index.intervals[index.lookup(dt.datetime(2025, 5, 17))] == INTERVALS[1]
+    assert list(BucketIndex([]).classify(TIMESTAMPS)) == [-1] * len(TIMESTAMPS)
+
+
+def test_bucket_index_interval_set():
+    intervals = IntervalSet([*INTERVALS, TimeInterval(dt.datetime(2025, 6, 1), dt.datetime(2025, 6, 30))])
+    index = BucketIndex(intervals)
+    assert list(index.classify(TIMESTAMPS)) == [-1, 0, 0, -1, 1, -1, 2, 2]
+    assert index.lookup(dt.datetime(2025, 6, 17)) == 1
+
+
+def test_bucket_index_aware():
+    utc = dt.timezone.utc
+    index = BucketIndex([TimeInterval(dt.datetime(2025, 1, 1, tzinfo=utc), dt.datetime(2025, 1, 2, tzinfo=utc))])
+    cest = dt.timezone(dt.timedelta(hours=2))
+    timestamps = [dt.datetime(2025, 1, 1, 1, tzinfo=cest), dt.datetime(2025, 1, 2, 1, tzinfo=cest)]
+    assert list(index.classify(timestamps)) == [-1, 0]
+    with pytest.raises(ValueError):
+        index.lookup(dt.datetime(2025, 1, 1))
+
+
+@pytest.mark.parametrize(
+    "intervals",
+    [
+        [INTERVALS[1], INTERVALS[0]],
+        [INTERVALS[2], INTERVALS[2]],
+        [INTERVALS[0], TimeInterval(dt.datetime(2025, 3, 31, 23, 59, 59))],
+        [TimeInterval(dt.datetime(2025, 1, 2), dt.datetime(2025, 1, 1))],
+    ],
+)
+def test_bucket_index_invalid(intervals):
+    with pytest.raises(ValueError):
+        BucketIndex(intervals)
+
+
+def test_bucket_index_chunks():
+    index = BucketIndex(INTERVALS)
+    chunks = list(index.classify_chunks(iter(TIMESTAMPS), size=3))
+    assert [list(chunk) for chunk in chunks] == [EXPECTED[:3], EXPECTED[3:6], EXPECTED[6:]]
+    chunks = list(index.classify_chunks([TIMESTAMPS[:5], TIMESTAMPS[5:]]))
+    assert [list(chunk) for chunk in chunks] == [EXPECTED[:5], EXPECTED[5:]]
+
+
+def test_bucket_index_numpy():
+    numpy = pytest.importorskip("numpy")
+    index = BucketIndex(INTERVALS)
+    timestamps = numpy.array([*TIMESTAMPS, "NaT"], dtype="datetime64[us]")
+    result = index.classify(timestamps)
+    assert result.dtype == numpy.int64
+    assert result.tolist() == [*EXPECTED, -1]
+    assert index.classify(timestamps.astype("datetime64[s]")).tolist()[:3] == [-1, 0, 0]
+    assert BucketIndex([]).classify(timestamps).tolist() == [-1] * 9
+    chunks = index.classify_chunks([timestamps[:4], timestamps[4:]])
+    assert numpy.concatenate(list(chunks)).tolist() == [*EXPECTED, -1]
+
+
+def test_bucket_index_brute_force():
+    rng = random.Random(42)  # noqa: S311
+    epoch = dt.datetime(2025, 1, 1)
+    intervals = IntervalSet(
+        TimeInterval(epoch + dt.timedelta(seconds=start), epoch + dt.timedelta(seconds=start + rng.randint(0, 50)))
+        for start in rng.sample(range(10000), 200)
+    )
+    timestamps = [epoch + dt.timedelta(seconds=rng.randint(-100, 10100)) for _ in range(2000)]
+    expected = [next((i for i, x in enumerate(intervals) if x.start <= when <= x.end), -1) for when in timestamps]
+    assert list(BucketIndex(intervals).classify(timestamps)) == expected
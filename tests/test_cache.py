@@ -0,0 +1,142 @@
+import dataclasses
+import datetime as dt
+
+import pytest
+from freezegun import freeze_time
+
+from aika import DaterangeExpression, TimeInterval, TimeIntervalParser
+from aika.cache import FOREVER, CacheEntry, ResultCache, expiry
+from tests.conftest import TESTDRIVE_DATETIME
+
+
+def test_cache_disabled_by_default(ti):
+    assert ti.cache is None
+    assert ti.cache_statistics() is None
+
+
+@freeze_time(TESTDRIVE_DATETIME)
+def test_cache_hit_same_result():
+    uncached = TimeIntervalParser()
+    cached = TimeIntervalParser(cache_size=16)
+    for when in ["today", "last week", "2025Q01", "Sat - Tue", "2024-08-20"]:
+        assert cached.parse(when) == uncached.parse(when)
+        assert cached.parse(when) == uncached.parse(when)
+    stats = cached.cache_statistics()
+    assert stats.hits == 5
+    assert stats.misses == 5
+    assert stats.size == 5
+
+
+@freeze_time(TESTDRIVE_DATETIME)
+def test_cache_returns_immutable_interval():
+    ti = TimeIntervalParser(cache_size=16)
+    first = ti.parse("today")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.start = None
+    assert ti.parse("today") == TimeInterval(
+        start=dt.datetime(2023, 8, 17, 0, 0),
+        end=dt.datetime(2023, 8, 17, 23, 59, 59, 999999),
+    )
+
+
+@freeze_time(TESTDRIVE_DATETIME)
+def test_cache_key_covers_settings():
+    ti = DaterangeExpression(cache_size=16)
+    assert ti.parse("today") == (dt.datetime(2023, 8, 17, 0, 0), dt.datetime(2023, 8, 17, 23, 59, 59, 999999))
+    ti.default_start_time = dt.time(hour=8)
+    assert ti.parse("today") == (dt.datetime(2023, 8, 17, 8, 0), dt.datetime(2023, 8, 17, 23, 59, 59, 999999))
+    assert ti.cache_statistics().hits == 0
+
+
+def test_cache_relative_expires_at_day_boundary():
+    ti = TimeIntervalParser(cache_size=16)
+    with freeze_time("2023-08-17T23:03:17+0200"):
+        assert ti.parse("today").start == dt.datetime(2023, 8, 17)
+        assert ti.parse("2025Q01").start == dt.datetime(2025, 1, 1)
+    with freeze_time("2023-08-18T00:00:01+0200"):
+        assert ti.parse("today").start == dt.datetime(2023, 8, 18)
+        assert ti.parse("2025Q01").start == dt.datetime(2025, 1, 1)
+    stats = ti.cache_statistics()
+    assert stats.expirations == 1
+    assert stats.hits == 1
+
+
+def test_cache_invalid_calendar_notation():
+    """
+    Malformed calendar notations fall through to other parsers, their results expire like relative ones.
+    """
+    ti = TimeIntervalParser(cache_size=16)
+    with freeze_time("2023-08-17T23:03:17+0200"):
+        assert ti.parse("2025M13").start == dt.datetime(2025, 8, 13)
+    with freeze_time("2023-09-17T12:00:00+0200"):
+        assert ti.parse("2025M13").start == dt.datetime(2025, 9, 13)
+    assert ti.cache_statistics().expirations == 1
+
+
+def test_cache_now_not_cached():
+    ti = TimeIntervalParser(cache_size=16)
+    with freeze_time("2023-08-17T10:00:00+0200"):
+        first = ti.parse("now")
+    with freeze_time("2023-08-17T10:00:05+0200"):
+        second = ti.parse("now")
+    assert second.start - first.start == dt.timedelta(seconds=5)
+    assert ti.cache_statistics().size == 0
+
+
+@freeze_time(TESTDRIVE_DATETIME)
+def test_cache_negative_entries():
+    ti = TimeIntervalParser(cache_size=16)
+    calls = []
+    ti.add_parser(lambda when: calls.append(when) or 1 / 0, name="failing")
+    for _ in range(3):
+        with pytest.raises(ValueError) as ex:
+            ti.parse("foobar")
+        assert ex.match("Failed detecting start date: foobar")
+    assert calls == ["foobar"]
+    assert ti.cache_statistics().hits == 2
+
+
+@freeze_time(TESTDRIVE_DATETIME)
+def test_cache_parse_single():
+    ti = TimeIntervalParser(cache_size=16)
+    assert ti.parse_single("2025M01") == ti.parse_single("2025M01") == dt.datetime(2025, 1, 1)
+    assert ti.cache_statistics().hits == 1
+
+
+@freeze_time(TESTDRIVE_DATETIME)
+def test_cache_add_parser_clears():
+    ti = TimeIntervalParser(cache_size=16)
+    ti.parse("today")
+    ti.add_parser(lambda when: (dt.datetime(2000, 1, 1), None), name="custom")
+    assert ti.cache_statistics().size == 0
+
+
+def test_result_cache_eviction():
+    cache = ResultCache(maxsize=2)
+    for key in "abc":
+        cache.put(key, CacheEntry(value=key, error=None, expires=FOREVER))
+    assert cache.get("a") is None
+    assert cache.get("b").value == "b"
+    cache.put("d", CacheEntry(value="d", error=None, expires=FOREVER))
+    assert cache.get("b") is not None
+    assert cache.get("c") is None
+    stats = cache.statistics
+    assert stats.evictions == 2
+    assert stats.size == 2
+
+
+def test_result_cache_invalid_size():
+    with pytest.raises(ValueError):
+        ResultCache(maxsize=0)
+
+
+@freeze_time(TESTDRIVE_DATETIME)
+def test_expiry():
+    midnight = dt.datetime(2023, 8, 18, 0, 0, tzinfo=dt.timezone(dt.timedelta(hours=2))).timestamp()
+    week = (dt.datetime(2024, 12, 30), dt.datetime(2025, 1, 5, 23, 59, 59, 999999))
+    assert expiry("2025W01", week, "Europe/Berlin", parser="calendar-notation") == FOREVER
+    assert expiry("2025W01", week, "Europe/Berlin", parser="DUDP [all]") == midnight
+    assert expiry("2025W00", None, "Europe/Berlin") == midnight
+    assert expiry("today", (dt.datetime(2023, 8, 17), None), "Europe/Berlin") == midnight
+    assert expiry("foobar", None, "Europe/Berlin") == midnight
+    assert expiry("at ten", (dt.datetime(2023, 8, 17, 10, 0), None), "Europe/Berlin") is None
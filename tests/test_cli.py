@@ -0,0 +1,99 @@
+import io
+import json
+
+import pytest
+
+from aika.cli import main
+
+NOW = "2023-08-17T23:03:17+02:00"
+
+INPUT = "today\nfoobar\n\n2025Q01\n"
+
+
+def run(capsys, monkeypatch, *args, stdin=INPUT):
+    monkeypatch.setattr("sys.stdin", io.StringIO(stdin))
+    status = main(["--now", NOW, *args])
+    captured = capsys.readouterr()
+    return status, captured.out, captured.err
+
+
+def test_cli_iso(capsys, monkeypatch):
+    status, out, err = run(capsys, monkeypatch)
+    assert status == 0
+    assert out.splitlines() == [
+        "2023-08-17T00:00:00/2023-08-17T23:59:59.999999",
+        "",
+        "",
+        "2025-01-01T00:00:00/2025-03-31T23:59:59",
+    ]
+    assert err == "Line 2: Failed detecting start date: foobar\n"
+
+
+def test_cli_jsonl(capsys, monkeypatch):
+    status, out, _ = run(capsys, monkeypatch, "--format", "jsonl")
+    assert status == 0
+    lines = out.splitlines()
+    assert json.loads(lines[0]) == {
+        "input": "today",
+        "start": "2023-08-17T00:00:00",
+        "end": "2023-08-17T23:59:59.999999",
+        "error": None,
+    }
+    assert json.loads(lines[1]) == {
+        "input": "foobar",
+        "start": None,
+        "end": None,
+        "error": "Failed detecting start date: foobar",
+    }
+    assert lines[2] == ""
+
+
+def test_cli_files(capsys, monkeypatch, tmp_path):
+    first = tmp_path / "first.txt"
+    first.write_text("today\r\n")
+    second = tmp_path / "second.txt"
+    second.write_text("2025Q01\n")
+    status, out, _ = run(capsys, monkeypatch, "--format", "lucene", str(first), "-", str(second), stdin="foobar\n")
+    assert status == 0
+    assert out.splitlines() == [
+        "[2023-08-17T00:00:00 TO 2023-08-17T23:59:59.999999]",
+        "",
+        "[2025-01-01T00:00:00 TO 2025-03-31T23:59:59]",
+    ]
+
+
+def test_cli_strict(capsys, monkeypatch):
+    assert run(capsys, monkeypatch, "--strict")[0] == 1
+    assert run(capsys, monkeypatch, "--strict", stdin="today\n")[0] == 0
+
+
+def test_cli_jobs(capsys, monkeypatch):
+    serial = run(capsys, monkeypatch)
+    parallel = run(capsys, monkeypatch, "--jobs", "2")
+    assert parallel == serial
+
+
+@pytest.mark.parametrize("args", [["--jobs", "-1"], ["--now", "foobar"], ["--format", "foobar"]])
+def test_cli_invalid_arguments(capsys, args):
+    with pytest.raises(SystemExit) as ex:
+        main(args)
+    assert ex.value.code == 2
+
+
+@pytest.mark.parametrize("format_", ["iso", "jsonl"])
+def test_cli_ranges(capsys, monkeypatch, format_):
+    """
+    Ranges like `a..b` yield timestamps, invalid ones yield error rows without stopping the stream.
+    """
+    stdin = "2025-01-01..2025-02-01\nfoo..bar\n2025-01-01..*\ntoday\n"
+    status, out, err = run(capsys, monkeypatch, "--format", format_, stdin=stdin)
+    assert status == 0
+    lines = out.splitlines()
+    assert len(lines) == 4
+    if format_ == "iso":
+        assert lines[0] == "2025-01-01T00:00:00/2025-02-01T00:00:00"
+        assert lines[2] == "2025-01-01T00:00:00"
+    else:
+        assert json.loads(lines[0])["end"] == "2025-02-01T00:00:00"
+        assert json.loads(lines[2])["end"] is None
+    assert err == "Line 2: Failed detecting start date: foo..bar\n"
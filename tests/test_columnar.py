@@ -0,0 +1,98 @@
+import datetime as dt
+import pickle
+import sys
+
+import pytest
+
+from aika import IntervalArray, TimeInterval, TimeIntervalParser
+
+NOW = dt.datetime(2023, 8, 17, 23, 3, 17, tzinfo=dt.timezone(dt.timedelta(hours=2)))
+
+INTERVALS = [
+    TimeInterval(dt.datetime(2023, 8, 17), dt.datetime(2023, 8, 17, 23, 59, 59, 999999)),
+    TimeInterval(dt.datetime(2023, 7, 1)),
+    TimeInterval(dt.datetime(1969, 12, 31, 12, 30), dt.datetime(1970, 1, 1, 0, 0, 0, 1)),
+    TimeInterval(dt.datetime(1, 1, 1), dt.datetime(9999, 12, 31, 23, 59, 59, 999999)),
+]
+
+
+def test_interval_array_roundtrip():
+    intervals = IntervalArray(INTERVALS)
+    assert len(intervals) == 4
+    assert list(intervals) == INTERVALS
+    assert intervals[1] == TimeInterval(dt.datetime(2023, 7, 1))
+    assert intervals[-1] == INTERVALS[-1]
+    assert intervals.nbytes == 4 * 17
+    with pytest.raises(IndexError):
+        intervals[4]
+
+
+def test_interval_array_tuples():
+    intervals = IntervalArray([(dt.datetime(2023, 7, 1), None)])
+    intervals.append((dt.datetime(2023, 8, 1), dt.datetime(2023, 8, 31)))
+    assert list(intervals) == [
+        TimeInterval(dt.datetime(2023, 7, 1)),
+        TimeInterval(dt.datetime(2023, 8, 1), dt.datetime(2023, 8, 31)),
+    ]
+
+
+def test_interval_array_slice():
+    intervals = IntervalArray(INTERVALS)
+    head = intervals[:2]
+    assert isinstance(head, IntervalArray)
+    assert list(head) == INTERVALS[:2]
+    assert list(intervals[::-2]) == INTERVALS[::-2]
+    assert intervals[1:3] == IntervalArray(INTERVALS[1:3])
+    assert intervals[1:3] != IntervalArray(INTERVALS[2:4])
+
+
+def test_interval_array_aware():
+    cet = dt.timezone(dt.timedelta(hours=1))
+    start = dt.datetime(2023, 8, 17, 12, tzinfo=dt.timezone.utc)
+    intervals = IntervalArray([TimeInterval(start, NOW)])
+    assert list(intervals) == [TimeInterval(start, NOW)]
+    assert intervals[0].start.tzinfo is dt.timezone.utc
+
+    intervals = IntervalArray([TimeInterval(start, NOW)], tzinfo=cet)
+    assert intervals[0] == TimeInterval(start, NOW)
+    assert intervals[0].end.tzinfo is cet
+
+
+def test_interval_array_mixed():
+    intervals = IntervalArray([TimeInterval(dt.datetime(2023, 7, 1))])
+    with pytest.raises(ValueError) as ex:
+        intervals.append(TimeInterval(dt.datetime(2023, 7, 2), NOW))
+    assert ex.match("Unable to mix naive and timezone-aware datetimes")
+    assert len(intervals.starts) == len(intervals.ends) == len(intervals.mask) == 1
+
+
+def test_interval_array_pickle():
+    intervals = IntervalArray(INTERVALS)
+    assert pickle.loads(pickle.dumps(intervals)) == intervals  # noqa: S301
+
+
+def test_interval_array_parse_many():
+    ti = TimeIntervalParser()
+    results = ti.parse_many(["today", "foobar", "1st july"], now=NOW)
+    intervals = IntervalArray(result.value for result in results if result.ok)
+    assert list(intervals) == [ti.parse("today", now=NOW), ti.parse("1st july", now=NOW)]
+
+
+def test_interval_array_numpy():
+    numpy = pytest.importorskip("numpy")
+    intervals = IntervalArray(INTERVALS)
+    starts, ends = intervals.to_numpy()
+    assert starts.dtype == numpy.dtype("datetime64[us]")
+    assert starts[0] == numpy.datetime64("2023-08-17T00:00:00")
+    assert numpy.isnat(ends[1])
+    assert IntervalArray.from_numpy(starts, ends) == intervals
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="Slotted dataclasses require Python 3.10")
+def test_interval_array_memory():
+    """
+    Columns need less memory than the corresponding `TimeInterval` objects.
+    """
+    intervals = [TimeInterval(dt.datetime(2023, 1, 1) + dt.timedelta(hours=hour), None) for hour in range(1000)]
+    objects = sum(sys.getsizeof(interval) + sys.getsizeof(interval.start) for interval in intervals)
+    assert IntervalArray(intervals).nbytes * 4 < objects
@@ -3,7 +3,8 @@ import datetime as dt
 import pytest
 from freezegun import freeze_time
 
-from aika import TimeInterval
+from aika import TimeInterval, TimeIntervalParser
+from aika.core import get_date_data_parser, with_relative_base
 from tests.conftest import TESTDRIVE_DATETIME
 
 
@@ -13,7 +14,7 @@ def test_week_calendar(ti):
     """
     assert ti.parse("2025W02") == TimeInterval(
         dt.datetime(2025, 1, 6, 0, 0),
-        dt.datetime(2025, 1, 13, 0, 0),
+        dt.datetime(2025, 1, 12, 23, 59, 59, 999999),
     )
 
 
@@ -62,7 +63,7 @@ def test_month_calendar(ti):
         == ti.parse("2025-01")
         == TimeInterval(
             dt.datetime(2025, 1, 1, 0, 0),
-            dt.datetime(2025, 2, 1, 0, 0),
+            dt.datetime(2025, 1, 31, 23, 59, 59, 999999),
         )
     )
 
@@ -119,7 +120,7 @@ def test_year_calendar(ti):
     """
     assert ti.parse("2025") == TimeInterval(
         dt.datetime(2025, 1, 1, 0, 0),
-        dt.datetime(2026, 1, 1, 0, 0, 0),
+        dt.datetime(2025, 12, 31, 23, 59, 59, 999999),
     )
 
 
@@ -210,3 +211,43 @@ def test_delta(ti):
         dt.datetime(2022, 8, 17, 23, 3, 17),
         dt.datetime(2023, 8, 17, 23, 3, 17),
     )
+
+
+@freeze_time(TESTDRIVE_DATETIME)
+def test_languages():
+    """
+    Restricting the languages of `dateparser` skips detecting the others.
+    """
+    now = dt.datetime(2023, 8, 17, 21, 3, 17, tzinfo=dt.timezone.utc)
+    assert TimeIntervalParser().parse("il y a 2 heures", now=now) == TimeInterval(
+        dt.datetime(2023, 8, 17, 21, 3, 17),
+        dt.datetime(2023, 8, 17, 23, 59, 59, 999999),
+    )
+
+    ti = TimeIntervalParser(languages=["en", "de"])
+    assert ti.parse("vor 2 Stunden", now=now) == TimeInterval(
+        dt.datetime(2023, 8, 17, 21, 3, 17),
+        dt.datetime(2023, 8, 17, 23, 59, 59, 999999),
+    )
+    with pytest.raises(ValueError) as ex:
+        ti.parse("il y a 2 heures", now=now)
+    assert ex.match("Failed detecting start date: il y a 2 heures")
+
+
+def test_date_data_parser_reused():
+    assert get_date_data_parser(("en", "de")) is get_date_data_parser(("en", "de"))
+    assert get_date_data_parser(("en", "de")) is not get_date_data_parser()
+
+
+def test_relative_base_shares_settings():
+    """
+    Parsing relative to different reference times does not register new `dateparser` settings.
+    """
+    parser = get_date_data_parser(("en",))
+    today = dt.datetime(2023, 8, 17, 23, 3, 17)
+    first = with_relative_base(parser, today)
+    second = with_relative_base(parser, today + dt.timedelta(days=1))
+    assert first.get_date_data("yesterday").date_obj == dt.datetime(2023, 8, 16, 23, 3, 17)
+    assert second.get_date_data("yesterday").date_obj == dt.datetime(2023, 8, 17, 23, 3, 17)
+    assert first._settings.registry_key == second._settings.registry_key == parser._settings.registry_key
+    assert not parser._settings.RELATIVE_BASE
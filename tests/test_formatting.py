@@ -0,0 +1,82 @@
+import datetime as dt
+import random
+
+import pytest
+
+from aika import IntervalArray, TimeInterval, formatting
+
+CET = dt.timezone(dt.timedelta(hours=1))
+
+
+def reference(interval: TimeInterval, name: str) -> str:
+    """
+    The implementation of the formatters before introducing layouts, based on `strftime`.
+    """
+    separators = {"githubformat": "..", "isoformat": "/", "mathformat": ".."}
+    if name == "githubformat":
+        buffer = interval.start.strftime("%Y-%m-%d")
+        if interval.end:
+            buffer += separators[name] + interval.end.strftime("%Y-%m-%d")
+        return buffer
+    if name == "opsgenieformat":
+        buffer = f'createdAt >= "{interval.start.strftime("%d-%m-%YT%H:%M:%S")}"'
+        if interval.end:
+            buffer += f' and createdAt <= "{interval.end.strftime("%d-%m-%YT%H:%M:%S")}"'
+        return buffer
+    buffer = interval.start.isoformat()
+    if interval.end:
+        buffer += separators[name] + interval.end.isoformat()
+    return buffer
+
+
+def random_datetime(rnd: random.Random, tzinfo=None) -> dt.datetime:
+    value = dt.datetime(1, 1, 1) + dt.timedelta(microseconds=rnd.randrange(315537897600000000))
+    if rnd.random() < 0.5:
+        value = value.replace(microsecond=0)
+    return value.replace(tzinfo=tzinfo)
+
+
+def random_intervals(count: int, tzinfo=None) -> list:
+    rnd = random.Random(42)  # noqa: S311
+    return [
+        TimeInterval(random_datetime(rnd, tzinfo), random_datetime(rnd, tzinfo) if rnd.random() < 0.8 else None)
+        for _ in range(count)
+    ] + [
+        TimeInterval(dt.datetime(999, 12, 31, 23, 59, 59, tzinfo=tzinfo), dt.datetime(1000, 1, 1, tzinfo=tzinfo)),
+        TimeInterval(dt.datetime(1969, 12, 31, 23, 59, 59, 999999, tzinfo=tzinfo)),
+    ]
+
+
+@pytest.mark.parametrize("name", ["githubformat", "isoformat", "mathformat", "opsgenieformat"])
+@pytest.mark.parametrize("tzinfo", [None, CET])
+def test_same_as_reference(name, tzinfo):
+    intervals = random_intervals(500, tzinfo)
+    expected = [reference(interval, name) for interval in intervals]
+    assert [getattr(interval, name)() for interval in intervals] == expected
+    assert getattr(formatting, name)(intervals) == expected
+    assert getattr(formatting, name)(IntervalArray(intervals)) == expected
+
+
+def test_lucene():
+    intervals = [
+        TimeInterval(dt.datetime(2023, 7, 1), dt.datetime(2023, 7, 31, 23, 59, 59, 999999)),
+        TimeInterval(dt.datetime(2023, 7, 1, tzinfo=CET)),
+    ]
+    expected = [
+        "[2023-07-01T00:00:00 TO 2023-07-31T23:59:59.999999]",
+        "[2023-07-01T00:00:00+01:00 TO *]",
+    ]
+    assert [interval.luceneformat() for interval in intervals] == expected
+    assert formatting.luceneformat(intervals) == expected
+    assert formatting.luceneformat(IntervalArray(intervals[:1])) == expected[:1]
+
+
+def test_generator():
+    intervals = (TimeInterval(dt.datetime(2023, 7, day)) for day in range(1, 4))
+    assert formatting.githubformat(intervals) == ["2023-07-01", "2023-07-02", "2023-07-03"]
+
+
+def test_same_instant_different_timezones():
+    start = dt.datetime(2023, 7, 1, tzinfo=dt.timezone.utc)
+    intervals = [TimeInterval(start), TimeInterval(start.astimezone(CET))]
+    assert formatting.isoformat(intervals) == ["2023-07-01T00:00:00+00:00", "2023-07-01T01:00:00+01:00"]
@@ -0,0 +1,119 @@
+import datetime as dt
+
+import pytest
+
+from aika import TimeIntervalParser
+from aika.frame import parse_arrow, parse_distinct, parse_series
+
+NOW = dt.datetime(2023, 8, 17, 21, 3, 17, tzinfo=dt.timezone.utc)
+
+EXPRESSIONS = ["today", "foobar", None, "1st july", "today"]
+
+TODAY = (dt.datetime(2023, 8, 17), dt.datetime(2023, 8, 17, 23, 59, 59, 999999))
+
+
+def counting_parser(calls: list) -> TimeIntervalParser:
+    ti = TimeIntervalParser()
+    parsers = list(ti.parsers)
+    ti.clear_parsers()
+
+    def counting(when):
+        calls.append(when)
+        raise ValueError("Not parsing")
+
+    ti.add_parser(counting, name="counting")
+    ti.parsers += parsers
+    return ti
+
+
+def test_parse_series():
+    pandas = pytest.importorskip("pandas")
+    calls: list = []
+    series = pandas.Series(EXPRESSIONS * 1000, index=range(10, 5010))
+    frame = parse_series(series, parser=counting_parser(calls), now=NOW)
+    assert sorted(calls) == ["1st july", "foobar", "today"]
+    assert list(frame.columns) == ["start", "end", "error"]
+    assert frame.index.equals(series.index)
+    assert str(frame["start"].dtype) == "datetime64[us]"
+
+    head = frame.head(5)
+    assert list(head["start"]) == [TODAY[0], pandas.NaT, pandas.NaT, dt.datetime(2023, 7, 1), TODAY[0]]
+    assert list(head["end"])[0] == TODAY[1]
+    assert head["end"].isna().tolist() == [False, True, True, True, False]
+    assert head["error"].isna().tolist() == [True, False, True, True, True]
+    assert head["error"].iloc[1] == "Failed detecting start date: foobar"
+
+
+def test_parse_series_aware():
+    pandas = pytest.importorskip("pandas")
+    ti = TimeIntervalParser()
+    ti.clear_parsers()
+    ti.add_parser(lambda when: (NOW, None), name="aware")
+    frame = parse_series(pandas.Series(["now"]), parser=ti)
+    assert frame["start"].iloc[0] == pandas.Timestamp(NOW)
+    assert str(frame["start"].dt.tz) == "UTC"
+
+
+def test_parse_series_mixed():
+    """
+    Naive values are interpreted in the timezone of the parser, when other values are timezone-aware.
+    """
+    pandas = pytest.importorskip("pandas")
+    frame = parse_series(pandas.Series(["today", "2024-08-20T10:00:00+02:00", "xx"]), now=NOW)
+    assert str(frame["start"].dt.tz) == "UTC"
+    assert list(frame["start"]) == [
+        pandas.Timestamp("2023-08-16T22:00:00Z"),
+        pandas.Timestamp("2024-08-20T08:00:00Z"),
+        pandas.NaT,
+    ]
+    assert frame["end"].iloc[1] == pandas.Timestamp("2023-08-17T21:59:59.999999Z")
+    assert frame["error"].iloc[2] == "Failed detecting start date: xx"
+
+
+def test_parse_series_invalid_results():
+    """
+    Ranges are parsed, results which are not intervals of datetimes become errors of their rows.
+    """
+    pandas = pytest.importorskip("pandas")
+    ti = TimeIntervalParser()
+    ti.add_parser(lambda when: ("a", "b"), name="strings")
+    frame = parse_series(pandas.Series(["today", "2025-01-01..2025-02-01", "foobar"]), parser=ti, now=NOW)
+    assert list(frame["start"]) == [TODAY[0], dt.datetime(2025, 1, 1), pandas.NaT]
+    assert list(frame["end"]) == [TODAY[1], dt.datetime(2025, 2, 1), pandas.NaT]
+    assert frame["error"].isna().tolist() == [True, True, False]
+    assert frame["error"].iloc[2] == "Invalid time interval: 'a', 'b'"
+
+
+def test_parse_series_empty():
+    pandas = pytest.importorskip("pandas")
+    frame = parse_series(pandas.Series([], dtype=object))
+    assert len(frame) == 0
+    assert list(frame.columns) == ["start", "end", "error"]
+
+
+@pytest.mark.parametrize("encode", [False, True])
+def test_parse_arrow(encode):
+    pyarrow = pytest.importorskip("pyarrow")
+    array = pyarrow.chunked_array([EXPRESSIONS[:2], EXPRESSIONS[2:]])
+    if encode:
+        array = array.combine_chunks().dictionary_encode()
+    table = parse_arrow(array, now=NOW)
+    assert table.column_names == ["start", "end", "error"]
+    assert table.schema.field("start").type == pyarrow.timestamp("us")
+    assert table.column("start").to_pylist() == [TODAY[0], None, None, dt.datetime(2023, 7, 1), TODAY[0]]
+    assert table.column("end").to_pylist() == [TODAY[1], None, None, None, TODAY[1]]
+    assert table.column("error").to_pylist() == [None, "Failed detecting start date: foobar", None, None, None]
+
+
+def test_parse_distinct_same_as_parse():
+    pytest.importorskip("numpy")
+    ti = TimeIntervalParser()
+    expressions = ["today", "last week", "2025Q01", "Sat - Tue", "jul 1 to jul 7", "-1d"]
+    starts, ends, errors, aware = parse_distinct(expressions, parser=ti, now=NOW)
+    assert not aware
+    assert len(starts) == len(expressions) + 1
+    for index, when in enumerate(expressions):
+        interval = ti.parse(when, now=NOW)
+        assert starts[index].item() == interval.start
+        assert ends[index].item() == interval.end
+        assert errors[index] is None
@@ -0,0 +1,59 @@
+import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
+
+from daterangeparser import parse as daterangeparser_parse
+from freezegun import freeze_time
+
+from aika.daterangeparser_german import grammar_german, parse_german
+from aika.grammar import Grammar, grammar_english, parse_english
+from tests.conftest import TESTDRIVE_DATETIME
+
+EXPRESSIONS_ENGLISH = [
+    "1st july",
+    "March 2024",
+    "27th-29th June 2010",
+    "30 May to 9th Aug",
+    "Wed 23 Jan -> Sat 16 February 2013",
+    "Jan 2011 - Mar 2014",
+]
+
+
+def test_grammar_built_once():
+    assert grammar_english.element is grammar_english.element
+    assert grammar_german.element is grammar_german.element
+
+
+def test_grammar_lazy():
+    calls = []
+
+    def factory():
+        calls.append(True)
+        return grammar_english.factory()
+
+    grammar = Grammar(factory)
+    assert calls == []
+    grammar.parse("1st july")
+    grammar.parse("March 2024")
+    assert calls == [True]
+
+
+@freeze_time(TESTDRIVE_DATETIME)
+def test_parse_english_matches_upstream():
+    for expression in EXPRESSIONS_ENGLISH:
+        assert parse_english(expression) == daterangeparser_parse(expression)
+
+
+def test_parse_threaded():
+    expressions = EXPRESSIONS_ENGLISH * 25
+    expected = [parse_english(expression) for expression in expressions]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert list(executor.map(parse_english, expressions)) == expected
+        assert list(executor.map(parse_german, ["1. Juli 2024"] * 50)) == [(dt.datetime(2024, 7, 1), None)] * 50
+
+
+def test_vocabulary_english_months():
+    from daterangeparser.parse_date_range import MONTHS
+
+    from aika.grammar import MONTHS_ENGLISH
+
+    assert MONTHS_ENGLISH == MONTHS
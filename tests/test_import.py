@@ -0,0 +1,58 @@
+import subprocess
+import sys
+
+import pytest
+
+# Packages which must not be imported by `import aika`, see "Startup budget" in the README.
+HEAVY = [
+    "asyncio",
+    "daterangeparser",
+    "dateparser",
+    "dateutil",
+    "fiscalyear",
+    "numpy",
+    "pandas",
+    "pendulum",
+    "pyarrow",
+    "pyparsing",
+]
+
+
+def imported_modules(code: str) -> set:
+    """
+    Run code in a fresh interpreter, and return the names of all modules it imported, using `-X importtime`.
+    """
+    process = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True
+    )
+    modules = set()
+    for line in process.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            modules.add(line.rsplit("|", 1)[1].strip())
+    return modules
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import aika",
+        "from aika import TimeIntervalParser; TimeIntervalParser()",
+        "from aika import DaterangeExpression; DaterangeExpression()",
+        "import aika.frame",
+    ],
+)
+def test_startup_budget(code):
+    modules = imported_modules(code)
+    assert "aika" in modules
+    heavy = sorted(module for module in modules if module.split(".")[0] in HEAVY)
+    assert heavy == []
+
+
+def test_lazy_attributes():
+    import aika
+    import aika.core
+
+    assert aika.TimeIntervalParser is aika.core.TimeIntervalParser
+    assert aika.core.arbitrary_parser_english is aika.core.get_arbitrary_parser("en")
+    with pytest.raises(AttributeError):
+        _ = aika.foobar
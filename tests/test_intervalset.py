@@ -0,0 +1,101 @@
+import datetime as dt
+import random
+
+import pytest
+
+from aika import IntervalSet, TimeInterval
+from aika.model import ParseResult
+
+NOW = dt.datetime(2023, 8, 17, 23, 3, 17, tzinfo=dt.timezone(dt.timedelta(hours=2)))
+EPOCH = dt.datetime(2025, 1, 1)
+US = dt.timedelta(microseconds=1)
+
+
+def at(offset):
+    return EPOCH + offset * US
+
+
+def span(start, end=None):
+    return TimeInterval(at(start), at(end) if end is not None else None)
+
+
+def test_interval_set_normalize():
+    intervals = IntervalSet([span(5, 8), span(0, 2), (at(3), at(4)), span(1, 2), span(20, 10), span(30), span(40, 50)])
+    assert list(intervals) == [span(0, 8), span(30)]
+    assert len(intervals) == 2
+    assert intervals[0] == span(0, 8)
+    assert intervals.bounds() == span(0)
+    assert IntervalSet().bounds() is None
+    assert not IntervalSet([span(2, 1)])
+    assert IntervalSet([span(0, 2), span(3, 4)]) == IntervalSet([span(0, 4)])
+    assert hash(IntervalSet([span(0, 4)])) == hash(IntervalSet([span(0, 2), span(3, 4)]))
+
+
+def test_interval_set_contains():
+    intervals = IntervalSet([span(0, 2), span(10)])
+    assert [at(offset) in intervals for offset in [-1, 0, 2, 3, 10, 10**9]] == [False, True, True, False, True, True]
+
+
+def test_interval_set_operations():
+    a = IntervalSet([span(0, 10), span(20, 30)])
+    b = IntervalSet([span(5, 25), span(40)])
+    assert list(a | b) == [span(0, 30), span(40)]
+    assert list(a & b) == [span(5, 10), span(20, 25)]
+    assert list(a - b) == [span(0, 4), span(26, 30)]
+    assert list(b - a) == [span(11, 19), span(40)]
+    assert list(a.union(b, IntervalSet([span(31, 39)]))) == [span(0)]
+    assert list(a.complement(within=span(-10, 40))) == [span(-10, -1), span(11, 19), span(31, 40)]
+    assert list(b.complement(within=span(0))) == [span(0, 4), span(26, 39)]
+    assert list(a.coalesce(dt.timedelta(microseconds=10))) == [span(0, 30)]
+    assert list(a.coalesce(dt.timedelta(microseconds=9))) == [span(0, 10), span(20, 30)]
+
+
+def test_interval_set_open():
+    a = IntervalSet([span(0)])
+    b = IntervalSet([span(10)])
+    assert list(a & b) == [span(10)]
+    assert list(a - b) == [span(0, 9)]
+    assert not b - a
+
+
+def members(intervals, universe):
+    return {offset for offset in universe if at(offset) in intervals}
+
+
+def test_interval_set_brute_force():
+    """
+    Compare all operations with their definitions, over the instants of a small universe.
+    """
+    rng = random.Random(42)  # noqa: S311
+    universe = range(-2, 42)
+
+    def sample():
+        intervals = []
+        for _ in range(rng.randint(0, 5)):
+            start = rng.randint(0, 40)
+            intervals.append(span(start, None if rng.random() < 0.1 else start + rng.randint(-1, 8)))
+        return IntervalSet(intervals)
+
+    for _ in range(500):
+        a, b = sample(), sample()
+        left, right = members(a, universe), members(b, universe)
+        assert members(a | b, universe) == left | right
+        assert members(a & b, universe) == left & right
+        assert members(a - b, universe) == left - right
+        assert members(a.complement(span(0, 40)), universe) == set(range(41)) - left
+        for result in [a | b, a & b, a - b]:
+            for x, y in zip(result.intervals, result.intervals[1:]):
+                assert x.end is not None
+                assert y.start - x.end > US
+
+
+def test_interval_set_from_results(ti):
+    results = list(ti.parse_many(["2025Q1", "2025M03", "foobar", "2025M05"], now=NOW))
+    with pytest.raises(ValueError):
+        IntervalSet.from_results(results)
+    intervals = IntervalSet.from_results(results, ignore_errors=True)
+    assert list(intervals) == [
+        TimeInterval(dt.datetime(2025, 1, 1), dt.datetime(2025, 3, 31, 23, 59, 59, 999999)),
+        TimeInterval(dt.datetime(2025, 5, 1), dt.datetime(2025, 5, 31, 23, 59, 59, 999999)),
+    ]
+    assert IntervalSet.from_results([ParseResult("x", value=(EPOCH, None))]) == IntervalSet([span(0)])
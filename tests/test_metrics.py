@@ -0,0 +1,89 @@
+import datetime as dt
+import logging
+
+import pytest
+
+from aika import TimeIntervalParser
+from aika.metrics import POSTPROCESSING, Metrics, nearest
+
+NOW = dt.datetime(2023, 8, 17, 21, 3, 17, tzinfo=dt.timezone.utc)
+
+
+def test_metrics_disabled_by_default(ti):
+    assert ti.metrics is None
+    assert ti.stage_statistics() is None
+
+
+def test_metrics_cascade():
+    ti = TimeIntervalParser(metrics=Metrics())
+    ti.parse("jul 1 to jul 7", now=NOW)
+    ti.parse("today", now=NOW)
+    with pytest.raises(ValueError):
+        ti.parse("foobar", now=NOW)
+
+    # Parsers skipped by routing are not attempted.
+    statistics = ti.stage_statistics()
+    assert {name: (item.attempts, item.successes, item.failures) for name, item in statistics.items()} == {
+        "DateRangeParser [en]": (1, 1, 0),
+        POSTPROCESSING: (2, 2, 0),
+        "arbitrary-dateparser [de]": (2, 0, 2),
+        "arbitrary-dateparser [en]": (2, 1, 1),
+        "DUDP [all]": (1, 0, 1),
+    }
+    german = statistics["arbitrary-dateparser [de]"]
+    assert german.total > 0
+    assert sorted(german.percentiles) == [50, 90, 99]
+    assert 0 < german.percentiles[50] <= german.percentiles[90] <= german.percentiles[99]
+
+
+def test_metrics_custom_sink():
+    class Sink:
+        def __init__(self):
+            self.records = []
+
+        def record(self, stage, seconds, ok):
+            self.records.append((stage, ok))
+
+    ti = TimeIntervalParser(metrics=Sink())
+    ti.clear_parsers()
+    ti.add_parser(lambda when: (dt.datetime(2000, 1, 1), None), name="custom")
+    ti.parse("foo")
+    assert ti.metrics.records == [("custom", True), (POSTPROCESSING, True)]
+    assert ti.stage_statistics() is None
+
+
+def test_metrics_snapshot_is_copy():
+    metrics = Metrics(window=2)
+    metrics.record("stage", 0.3, True)
+    snapshot = metrics.snapshot()
+    metrics.record("stage", 0.1, False)
+    metrics.record("stage", 0.2, True)
+    assert snapshot["stage"].attempts == 1
+    statistics = metrics.snapshot()["stage"]
+    assert (statistics.attempts, statistics.successes, statistics.failures) == (3, 2, 1)
+    assert statistics.total == pytest.approx(0.6)
+    assert statistics.percentiles == {50: 0.1, 90: 0.2, 99: 0.2}
+    metrics.reset()
+    assert metrics.snapshot() == {}
+
+
+def test_nearest():
+    assert nearest([], 50) == 0.0
+    assert nearest([1.0], 99) == 1.0
+    samples = [float(value) for value in range(1, 101)]
+    assert [nearest(samples, percentile) for percentile in (50, 90, 99)] == [50.0, 90.0, 99.0]
+
+
+def test_debug_message_lazy(caplog):
+    class Unprintable(Exception):
+        def __str__(self):
+            raise AssertionError("Formatted although debug logging is disabled")
+
+    def failing(when):
+        raise Unprintable()
+
+    ti = TimeIntervalParser()
+    ti.clear_parsers()
+    ti.add_parser(failing, name="failing")
+    with caplog.at_level(logging.INFO, logger="aika.core"), pytest.raises(ValueError):
+        ti.parse("foo")
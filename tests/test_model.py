@@ -1,4 +1,7 @@
+import dataclasses
 import datetime as dt
+import pickle
+import sys
 
 import pytest
 from freezegun import freeze_time
@@ -42,8 +45,8 @@ def test_interval_format_iso(interval):
 
 
 def test_interval_format_lucene(interval):
-    with pytest.raises(NotImplementedError):
-        interval.luceneformat()
+    assert interval.luceneformat() == "[2023-07-01T00:00:00 TO 2023-07-31T00:00:00]"
+    assert TimeInterval(dt.datetime(2023, 7, 1)).luceneformat() == "[2023-07-01T00:00:00 TO *]"
 
 
 def test_interval_format_math(interval):
@@ -52,3 +55,36 @@ def test_interval_format_math(interval):
 
 def test_interval_format_opsgenie(interval):
     assert interval.opsgenieformat() == 'createdAt >= "01-07-2023T00:00:00" and createdAt <= "31-07-2023T00:00:00"'
+
+
+def test_interval_frozen():
+    ti = TimeInterval(dt.datetime(2023, 7, 1))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        ti.end = dt.datetime(2023, 7, 31)  # type: ignore[misc]
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="Slotted dataclasses require Python 3.10")
+def test_interval_slotted():
+    assert not hasattr(TimeInterval(dt.datetime(2023, 7, 1)), "__dict__")
+
+
+def test_interval_hashable():
+    first = TimeInterval(dt.datetime(2023, 7, 1), dt.datetime(2023, 7, 31))
+    second = TimeInterval(dt.datetime(2023, 7, 1), dt.datetime(2023, 7, 31))
+    assert first is not second
+    assert len({first, second, TimeInterval(dt.datetime(2023, 7, 1))}) == 2
+    assert {first: "july"}[second] == "july"
+
+
+def test_interval_ordering():
+    july = TimeInterval(dt.datetime(2023, 7, 1), dt.datetime(2023, 7, 31))
+    july_open = TimeInterval(dt.datetime(2023, 7, 1))
+    july_first = TimeInterval(dt.datetime(2023, 7, 1), dt.datetime(2023, 7, 1, 23, 59, 59))
+    june = TimeInterval(dt.datetime(2023, 6, 1), dt.datetime(2023, 6, 30))
+    assert sorted([july_open, july, june, july_first]) == [june, july_first, july, july_open]
+    assert june < july <= july < july_open
+    assert july_open > july >= june
+
+
+def test_interval_pickle(interval):
+    assert pickle.loads(pickle.dumps(interval)) == interval  # noqa: S301
@@ -0,0 +1,110 @@
+import datetime as dt
+
+import pytest
+
+from aika import DaterangeExpression, TimeInterval
+from aika.notation import admissible, parse
+
+NOW = dt.datetime(2023, 8, 17, 23, 3, 17, tzinfo=dt.timezone(dt.timedelta(hours=2)))
+
+
+@pytest.mark.parametrize(
+    "when,start,end",
+    [
+        ("2025", dt.datetime(2025, 1, 1), dt.datetime(2025, 12, 31, 23, 59, 59, 999999)),
+        ("9999", dt.datetime(9999, 1, 1), dt.datetime(9999, 12, 31, 23, 59, 59, 999999)),
+        ("2025W01", dt.datetime(2024, 12, 30), dt.datetime(2025, 1, 5, 23, 59, 59, 999999)),
+        ("2025W2", dt.datetime(2025, 1, 6), dt.datetime(2025, 1, 12, 23, 59, 59, 999999)),
+        ("2026W53", dt.datetime(2026, 12, 28), dt.datetime(2027, 1, 3, 23, 59, 59, 999999)),
+        ("2025M02", dt.datetime(2025, 2, 1), dt.datetime(2025, 2, 28, 23, 59, 59, 999999)),
+        ("2024M2", dt.datetime(2024, 2, 1), dt.datetime(2024, 2, 29, 23, 59, 59, 999999)),
+        ("2025-12", dt.datetime(2025, 12, 1), dt.datetime(2025, 12, 31, 23, 59, 59, 999999)),
+        ("2025Q01", dt.datetime(2025, 1, 1), dt.datetime(2025, 3, 31, 23, 59, 59)),
+        ("2025Q4", dt.datetime(2025, 10, 1), dt.datetime(2025, 12, 31, 23, 59, 59)),
+    ],
+)
+def test_calendar_notation(when, start, end):
+    assert parse(when, now=NOW) == (start, end)
+
+
+def test_period_ends():
+    """
+    Ends are inclusive: Weeks, months, and years end one microsecond before the next period starts.
+    Quarters end at the last second of their last day.
+    """
+    resolution = dt.timedelta(microseconds=1)
+    for period, following in [("2025W52", "2026W01"), ("2024M02", "2024M03"), ("2025M12", "2026M01"), ("2025", "2026")]:
+        assert parse(period, now=NOW)[1] + resolution == parse(following, now=NOW)[0]
+    assert parse("2025Q1", now=NOW)[1] + dt.timedelta(seconds=1) == parse("2025Q2", now=NOW)[0]
+
+
+def test_daterange_expression(dr):
+    """
+    Inclusive ends stay within their period, when applying `snap_hours` and `midnight_heuristics`.
+    """
+    assert dr.parse("2025Q01", now=NOW) == (dt.datetime(2025, 1, 1), dt.datetime(2025, 3, 31, 23, 59, 59))
+    assert dr.parse("2025-02", now=NOW) == (dt.datetime(2025, 2, 1), dt.datetime(2025, 2, 28, 23, 59, 59, 999999))
+    assert dr.parse("2025W01", now=NOW) == (dt.datetime(2024, 12, 30), dt.datetime(2025, 1, 5, 23, 59, 59, 999999))
+
+    dr = DaterangeExpression(default_end_time=dt.time(18))
+    assert dr.parse("2025Q01", now=NOW)[1] == dt.datetime(2025, 3, 31, 18)
+    assert dr.parse("2025-02", now=NOW)[1] == dt.datetime(2025, 2, 28, 18)
+
+
+def test_date():
+    """
+    Dates end at the end of the day of the reference time.
+    """
+    assert parse("2024-02-29", now=NOW) == (dt.datetime(2024, 2, 29), dt.datetime(2023, 8, 17, 23, 59, 59, 999999))
+
+
+@pytest.mark.parametrize(
+    "when",
+    [
+        "",
+        "now",
+        "202",
+        "0000",
+        "2025W00",
+        "2025W53",
+        "2025M13",
+        "2025M",
+        "2025-1",
+        "2025-13",
+        "2025Q0",
+        "2025Q5",
+        "2025q1",
+        "2025-02-30",
+        "2025-2-3",
+        " 2025",
+        "2025 ",
+        "２０２５",
+        "2025-01-01..2025-02-01",
+        "2024-08-20T10:00:00",
+    ],
+)
+def test_rejected(when):
+    with pytest.raises(ValueError):
+        parse(when, now=NOW)
+
+
+def test_admissible():
+    assert admissible("2025W01")
+    assert not admissible("today")
+    assert not admissible("20.8.2024")
+    assert not admissible("２０２５")
+
+
+def test_cascade(ti):
+    """
+    The cascade computes exact month and year ends, including leap years.
+    """
+    assert ti.parse("2024-02", now=NOW) == TimeInterval(
+        dt.datetime(2024, 2, 1), dt.datetime(2024, 2, 29, 23, 59, 59, 999999)
+    )
+    assert ti.parse("2024", now=NOW) == TimeInterval(
+        dt.datetime(2024, 1, 1), dt.datetime(2024, 12, 31, 23, 59, 59, 999999)
+    )
+    assert ti.parse("2024-08-20", now=NOW) == TimeInterval(
+        dt.datetime(2024, 8, 20), dt.datetime(2023, 8, 17, 23, 59, 59, 999999)
+    )
@@ -0,0 +1,60 @@
+import datetime as dt
+import pickle
+
+import pytest
+
+from aika import DaterangeExpression, TimeIntervalParser
+from aika.parallel import ParallelParser, ParserConfig
+
+NOW = dt.datetime(2023, 8, 17, 23, 3, 17, tzinfo=dt.timezone(dt.timedelta(hours=2)))
+
+EXPRESSIONS = ["today", "foobar", "2025Q01", "Sat - Tue", "jul 1 to jul 7", "2024-08-20", "-1d", "today"]
+
+
+def test_parser_config_roundtrip():
+    parser = DaterangeExpression(default_start_time=dt.time(hour=8), tz="UTC", languages=["en", "de"])
+    config = pickle.loads(pickle.dumps(ParserConfig.from_parser(parser)))  # noqa: S301
+    assert config == ParserConfig(
+        default_start_time=dt.time(hour=8),
+        midnight_heuristics=True,
+        snap_hours=True,
+        return_tuple=True,
+        tz="UTC",
+        languages=("en", "de"),
+    )
+    clone = config.create()
+    assert [item.name for item in clone.parsers] == [item.name for item in parser.parsers]
+    assert clone.return_tuple is True
+    assert clone.languages == ("en", "de")
+
+
+def test_parser_config_rejects_custom_parsers():
+    parser = TimeIntervalParser()
+    parser.add_parser(lambda when: (dt.datetime(2000, 1, 1), None), name="custom")
+    with pytest.raises(ValueError) as ex:
+        ParserConfig.from_parser(parser)
+    assert ex.match("Unable to run custom parser cascade in worker processes")
+
+
+@pytest.mark.parametrize("parser", [TimeIntervalParser, DaterangeExpression])
+def test_parallel_same_as_serial(parser):
+    serial = parser()
+    expected = list(serial.parse_many(EXPRESSIONS, now=NOW))
+    with ParallelParser(ParserConfig.from_parser(serial), processes=2, chunksize=3) as pool:
+        results = list(pool.parse_many(EXPRESSIONS, now=NOW))
+    assert [result.when for result in results] == EXPRESSIONS
+    assert [result.value for result in results] == [result.value for result in expected]
+    assert [result.ok for result in results] == [True, False, True, True, True, True, True, True]
+    assert str(results[1].error) == "Failed detecting start date: foobar"
+
+
+def test_parallel_invalid_chunksize():
+    with pytest.raises(ValueError):
+        ParallelParser(chunksize=0)
+
+
+def test_parser_config_parser_order():
+    parser = TimeIntervalParser(parser_order={"calendar": ["DUDP [all]"]})
+    config = pickle.loads(pickle.dumps(ParserConfig.from_parser(parser)))  # noqa: S301
+    assert config.parser_order == (("calendar", ("DUDP [all]",)),)
+    assert config.create().parser_order == {"calendar": ("DUDP [all]",)}
@@ -0,0 +1,126 @@
+import datetime as dt
+import types
+
+import pytest
+from freezegun import freeze_time
+
+from aika import DaterangeExpression, TimeInterval, TimeIntervalParser
+from tests.conftest import TESTDRIVE_DATETIME
+
+EXPRESSIONS = [
+    "today",
+    "last week",
+    "2025Q01",
+    "Sat - Tue",
+    "jul 1 to jul 7",
+    "2024-08-20",
+    "-1d",
+    "now",
+]
+
+
+@freeze_time(TESTDRIVE_DATETIME)
+@pytest.mark.parametrize("parser", [TimeIntervalParser, DaterangeExpression])
+def test_parse_many_same_as_parse(parser):
+    ti = parser()
+    results = ti.parse_many(EXPRESSIONS)
+    assert isinstance(results, types.GeneratorType)
+    results = list(results)
+    assert [result.when for result in results] == EXPRESSIONS
+    assert all(result.ok for result in results)
+    assert [result.value for result in results] == [ti.parse(when) for when in EXPRESSIONS]
+
+
+@freeze_time(TESTDRIVE_DATETIME)
+def test_parse_many_errors():
+    ti = TimeIntervalParser()
+    results = list(ti.parse_many(["today", "foobar", "today"]))
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, ValueError)
+    assert str(results[1].error) == "Failed detecting start date: foobar"
+    assert results[1].value is None
+
+
+def test_parse_many_reference_time():
+    """
+    All expressions are parsed relative to the same reference time.
+    """
+    ti = TimeIntervalParser()
+    now = dt.datetime(2023, 8, 17, 23, 3, 17, tzinfo=dt.timezone(dt.timedelta(hours=2)))
+    with freeze_time("2025-01-01T12:00:00+0000"):
+        results = list(ti.parse_many(["today", "tomorrow", "2024-08-20", "1st july", "-1d"], now=now))
+    assert [result.value for result in results] == [
+        TimeInterval(dt.datetime(2023, 8, 17, 0, 0), dt.datetime(2023, 8, 17, 23, 59, 59, 999999)),
+        TimeInterval(dt.datetime(2023, 8, 18, 0, 0), dt.datetime(2023, 8, 18, 23, 59, 59, 999999)),
+        TimeInterval(dt.datetime(2024, 8, 20, 0, 0), dt.datetime(2023, 8, 17, 23, 59, 59, 999999)),
+        TimeInterval(dt.datetime(2023, 7, 1, 0, 0), None),
+        TimeInterval(dt.datetime(2023, 8, 16, 23, 3, 17), dt.datetime(2023, 8, 17, 23, 59, 59, 999999)),
+    ]
+
+
+@freeze_time(TESTDRIVE_DATETIME)
+def test_parse_many_deduplicates():
+    ti = TimeIntervalParser()
+    calls = []
+    ti.clear_parsers()
+    ti.add_parser(lambda when: calls.append(when) or (dt.datetime(2000, 1, 1), None), name="counting")
+    results = list(ti.parse_many(["a", "b", "a", "c", "a", "b"], window=2))
+    assert [result.value.start for result in results] == [dt.datetime(2000, 1, 1)] * 6
+    assert calls == ["a", "b", "c", "b"]
+
+
+@freeze_time(TESTDRIVE_DATETIME)
+def test_parse_many_fresh_values():
+    ti = TimeIntervalParser()
+    first, second = ti.parse_many(["today", "today"])
+    assert first.value == second.value
+    assert first.value is not second.value
+
+
+def test_parse_many_lazy():
+    ti = TimeIntervalParser()
+
+    def expressions():
+        yield "2025M01"
+        raise RuntimeError("Consumed too far")
+
+    results = ti.parse_many(expressions())
+    assert next(results).value == TimeInterval(dt.datetime(2025, 1, 1), dt.datetime(2025, 1, 31, 23, 59, 59, 999999))
+
+
+def test_parse_many_invalid_window():
+    with pytest.raises(ValueError):
+        list(TimeIntervalParser().parse_many(["today"], window=0))
+
+
+def test_parse_reference_time():
+    """
+    Parsing with an explicit reference time replays historical queries deterministically.
+    """
+    ti = TimeIntervalParser(cache_size=16)
+    now = dt.datetime(2023, 8, 17, 23, 3, 17, tzinfo=dt.timezone(dt.timedelta(hours=2)))
+    expected = {
+        "today": TimeInterval(dt.datetime(2023, 8, 17, 0, 0), dt.datetime(2023, 8, 17, 23, 59, 59, 999999)),
+        "now": TimeInterval(dt.datetime(2023, 8, 17, 23, 3, 17), dt.datetime(2023, 8, 17, 23, 59, 59, 999999)),
+        "1st july": TimeInterval(dt.datetime(2023, 7, 1, 0, 0), None),
+        "-1d": TimeInterval(dt.datetime(2023, 8, 16, 23, 3, 17), dt.datetime(2023, 8, 17, 23, 59, 59, 999999)),
+    }
+    for stamp in ["2025-01-01T12:00:00+0000", "2030-06-15T03:00:00+0000"]:
+        with freeze_time(stamp):
+            for when, interval in expected.items():
+                assert ti.parse(when, now=now) == interval
+            assert ti.parse_single("tomorrow", now=now) == dt.datetime(2023, 8, 18, 0, 0)
+    assert ti.cache_statistics().size == 0
+
+
+def test_parse_reference_time_timezone():
+    """
+    All parsers resolve the reference time in the configured timezone, independently of the host timezone.
+    """
+    ti = TimeIntervalParser(tz="Asia/Tokyo")
+    now = dt.datetime(2023, 8, 17, 23, 3, 17, tzinfo=dt.timezone(dt.timedelta(hours=2)))
+    end = dt.datetime(2023, 8, 18, 23, 59, 59, 999999)
+    assert ti.parse("today", now=now) == TimeInterval(dt.datetime(2023, 8, 18), end)
+    assert ti.parse("-1d", now=now) == TimeInterval(dt.datetime(2023, 8, 17, 6, 3, 17), end)
+    assert ti.parse("2024-08-20", now=now) == TimeInterval(dt.datetime(2024, 8, 20), end)
+    assert ti.parse("1st july", now=now) == TimeInterval(dt.datetime(2023, 7, 1), None)
@@ -0,0 +1,153 @@
+import dataclasses
+
+import pytest
+from freezegun import freeze_time
+
+from aika import TimeIntervalParser
+from aika.daterangeparser_german import grammar_german
+from aika.grammar import grammar_english
+from aika.router import classify
+from tests.conftest import TESTDRIVE_DATETIME
+
+CORPUS = [
+    "now",
+    "today",
+    "last week to next friday",
+    "tomorrow - next week",
+    "next month",
+    "december",
+    "July to December",
+    "jul 1 to jul 7",
+    "Sat - Tue",
+    "in March",
+    "2024-08-20",
+    "jetzt",
+    "heute",
+    "morgen - nächste woche",
+    "Juli-Dezember",
+    "von Samstag bis Dienstag",
+    "im März",
+    "20. August 2024",
+    "20.8.2024",
+    "1st july",
+    "March 2024",
+    "27th-29th June 2010",
+    "30 May to 9th Aug",
+    "3rd Jan 1980 -- 2nd Jan 2013",
+    "Wed 23 Jan -> Sat 16 February 2013",
+    "Tuesday 29 May - Sat 2 June 2012",
+    "From 1 to 9 Jul",
+    "14th July 1988",
+    "Jan 2011 - Mar 2014",
+    "07:00 Tue 7th June - 17th July 3:30pm",
+    "1. Juli",
+    "1. bis 7. Juli",
+    "März 2024",
+    "Vom 3. März bis zum 9. März 2024",
+    "2025W01",
+    "2025M02",
+    "2025-02",
+    "2025Q03",
+    "2025",
+    "2025-01-01..2025-02-01",
+    "-1d",
+    "-3d3h5m30s",
+    "-1 week",
+    "foo bar",
+]
+
+
+@pytest.mark.parametrize(
+    "when,shape",
+    [
+        ("", "empty"),
+        ("2025", "calendar"),
+        ("2025W01", "calendar"),
+        ("2025M02", "calendar"),
+        ("2025Q03", "calendar"),
+        ("2025-02", "calendar"),
+        ("2024-08-20", "iso"),
+        ("2024-08-20T10:00:00", "iso"),
+        ("2025-01-01..2025-02-01", "range"),
+        ("-3d3h5m30s", "delta"),
+        ("20.8.2024", "numeric"),
+        ("next friday", "text"),
+    ],
+)
+def test_classify(when, shape):
+    assert classify(when) == shape
+
+
+@pytest.mark.parametrize("when", ["2025", "2025W01", "2025-02", "2024-08-20", "now", "-1d", "next friday"])
+def test_route_skips_daterangeparser(ti, when):
+    route = ti.route(when)
+    assert [name for name in route.skipped_names if name != "calendar-notation"] == [
+        "DateRangeParser [en]",
+        "DateRangeParser [de]",
+    ]
+    assert route.names[-1] == "DUDP [all]"
+
+
+def test_route_keeps_daterangeparser(ti):
+    assert ti.route("1 jul 2024").names == [parser.name for parser in ti.parsers[1:]]
+    assert ti.route("1st july").skipped_names == ["calendar-notation", "DateRangeParser [de]"]
+    assert ti.route("1. Juli").skipped_names == ["calendar-notation", "DateRangeParser [en]"]
+
+
+@freeze_time(TESTDRIVE_DATETIME)
+@pytest.mark.parametrize("when", CORPUS)
+def test_route_same_result(when):
+    """
+    Routing must never change the result of the cascade.
+    """
+    routed = TimeIntervalParser()
+    cascade = TimeIntervalParser()
+    cascade.parsers = [dataclasses.replace(parser, accepts=None) for parser in cascade.parsers]
+    try:
+        expected = cascade.parse(when)
+    except ValueError:
+        with pytest.raises(ValueError):
+            routed.parse(when)
+    else:
+        assert routed.parse(when) == expected
+
+
+@pytest.mark.parametrize("when", CORPUS)
+def test_grammar_admissible(when):
+    """
+    The grammars must admit all expressions they can parse.
+    """
+    for grammar in grammar_english, grammar_german:
+        try:
+            grammar.parse(when)
+        except Exception:  # noqa: S112
+            continue
+        assert grammar.admissible(when)
+
+
+@pytest.mark.parametrize("when", ["2025", "2025W01", "2025M2", "2025-02", "2025Q03", "2024-08-20", "3999"])
+def test_route_calendar_notation_first(ti, when):
+    assert ti.route(when).names[0] == "calendar-notation"
+
+
+@pytest.mark.parametrize("when", ["", "now", "-1d", "1 jul 2024", "20.8.2024", "2025-01-01..2025-02-01"])
+def test_route_skips_calendar_notation(ti, when):
+    assert ti.route(when).skipped_names[0] == "calendar-notation"
+
+
+def test_route_pinned_order(ti):
+    ti.parser_order = {"calendar": ["DUDP [all]", "arbitrary-dateparser [en]"]}
+    assert ti.route("2025W01").names == [
+        "DUDP [all]",
+        "arbitrary-dateparser [en]",
+        "calendar-notation",
+        "arbitrary-dateparser [de]",
+    ]
+    assert ti.route("today").names == ["arbitrary-dateparser [de]", "arbitrary-dateparser [en]", "DUDP [all]"]
+    ti.parser_order = None
+    assert ti.route("2025W01").names == [
+        "calendar-notation",
+        "arbitrary-dateparser [de]",
+        "arbitrary-dateparser [en]",
+        "DUDP [all]",
+    ]
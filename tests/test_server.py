@@ -0,0 +1,196 @@
+import datetime as dt
+import http.client
+import json
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+
+import pytest
+
+from aika import TimeInterval, TimeIntervalParser
+from aika.server import Batcher, ParsingServer, ParsingService, RequestError
+
+NOW = "2023-08-17T23:03:17+02:00"
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = ParsingServer(("127.0.0.1", 0), service=ParsingService())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def request(server, path, body=None):
+    data = json.dumps(body).encode() if body is not None else None
+    try:
+        with urllib.request.urlopen(server.url + path, data=data, timeout=30) as response:  # noqa: S310
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as ex:
+        return ex.code, json.loads(ex.read())
+
+
+def test_server_parse(server):
+    status, response = request(server, "/parse?" + urllib.parse.urlencode({"q": "today", "now": NOW}))
+    assert status == 200
+    assert response == {
+        "input": "today",
+        "start": "2023-08-17T00:00:00",
+        "end": "2023-08-17T23:59:59.999999",
+        "error": None,
+    }
+
+
+def test_server_parse_failure(server):
+    status, response = request(server, "/parse?q=foobar")
+    assert status == 200
+    assert response["error"] == "Failed detecting start date: foobar"
+
+
+def test_server_batch(server):
+    status, response = request(server, "/batch", {"expressions": ["2025Q01", "foobar", "2025Q01"], "now": NOW})
+    assert status == 200
+    assert [(result["start"], result["end"], result["error"]) for result in response["results"]] == [
+        ("2025-01-01T00:00:00", "2025-03-31T23:59:59", None),
+        (None, None, "Failed detecting start date: foobar"),
+        ("2025-01-01T00:00:00", "2025-03-31T23:59:59", None),
+    ]
+
+
+def test_server_batch_ranges(server):
+    """
+    Ranges yield per-expression results, an invalid one does not fail the batch.
+    """
+    body = {"expressions": ["today", "2025-01-01..2025-02-01", "foo..bar"], "now": NOW}
+    status, response = request(server, "/batch", body)
+    assert status == 200
+    assert [(result["start"], result["end"], result["error"]) for result in response["results"]] == [
+        ("2023-08-17T00:00:00", "2023-08-17T23:59:59.999999", None),
+        ("2025-01-01T00:00:00", "2025-02-01T00:00:00", None),
+        (None, None, "Failed detecting start date: foo..bar"),
+    ]
+
+
+def test_server_languages(server):
+    query = urllib.parse.urlencode({"q": "1. Juli", "languages": "de", "tz": "UTC", "now": NOW})
+    status, response = request(server, "/parse?" + query)
+    assert status == 200
+    assert response["start"] == "2023-07-01T00:00:00"
+
+
+@pytest.mark.parametrize(
+    "path,body,status,error",
+    [
+        ("/parse", None, 400, "Missing parameter: q"),
+        ("/parse?q=today&now=foobar", None, 400, "Invalid ISO 8601 timestamp: foobar"),
+        ("/parse?q=today&tz=Foo/Bar", None, 400, "Invalid timezone: Foo/Bar"),
+        ("/batch", {"expressions": "today"}, 400, "Parameter `expressions` must be a list of strings"),
+        ("/parse?q=today&languages=en,xx", None, 400, "Invalid language: xx"),
+        (
+            "/batch",
+            {"expressions": [], "languages": [1]},
+            400,
+            "Parameter `languages` must be a list of strings",
+        ),
+        ("/batch", {"expressions": ["today"], "tz": 1}, 400, "Parameter `tz` must be a string"),
+        ("/foobar", None, 404, "Unknown endpoint: GET /foobar"),
+    ],
+)
+def test_server_errors(server, path, body, status, error):
+    assert request(server, path, body) == (status, {"error": error})
+
+
+def test_server_statistics(server):
+    request(server, "/parse?q=2024-08-20")
+    request(server, "/parse?q=2024-08-20")
+    status, response = request(server, "/stats")
+    assert status == 200
+    assert response["endpoints"]["GET /parse"]["attempts"] >= 2
+    assert set(response["endpoints"]["GET /parse"]["percentiles"]) == {"50", "90", "99"}
+    parsers = {(parser["tz"], str(parser["languages"])): parser for parser in response["parsers"]}
+    assert parsers["Europe/Berlin", "None"]["cache"]["hits"] >= 1
+    assert request(server, "/health") == (200, {"status": "ok"})
+
+
+def test_batcher_combines_concurrent_requests():
+    now = dt.datetime.fromisoformat(NOW)
+    batcher = Batcher(TimeIntervalParser(), delay=0.5)
+    try:
+        futures = [batcher.submit([when], now=now) for when in ["today", "foobar", "today"]]
+        results = [future.result(timeout=30) for future in futures]
+    finally:
+        batcher.close()
+    assert [result.ok for [result] in results] == [True, False, True]
+    assert results[0][0].value == TimeInterval(dt.datetime(2023, 8, 17), dt.datetime(2023, 8, 17, 23, 59, 59, 999999))
+    assert (batcher.batches, batcher.jobs) == (1, 3)
+
+
+def test_batcher_size():
+    batcher = Batcher(TimeIntervalParser(), size=2, delay=0.5)
+    try:
+        futures = [batcher.submit(["2025", "2024"]) for _ in range(3)]
+        for future in futures:
+            future.result(timeout=30)
+    finally:
+        batcher.close()
+    assert (batcher.batches, batcher.jobs) == (3, 3)
+
+
+def test_server_negative_content_length(server):
+    connection = http.client.HTTPConnection(*server.server_address[:2], timeout=30)
+    try:
+        connection.putrequest("POST", "/batch")
+        connection.putheader("Content-Length", "-1")
+        connection.endheaders()
+        response = connection.getresponse()
+        assert (response.status, json.loads(response.read())) == (400, {"error": "Invalid Content-Length"})
+    finally:
+        connection.close()
+
+
+def test_service_rejects_invalid_configurations():
+    service = ParsingService(max_parsers=1)
+    try:
+        for tz, languages in [("Foo/Bar", None), ("UTC", ["xx"])]:
+            with pytest.raises(RequestError):
+                service.batcher(tz, languages)
+        assert service.batchers == {}
+        assert service.batcher("UTC", ["en"]) is service.batcher("UTC", ("en",))
+    finally:
+        service.close()
+
+
+def test_service_warmup_does_not_block(monkeypatch):
+    """
+    While the parser of one configuration warms up, other configurations are served.
+    """
+    release = threading.Event()
+
+    class SlowParser(TimeIntervalParser):
+        def parse_many(self, expressions, **kwargs):
+            if self.tz == "UTC":
+                release.wait(timeout=30)
+            return super().parse_many(expressions, **kwargs)
+
+    monkeypatch.setattr("aika.server.TimeIntervalParser", SlowParser)
+    service = ParsingService()
+    try:
+        slow = threading.Thread(target=service.batcher, args=("UTC",))
+        slow.start()
+        waiting = threading.Thread(target=service.batcher, args=("UTC",))
+        waiting.start()
+        assert service.batcher("Europe/Berlin").parser.tz == "Europe/Berlin"
+        assert slow.is_alive()
+        assert waiting.is_alive()
+        release.set()
+        slow.join(timeout=30)
+        waiting.join(timeout=30)
+        assert service.batcher("UTC").parser.tz == "UTC"
+        assert len(service.batchers) == 2
+    finally:
+        release.set()
+        service.close()